@@ -5,18 +5,33 @@ This package contains:
 - detector.py: Clarification detection (flags propositions)
 - question_*: Question generation system (generates clarifying questions)
 
-This __init__.py is minimal to avoid import dependency issues.
+This __init__.py is minimal to avoid import dependency issues: the detector
+is only imported when one of its names is first accessed (PEP 562), so
+question engine modules can be imported without pulling in the detector's
+database dependencies.
 """
 
-# Only import detector-related stuff to avoid circular imports
-# Question engine modules can be imported directly
-try:
-    from .detector import ClarificationDetector
-    from .prompts import CLARIFICATION_ANALYSIS_PROMPT
-    __all__ = [
-        "ClarificationDetector",
-        "CLARIFICATION_ANALYSIS_PROMPT",
-    ]
-except ImportError:
-    # If detector dependencies aren't available, just make question modules importable
-    __all__ = []
+import importlib
+
+_LAZY_IMPORTS = {
+    "ClarificationDetector": ".detector",
+    "CLARIFICATION_ANALYSIS_PROMPT": ".prompts",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __package__)
+    value = getattr(module, name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,84 +4,72 @@ Clean import path for clarification question engine modules.
 This module allows importing question engine modules without triggering
 parent gum package dependencies (sklearn, mss, etc.).
 
+Symbols are loaded lazily (PEP 562): importing this module is free, and each
+submodule is only imported the first time one of its names is accessed.
+
 Usage:
     from gum.clarification._imports import QuestionGenerator, QuestionValidator
     # OR
     from gum.clarification import question_config, question_validator
 """
 
-# Re-export question engine modules for easier importing
-# These can be imported without triggering gum.__init__.py issues
-try:
-    from .question_config import (
-        get_method_for_factor,
-        get_factor_name,
-        get_factor_description,
-        get_factor_id_from_name,
-        FACTOR_METHOD_MAP,
-        FACTOR_NAMES,
-        FACTOR_DESCRIPTIONS,
-    )
-    
-    from .question_validator import (
-        QuestionValidator,
-        validate_question_batch,
-    )
-    
-    from .question_prompts import (
-        get_few_shot_examples,
-        build_few_shot_prompt,
-        build_controlled_qg_prompt,
-        normalize_proposition_for_prompt,
-    )
-    
-    from .question_loader import (
-        load_flagged_propositions,
-        filter_propositions,
-        get_proposition_factor_pairs,
-    )
-    
-    from .question_generator import (
-        QuestionGenerator,
-        BatchQuestionGenerator,
-    )
-    
-    from .question_engine import (
-        ClarifyingQuestionEngine,
-        run_engine_simple,
-    )
-    
-    __all__ = [
-        # Config
-        "get_method_for_factor",
-        "get_factor_name",
-        "get_factor_description",
-        "get_factor_id_from_name",
-        "FACTOR_METHOD_MAP",
-        "FACTOR_NAMES",
-        "FACTOR_DESCRIPTIONS",
-        # Validator
-        "QuestionValidator",
-        "validate_question_batch",
-        # Prompts
-        "get_few_shot_examples",
-        "build_few_shot_prompt",
-        "build_controlled_qg_prompt",
-        "normalize_proposition_for_prompt",
-        # Loader
-        "load_flagged_propositions",
-        "filter_propositions",
-        "get_proposition_factor_pairs",
-        # Generator
-        "QuestionGenerator",
-        "BatchQuestionGenerator",
-        # Engine
-        "ClarifyingQuestionEngine",
-        "run_engine_simple",
-    ]
-except ImportError as e:
-    # If imports fail, still make module available
-    __all__ = []
-    import warnings
-    warnings.warn(f"Some question engine imports failed: {e}", ImportWarning)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    # Config
+    "get_method_for_factor": ".question_config",
+    "get_factor_name": ".question_config",
+    "get_factor_description": ".question_config",
+    "get_factor_id_from_name": ".question_config",
+    "get_factor_info": ".question_config",
+    "FactorInfo": ".question_config",
+    "FACTOR_TABLE": ".question_config",
+    "FACTOR_METHOD_MAP": ".question_config",
+    "FACTOR_NAMES": ".question_config",
+    "FACTOR_DESCRIPTIONS": ".question_config",
+    # Validator
+    "QuestionValidator": ".question_validator",
+    "validate_question_batch": ".question_validator",
+    # Prompts
+    "get_few_shot_examples": ".question_prompts",
+    "build_few_shot_prompt": ".question_prompts",
+    "build_controlled_qg_prompt": ".question_prompts",
+    "normalize_proposition_for_prompt": ".question_prompts",
+    "set_user_names": ".question_prompts",
+    "normalize_observations": ".question_prompts",
+    # Loader
+    "load_flagged_propositions": ".question_loader",
+    "filter_propositions": ".question_loader",
+    "get_proposition_factor_pairs": ".question_loader",
+    "iter_flagged_propositions": ".question_loader",
+    "iter_proposition_factor_pairs": ".question_loader",
+    # Generator
+    "QuestionGenerator": ".question_generator",
+    "BatchQuestionGenerator": ".question_generator",
+    "build_async_openai": ".question_generator",
+    # Cache
+    "QuestionResultCache": ".question_cache",
+    "LRUResponseCache": ".question_cache",
+    # Engine
+    "ClarifyingQuestionEngine": ".question_engine",
+    "run_engine_simple": ".question_engine",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __package__)
+    value = getattr(module, name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(list(globals()) + __all__)
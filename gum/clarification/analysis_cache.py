@@ -0,0 +1,189 @@
+"""
+SemanticAnalysisCache - Reuse prior LLM analyses for repeated propositions.
+
+The clarification detector spends almost all of its time waiting on the LLM.
+By default this cache returns a stored LLM response when the proposition text
+matches a prior one exactly after whitespace/case normalization.
+
+Semantic matching is opt-in: given an embedding function (or
+``use_embeddings=True`` with ``sentence-transformers`` installed), a lookup
+returns the stored response of the most similar prior proposition if its
+cosine similarity is above a threshold. Small wording changes can flip a
+proposition's meaning ("always" vs "never"), so keep the threshold high.
+
+Entries are partitioned by ``(model, prompt_version, context_key)`` so a
+prompt or model change never serves stale analyses, and a response is only
+reused for the same context (e.g. the same cited observations).
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_MAX_ENTRIES = 2048
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial edits share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+class SemanticAnalysisCache:
+    """
+    LRU cache of LLM clarification responses keyed by proposition embedding.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a cache hit
+        max_entries (int): Maximum entries kept per partition
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that fell through to the LLM
+    """
+
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], np.ndarray]] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        use_embeddings: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Function mapping text to a 1-D embedding vector. Enables
+                semantic matching; without it lookups match normalized text
+                exactly.
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum entries per partition before LRU eviction
+            use_embeddings: Load a local sentence-transformers model as
+                ``embed`` when none is given (ignored if it isn't installed)
+        """
+        if embed is None and use_embeddings and HAS_SENTENCE_TRANSFORMERS:
+            model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+            embed = model.encode
+
+        self._embed = embed
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+
+        # partition -> OrderedDict[key -> (unit vector or None, llm_response)]
+        self._partitions: Dict[Tuple[str, str, str], "OrderedDict[str, Tuple[Optional[np.ndarray], Dict[str, Any]]]"] = {}
+
+    @property
+    def semantic(self) -> bool:
+        """Whether lookups use embeddings (True) or exact normalized text (False)."""
+        return self._embed is not None
+
+    def key_for(self, text: str) -> str:
+        """Return the exact-match key for a piece of proposition text."""
+        return hashlib.sha1(_normalize_text(text).encode("utf-8")).hexdigest()
+
+    def vector_for(self, text: str) -> Optional[np.ndarray]:
+        """Return the unit-normalized embedding of ``text``, or None without an embedder."""
+        if self._embed is None:
+            return None
+        vector = np.asarray(self._embed(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(
+        self,
+        text: str,
+        model: str,
+        prompt_version: str,
+        vector: Optional[np.ndarray] = None,
+        context_key: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached LLM response for ``text``.
+
+        Args:
+            text: Proposition text (plus any context folded into the key)
+            model: LLM model the response must have come from
+            prompt_version: Prompt version the response must have come from
+            vector: Precomputed embedding from ``vector_for`` (optional)
+            context_key: Anything else the response depends on; only entries
+                stored with the same key can match
+
+        Returns:
+            The cached LLM response dict, or None on a miss
+        """
+        entries = self._partitions.get((model, prompt_version, context_key))
+        if not entries:
+            self.misses += 1
+            return None
+
+        key = self.key_for(text)
+        if key not in entries and self.semantic:
+            if vector is None:
+                vector = self.vector_for(text)
+            keys = list(entries)
+            matrix = np.stack([entries[k][0] for k in keys])
+            similarities = matrix @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                key = keys[best]
+
+        if key not in entries:
+            self.misses += 1
+            return None
+
+        entries.move_to_end(key)
+        self.hits += 1
+        return entries[key][1]
+
+    def put(
+        self,
+        text: str,
+        model: str,
+        prompt_version: str,
+        llm_response: Dict[str, Any],
+        vector: Optional[np.ndarray] = None,
+        context_key: str = "",
+    ) -> None:
+        """
+        Store an LLM response, evicting the least recently used entry if full.
+
+        Args:
+            text: Proposition text (plus any context folded into the key)
+            model: LLM model that produced the response
+            prompt_version: Prompt version that produced the response
+            llm_response: Parsed LLM response to cache
+            vector: Precomputed embedding from ``vector_for`` (optional)
+            context_key: Same as for ``get``
+        """
+        if vector is None:
+            vector = self.vector_for(text)
+
+        entries = self._partitions.setdefault((model, prompt_version, context_key), OrderedDict())
+        key = self.key_for(text)
+        entries[key] = (vector, llm_response)
+        entries.move_to_end(key)
+
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset hit/miss counters."""
+        self._partitions.clear()
+        self.hits = 0
+        self.misses = 0
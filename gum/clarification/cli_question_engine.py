@@ -6,7 +6,10 @@ Usage:
         --source=file \
         --output=test_results_200_props/clarifying_questions.jsonl \
         --prop-ids=77,200,421 \
-        --factor-ids=3,6
+        --factor-ids=3,6 \
+        --concurrency=16 \
+        --batch-size=8 \
+        --cache=test_results_200_props/question_cache.sqlite
 """
 
 import argparse
@@ -16,13 +19,16 @@ import os
 import sys
 from pathlib import Path
 
-from openai import AsyncOpenAI
-
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from gum.config import Config
-from gum.clarification.question_engine import ClarifyingQuestionEngine
+from gum.clarification.question_engine import (
+    ClarifyingQuestionEngine,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY
+)
+from gum.clarification.question_generator import build_async_openai
 
 
 def setup_logging(verbose: bool = False):
@@ -95,6 +101,27 @@ def parse_args():
         help='Model to use (default: gpt-4)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Max (proposition, factor) pairs generated at once (default: {DEFAULT_CONCURRENCY})'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'Same-factor pairs generated per LLM call (default: {DEFAULT_BATCH_SIZE})'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        type=str,
+        default=None,
+        help='SQLite file caching generated questions across runs (default: no cache)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -125,8 +152,8 @@ async def main():
     prop_ids = None
     if args.prop_ids:
         try:
-            prop_ids = [int(x.strip()) for x in args.prop_ids.split(',')]
-            logger.info(f"Filtering by prop IDs: {prop_ids}")
+            prop_ids = frozenset(int(x.strip()) for x in args.prop_ids.split(','))
+            logger.info(f"Filtering by prop IDs: {sorted(prop_ids)}")
         except ValueError as e:
             logger.error(f"Invalid prop IDs format: {e}")
             sys.exit(1)
@@ -135,8 +162,8 @@ async def main():
     factor_ids = None
     if args.factor_ids:
         try:
-            factor_ids = [int(x.strip()) for x in args.factor_ids.split(',')]
-            logger.info(f"Filtering by factor IDs: {factor_ids}")
+            factor_ids = frozenset(int(x.strip()) for x in args.factor_ids.split(','))
+            logger.info(f"Filtering by factor IDs: {sorted(factor_ids)}")
         except ValueError as e:
             logger.error(f"Invalid factor IDs format: {e}")
             sys.exit(1)
@@ -146,7 +173,7 @@ async def main():
     config.model = args.model
     
     # Create OpenAI client
-    client = AsyncOpenAI(api_key=api_key)
+    client = build_async_openai(api_key=api_key)
     
     # Create engine
     engine = ClarifyingQuestionEngine(
@@ -154,13 +181,18 @@ async def main():
         config=config,
         input_source=args.source,
         input_file_path=args.input_file,
-        output_path=args.output
+        output_path=args.output,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        cache_path=args.cache
     )
     
     # Run pipeline
     logger.info("Starting pipeline...")
     logger.info(f"  Source: {args.source}")
     logger.info(f"  Output: {args.output}")
+    logger.info(f"  Concurrency: {args.concurrency}")
+    logger.info(f"  Batch size: {args.batch_size}")
     
     try:
         summary = await engine.run(
@@ -179,13 +211,13 @@ async def main():
         logger.info(f"  - Generation errors: {summary['generation_errors']}")
         logger.info(f"Elapsed time: {summary['elapsed_seconds']:.2f}s")
         logger.info(f"Output file: {summary['output_file']}")
+        logger.info(f"Proposition text: {summary['propositions_file']}")
         
         if summary['failures']:
-            logger.info(f"\nFailures ({len(summary['failures'])}):")
-            for failure in summary['failures'][:10]:  # Show first 10
+            logger.info(f"\nRecent failures ({len(summary['failures'])}):")
+            for failure in summary['failures'][-10:]:  # Show last 10
                 logger.info(f"  - Prop {failure['prop_id']}, Factor {failure['factor']}: {failure['error'][:100]}")
-            if len(summary['failures']) > 10:
-                logger.info(f"  ... and {len(summary['failures']) - 10} more")
+            logger.info(f"All failures: {summary['failures_file']}")
         
         sys.exit(0 if summary['failed'] == 0 else 1)
         
@@ -6,21 +6,186 @@ This module implements the core logic for detecting when propositions should
 be flagged for clarifying dialogue through Gates.
 """
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Timeout
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+try:
+    import h2  # noqa: F401  (lets httpx negotiate HTTP/2)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from ..models import Proposition, Observation
-from ..db_utils import get_related_observations
-from ..clarification_models import ClarificationAnalysis
-from .prompts import CLARIFICATION_ANALYSIS_PROMPT, PROMPT_VERSION
+from ..config import ClarificationConfig
+from ..models import Proposition
+from ..db_utils import get_related_observation_summaries
+from ..clarification_models import ClarificationAnalysis, FACTOR_SCORE_NAMES
+from .prompts import (
+    CLARIFICATION_SYSTEM_PROMPT,
+    PROMPT_VERSION,
+    render_clarification_context,
+)
+from .analysis_cache import SemanticAnalysisCache
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeout for detector LLM calls. Analyses are short, so a stuck
+# request fails fast; the shared client keeps the SDK's default for other calls
+DETECTOR_REQUEST_TIMEOUT = Timeout(60.0, connect=5.0)
+
+# First capitalized word (3+ chars) within the first 5 words, optional last name
+_USER_NAME_RE = re.compile(r"\s*(?:\S+\s+){0,4}?([A-Z]\S{2,})(?:\s+([A-Z]\S*))?")
+
+# Lowercase word tokens; propositions are tokenized once per analysis
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Absolutist language for Factor 7 (whole words)
+_ABSOLUTIST_WORDS = frozenset({
+    "always", "never", "all", "none", "invariably",
+    "every", "everyone", "everybody", "everything", "everywhere", "everyday",
+})
+
+# Word vocabularies for the rule-based pre-filter, keyed by factor id. A
+# proposition with none of these cues, short text and high GUM confidence is
+# very unlikely to need clarification, so it skips the LLM call.
+_PREFILTER_VOCABULARIES = {
+    # Factor 1: trait adjectives / identity labels
+    1: frozenset({
+        "careless", "methodical", "lazy", "proactive", "perfectionist",
+        "procrastinator", "procrastinates", "procrastinating", "procrastination",
+        "organized", "disorganized", "leader", "introvert", "introverted",
+        "extrovert", "extroverted", "ambitious", "anxious", "meticulous", "impulsive",
+    }),
+    # Factor 4: negative evaluation
+    4: frozenset({
+        "struggle", "struggles", "struggled", "struggling",
+        "fail", "fails", "failed", "failing", "failure",
+        "poor", "poorly", "bad", "weak",
+        "avoid", "avoids", "avoided", "avoiding", "avoidance",
+        "neglect", "neglects", "neglected", "neglecting",
+        "lack", "lacks", "lacked", "lacking",
+        "inefficient", "distracted", "unproductive", "sloppy", "careless",
+    }),
+    # Factor 7: absolutist language
+    7: _ABSOLUTIST_WORDS,
+    # Factor 8: sensitive / intimate domains
+    8: frozenset({
+        "health", "medical", "therapy", "therapist", "mental",
+        "religion", "religious", "political", "politics", "sexual", "sexuality",
+        "dating", "relationship", "relationships",
+        "finance", "finances", "financial", "financially", "salary", "debt",
+        "pregnant", "pregnancy", "diagnosis", "diagnosed", "medication", "illness",
+    }),
+    # Factor 12: certainty boosters
+    12: frozenset({
+        "clearly", "definitely", "obviously", "certainly", "undoubtedly", "surely",
+    }),
+}
+
+# Union of all pre-filter vocabularies, so the common case is one intersection
+_PREFILTER_WORDS = frozenset().union(*_PREFILTER_VOCABULARIES.values())
+
+# Cues that are not single words: identity phrases (Factor 1) and
+# over-specific details such as times, dates and counts (Factor 2)
+_PREFILTER_PATTERN = re.compile(r"\d|\b(?:type|kind) of person\b", re.IGNORECASE)
+
+# Longer propositions carry more room for ambiguity; always send them to the LLM
+PREFILTER_MAX_CHARS = 160
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Size caps for each factor's evidence_log entry (the full response is still
+# kept in llm_raw_output)
+MAX_EVIDENCE_ITEMS = 5
+MAX_EVIDENCE_CHARS = 256
+MAX_REASONING_CHARS = 512
+
+# Observation content is truncated to this many characters in the prompt
+OBSERVATION_PREVIEW_CHARS = 200
+
+# model_used value recorded for analyses produced by the pre-filter
+PREFILTER_MODEL_NAME = "rule-prefilter"
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _compact_factor(factor: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a factor's evidence_log entry with evidence and reasoning capped in size."""
+    evidence = [
+        e[:MAX_EVIDENCE_CHARS] if isinstance(e, str) else e
+        for e in (factor.get("evidence") or [])[:MAX_EVIDENCE_ITEMS]
+    ]
+    # `or` also covers keys the LLM sent as null
+    return {
+        "evidence": evidence,
+        "reasoning": (factor.get("reasoning") or "")[:MAX_REASONING_CHARS],
+        "observation_ids": factor.get("observation_ids_cited") or []
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset:
+    """Lowercase word tokens of ``text`` (memoized; shared by pre-filter and validation)."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_observation_tuples(observations: Tuple[Tuple[int, str, str], ...]) -> str:
+    """Render ``(id, observer_name, content)`` tuples as the prompt's observation block."""
+    if not observations:
+        return "No observations available."
+    
+    # Content arrives cut to PREVIEW + 1 chars, so anything longer was truncated
+    return "\n".join(
+        f"[{i}] (ID: {obs_id}) {observer_name}: "
+        + (content[:OBSERVATION_PREVIEW_CHARS] + "..."
+           if len(content) > OBSERVATION_PREVIEW_CHARS else content)
+        for i, (obs_id, observer_name, content) in enumerate(observations, 1)
+    )
+
+
+def create_openai_client(
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None
+) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client backed by a pooled, keep-alive HTTP client.
+    
+    Build one client and share it across detector calls (gum keeps one per
+    instance); a client per call pays a new TCP+TLS handshake every time.
+    When ``h2`` is installed, HTTP/2 lets concurrent ``analyze_batch``
+    requests multiplex over a single connection.
+    
+    The client keeps the SDK's default timeout, since gum also uses it for
+    long propose/revise/audit completions; detector requests set
+    DETECTOR_REQUEST_TIMEOUT themselves.
+    
+    Args:
+        api_key: OpenAI API key (defaults to the environment)
+        base_url: Optional API base URL for OpenAI-compatible servers
+        
+    Returns:
+        Configured AsyncOpenAI client
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=DefaultAsyncHttpxClient(http2=HAS_H2)
+    )
+
 
 class ClarificationDetector:
     """
@@ -37,32 +202,38 @@ class ClarificationDetector:
         client (AsyncOpenAI): OpenAI client for LLM calls
         config: Configuration object with model, temperature, etc.
         prompt_version (str): Version of the detection prompt being used
+        cache (SemanticAnalysisCache): Optional cache of prior LLM responses
     """
     
-    def __init__(self, openai_client: AsyncOpenAI, config):
+    def __init__(
+        self,
+        openai_client: AsyncOpenAI,
+        config,
+        cache: Optional[SemanticAnalysisCache] = None
+    ):
         """
         Initialize the detector.
         
         Args:
-            openai_client: Async OpenAI client for making LLM calls
+            openai_client: Async OpenAI client for making LLM calls. Pass a
+                long-lived client (see ``create_openai_client``) so connections
+                are reused across calls
             config: Configuration object (should have clarification settings)
+            cache: Analysis cache shared across analyses; when set, a proposition
+                seen before with the same observations reuses the prior LLM
+                response instead of calling the model
         """
         self.client = openai_client
         self.config = config
         self.prompt_version = PROMPT_VERSION
+        self.cache = cache
         
         # Get clarification-specific config if available
         if hasattr(config, 'clarification'):
             self.clarification_config = config.clarification
         else:
             # Use defaults
-            from dataclasses import dataclass
-            @dataclass
-            class DefaultConfig:
-                model: str = "gpt-4-turbo"
-                temperature: float = 0.1
-                threshold: float = 0.6
-            self.clarification_config = DefaultConfig()
+            self.clarification_config = ClarificationConfig()
     
     async def analyze(
         self, 
@@ -85,18 +256,8 @@ class ClarificationDetector:
             # 1. Build context from proposition + observations
             context = await self._build_context(proposition, session)
             
-            # 2. Call LLM
-            llm_response = await self._call_llm(context)
-            
-            # 3. Validate response
-            validation_result = self._validate_response(llm_response, context)
-            
-            # 4. Create analysis record
-            analysis = self._create_analysis(
-                proposition.id,
-                llm_response,
-                validation_result
-            )
+            # 2-4. Call LLM (or cache), validate, create analysis record
+            analysis = await self._analyze_context(proposition, context)
             
             # 5. Persist to database
             session.add(analysis)
@@ -115,6 +276,322 @@ class ClarificationDetector:
             # Create a failed analysis record
             return self._create_error_analysis(proposition.id, str(e))
     
+    async def analyze_batch(
+        self,
+        propositions: List[Proposition],
+        session: AsyncSession,
+        concurrency: int = 8
+    ) -> List[ClarificationAnalysis]:
+        """
+        Analyze many propositions, overlapping their LLM calls.
+        
+        Contexts are built sequentially (an AsyncSession cannot run concurrent
+        queries), then up to ``concurrency`` LLM calls run at once. Successful
+        analyses are added with one ``add_all`` and a single flush at the end.
+        
+        Args:
+            propositions: The propositions to analyze
+            session: Database session for loading observations and persisting results
+            concurrency: Maximum number of in-flight LLM calls
+            
+        Returns:
+            One ClarificationAnalysis per proposition, in input order. Failed
+            analyses are returned as error records and are not persisted.
+        """
+        logger.info(f"Analyzing batch of {len(propositions)} propositions (concurrency={concurrency})")
+        
+        contexts = []
+        for proposition in propositions:
+            try:
+                contexts.append(await self._build_context(proposition, session))
+            except Exception as e:
+                contexts.append(e)
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run(proposition: Proposition, context) -> ClarificationAnalysis:
+            if isinstance(context, Exception):
+                raise context
+            async with semaphore:
+                return await self._analyze_context(proposition, context)
+        
+        outcomes = await asyncio.gather(
+            *(run(prop, ctx) for prop, ctx in zip(propositions, contexts)),
+            return_exceptions=True
+        )
+        
+        analyses = []
+        valid_analyses = []
+        for proposition, outcome in zip(propositions, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error analyzing proposition {proposition.id}: {outcome}")
+                analyses.append(self._create_error_analysis(proposition.id, str(outcome)))
+                continue
+            
+            analyses.append(outcome)
+            valid_analyses.append(outcome)
+        
+        # One flush for the whole batch so the INSERTs are emitted together
+        if valid_analyses:
+            session.add_all(valid_analyses)
+            await session.flush()
+        
+        return analyses
+    
+    async def submit_batch(
+        self,
+        propositions: List[Proposition],
+        session: AsyncSession
+    ) -> str:
+        """
+        Submit propositions for offline analysis through the OpenAI Batch API.
+        
+        The Batch API is billed at roughly half the per-token price and has its
+        own rate-limit pool, at the cost of a completion window of up to 24h.
+        Use ``ingest_batch`` to collect the results.
+        
+        Args:
+            propositions: The propositions to analyze
+            session: Database session for loading observations
+            
+        Returns:
+            The OpenAI batch ID
+        """
+        lines = []
+        for proposition in propositions:
+            context = await self._build_context(proposition, session)
+            lines.append(json.dumps({
+                "custom_id": str(proposition.id),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._build_request(context)
+            }))
+        
+        batch_input = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = await self.client.files.create(
+            file=("clarification_batch.jsonl", batch_input),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+            metadata={"prompt_version": self.prompt_version}
+        )
+        
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} propositions")
+        return batch.id
+    
+    async def ingest_batch(
+        self,
+        batch_id: str,
+        session: AsyncSession,
+        poll_interval: float = 60.0
+    ) -> List[ClarificationAnalysis]:
+        """
+        Wait for a submitted batch to finish and persist its analyses.
+        
+        Each response line goes through the same validation and record creation
+        as ``analyze``. Lines that errored become error analyses, which (as in
+        ``analyze``) are returned but not persisted.
+        
+        Args:
+            batch_id: ID returned by ``submit_batch``
+            session: Database session for loading observations and persisting results
+            poll_interval: Seconds to wait between status checks
+            
+        Returns:
+            One ClarificationAnalysis per response line
+            
+        Raises:
+            RuntimeError: If the batch ends in a state other than "completed"
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            logger.debug(f"Batch {batch_id} status: {batch.status}")
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch_id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status!r}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        
+        analyses = []
+        valid_analyses = []
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            
+            result = _json_loads(line)
+            proposition_id = int(result["custom_id"])
+            
+            try:
+                if result.get("error"):
+                    raise RuntimeError(result["error"].get("message", result["error"]))
+                
+                body = result["response"]["body"]
+                llm_response = _json_loads(body["choices"][0]["message"]["content"])
+                
+                proposition = await session.get(Proposition, proposition_id)
+                if proposition is None:
+                    raise LookupError(f"Proposition {proposition_id} no longer exists")
+                context = await self._build_context(proposition, session)
+                
+                validation_result = self._validate_response(llm_response, context)
+                analysis = self._create_analysis(
+                    proposition_id,
+                    llm_response,
+                    validation_result
+                )
+                
+                analyses.append(analysis)
+                valid_analyses.append(analysis)
+                
+            except Exception as e:
+                logger.error(f"Error ingesting batch result for proposition {proposition_id}: {e}")
+                analyses.append(self._create_error_analysis(proposition_id, str(e)))
+        
+        # One flush for the whole batch so the INSERTs are emitted together
+        if valid_analyses:
+            session.add_all(valid_analyses)
+            await session.flush()
+        
+        logger.info(f"Ingested {len(analyses)} results from batch {batch_id}")
+        return analyses
+    
+    async def _analyze_context(
+        self,
+        proposition: Proposition,
+        context: Dict[str, Any]
+    ) -> ClarificationAnalysis:
+        """
+        Run the LLM part of the pipeline for an already-built context.
+        
+        Does not touch the database session, so it is safe to run concurrently.
+        
+        Args:
+            proposition: The proposition being analyzed
+            context: Context built by ``_build_context``
+            
+        Returns:
+            ClarificationAnalysis instance ready to be persisted
+        """
+        # Easy negatives skip the LLM entirely
+        if self._should_skip_llm(context):
+            logger.info(f"Pre-filter bypassed LLM for prop {proposition.id}: no clarification cues")
+            return self._create_prefilter_analysis(proposition.id)
+        
+        # Reuse a cached response for the same proposition and observations,
+        # else call LLM
+        cascade = self._cascade_models()
+        cache_model_key = "+".join(cascade)
+        cache_text = self._cache_text(context)
+        cache_context_key = self._cache_context_key(context)
+        vector = None
+        cached = None
+        if self.cache is not None:
+            if self.cache.semantic:
+                # Embedding is CPU-bound; keep it off the event loop
+                vector = await asyncio.to_thread(self.cache.vector_for, cache_text)
+            cached = self.cache.get(
+                cache_text,
+                cache_model_key,
+                self.prompt_version,
+                vector=vector,
+                context_key=cache_context_key
+            )
+        
+        if cached is not None:
+            logger.debug(f"Semantic cache hit for prop {proposition.id}")
+            model_used = cached["model_used"]
+            llm_response = cached["llm_response"]
+            validation_result = self._validate_response(llm_response, context)
+        else:
+            model_used, llm_response, validation_result = await self._run_cascade(
+                proposition, context, cascade
+            )
+            
+            # Only cache responses that passed validation
+            if self.cache is not None and validation_result["passed"]:
+                self.cache.put(
+                    cache_text,
+                    cache_model_key,
+                    self.prompt_version,
+                    {"model_used": model_used, "llm_response": llm_response},
+                    vector=vector,
+                    context_key=cache_context_key
+                )
+        
+        # Create analysis record
+        return self._create_analysis(
+            proposition.id,
+            llm_response,
+            validation_result,
+            model=model_used
+        )
+    
+    def _cascade_models(self) -> List[str]:
+        """Models to try in order: cheap cascade models first, then ``model``."""
+        final_model = self.clarification_config.model
+        cascade = getattr(self.clarification_config, "cascade_models", None) or []
+        return [m for m in cascade if m != final_model] + [final_model]
+    
+    async def _run_cascade(
+        self,
+        proposition: Proposition,
+        context: Dict[str, Any],
+        models: List[str]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """
+        Call models cheapest-first, escalating only on uncertain results.
+        
+        A cheaper model's answer is accepted when it passes validation with
+        non-low evidence quality and its clarification score falls outside
+        ``cascade_ambiguity_band``. Otherwise (or if the call fails) the next
+        model is tried; the last model's answer is always accepted.
+        
+        Args:
+            proposition: The proposition being analyzed
+            context: Context built by ``_build_context``
+            models: Models to try, in order
+            
+        Returns:
+            Tuple of (model used, parsed LLM response, validation result)
+        """
+        low, high = getattr(self.clarification_config, "cascade_ambiguity_band", (0.4, 0.7))
+        
+        for i, model in enumerate(models):
+            is_last = i == len(models) - 1
+            
+            try:
+                llm_response = await self._call_llm(context, model=model)
+            except Exception as e:
+                if is_last:
+                    raise
+                logger.warning(f"Cascade model {model} failed for prop {proposition.id}, escalating: {e}")
+                continue
+            
+            validation_result = self._validate_response(llm_response, context)
+            if is_last:
+                break
+            
+            score = llm_response.get("aggregate", {}).get("clarification_score", 0.0)
+            confident = (
+                validation_result["passed"]
+                and validation_result["evidence_quality"] != "low"
+                and not (low <= score <= high)
+            )
+            if confident:
+                break
+            
+            logger.debug(
+                f"Cascade model {model} uncertain for prop {proposition.id} "
+                f"(score={score:.2f}), escalating"
+            )
+        
+        return model, llm_response, validation_result
+    
     async def _build_context(
         self, 
         proposition: Proposition, 
@@ -130,8 +607,11 @@ class ClarificationDetector:
         Returns:
             Dictionary with all context fields for the prompt
         """
-        # Load related observations (increased from default 5 to 20 for better context)
-        observations = await get_related_observations(session, proposition.id, limit=20)
+        # Load related observations (increased from default 5 to 20 for better context).
+        # Only id/observer_name/truncated content are used, so fetch just those.
+        observations = await get_related_observation_summaries(
+            session, proposition.id, limit=20, max_chars=OBSERVATION_PREVIEW_CHARS
+        )
         
         # Extract user name from proposition text
         user_name = self._extract_user_name(proposition.text)
@@ -150,68 +630,170 @@ class ClarificationDetector:
         
         return context
     
-    def _extract_user_name(self, text: str) -> str:
-        """Extract user name from proposition text."""
-        # Simple heuristic: look for first capitalized name
-        words = text.split()
-        for i, word in enumerate(words[:5]):  # Check first 5 words
-            if word[0].isupper() and len(word) > 2:
-                # Check if next word is also capitalized (last name)
-                if i + 1 < len(words) and words[i+1][0].isupper():
-                    return f"{word} {words[i+1]}"
-                return word
-        return "the user"
+    def _should_skip_llm(self, context: Dict[str, Any]) -> bool:
+        """
+        Rule-based pre-filter: decide whether the LLM call can be skipped.
+        
+        Skips only when the pre-filter is enabled, GUM confidence is at least
+        ``prefilter_min_confidence``, the text is short, and none of the cheap
+        cues for Factors 1, 2, 4, 7, 8 and 12 match.
+        
+        Args:
+            context: Context built by ``_build_context``
+            
+        Returns:
+            True if the proposition can be scored as not needing clarification
+        """
+        if not getattr(self.clarification_config, "prefilter_enabled", True):
+            return False
+        
+        min_confidence = getattr(self.clarification_config, "prefilter_min_confidence", 8)
+        if context["confidence"] < min_confidence:
+            return False
+        
+        text = context["proposition_text"]
+        if len(text) > PREFILTER_MAX_CHARS:
+            return False
+        
+        if _PREFILTER_WORDS & _tokenize(text):
+            return False
+        
+        return _PREFILTER_PATTERN.search(text) is None
     
-    def _format_observations(self, observations: List[Observation]) -> str:
-        """Format observations for inclusion in the prompt."""
-        if not observations:
-            return "No observations available."
-        
-        formatted = []
-        for i, obs in enumerate(observations[:10], 1):  # Limit to 10 most recent
-            # Truncate long observations
-            content = obs.content[:200] + "..." if len(obs.content) > 200 else obs.content
-            formatted.append(
-                f"[{i}] (ID: {obs.id}) {obs.observer_name}: {content}"
-            )
+    def _create_prefilter_analysis(self, proposition_id: int) -> ClarificationAnalysis:
+        """Create an all-zero analysis for a proposition the pre-filter skipped."""
+        llm_response = {
+            "factors": [
+                {
+                    "id": factor_id,
+                    "name": name,
+                    "score": 0.0,
+                    "triggered": False,
+                    "evidence": [],
+                    "reasoning": "No rule-based cues; LLM call skipped",
+                    "observation_ids_cited": []
+                }
+                for factor_id, name in enumerate(FACTOR_SCORE_NAMES, 1)
+            ],
+            "aggregate": {
+                "clarification_score": 0.0,
+                "needs_clarification": False,
+                "reasoning_summary": "Skipped by rule-based pre-filter: high confidence and no clarification cues"
+            }
+        }
+        validation = {"passed": True, "issues": [], "evidence_quality": "high"}
+        
+        analysis = self._create_analysis(proposition_id, llm_response, validation)
+        analysis.model_used = PREFILTER_MODEL_NAME
+        return analysis
+    
+    @staticmethod
+    def _cache_text(context: Dict[str, Any]) -> str:
+        """Text used to key the semantic cache for a given context."""
+        return (
+            f"{context['proposition_text']}\n"
+            f"{context['reasoning']}\n"
+            f"confidence: {context['confidence']}"
+        )
+    
+    @staticmethod
+    def _cache_context_key(context: Dict[str, Any]) -> str:
+        """
+        Observations a cached response must share to be reused.
         
-        return "\n".join(formatted)
+        Responses cite observation IDs as evidence, so a response is only
+        valid for the same set of observations.
+        """
+        return ",".join(str(obs_id) for obs_id in sorted(context.get("observation_ids", [])))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_user_name(text: str) -> str:
+        """Extract user name from proposition text (memoized; pure in ``text``)."""
+        # Simple heuristic: first capitalized word (3+ chars) among the first
+        # 5 words, plus the following word if it is also capitalized (last name)
+        match = _USER_NAME_RE.match(text)
+        if match is None:
+            return "the user"
+        first, last = match.groups()
+        return f"{first} {last}" if last else first
+    
+    def _format_observations(self, observations: List[Any]) -> str:
+        """Format observation rows (id, observer_name, content) for the prompt."""
+        # Limit to 10 most recent; key the cache on the values actually rendered
+        return _format_observation_tuples(
+            tuple((obs.id, obs.observer_name, obs.content) for obs in observations[:10])
+        )
     
-    async def _call_llm(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_request(
+        self,
+        context: Dict[str, Any],
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments for a context.
+        
+        Shared by the online path (``_call_llm``) and the Batch API path
+        (``submit_batch``) so both send identical requests.
+        
+        Args:
+            context: Dictionary with all context fields
+            model: Model to call (defaults to the configured model)
+            
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        # The static rubric is the system message so the provider can cache
+        # it; only the per-proposition context goes in the user message
+        return {
+            "model": model or self.clarification_config.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": CLARIFICATION_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": render_clarification_context(context)
+                }
+            ],
+            "temperature": self.clarification_config.temperature,
+            "response_format": {"type": "json_object"}
+        }
+    
+    async def _call_llm(
+        self,
+        context: Dict[str, Any],
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Call the LLM with the comprehensive prompt.
         
         Args:
             context: Dictionary with all context fields
+            model: Model to call (defaults to the configured model)
             
         Returns:
             Parsed JSON response from the LLM
         """
-        # Format the prompt with context
-        prompt = CLARIFICATION_ANALYSIS_PROMPT.format(**context)
+        request = self._build_request(context, model=model)
         
-        logger.debug(f"Calling LLM with model={self.clarification_config.model}")
+        logger.debug(f"Calling LLM with model={request['model']}")
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.clarification_config.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert in cognitive psychology analyzing behavioral propositions. Always return valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.clarification_config.temperature,
-                response_format={"type": "json_object"}
-            )
+            if getattr(self.clarification_config, "stream_responses", True):
+                stream = await self.client.chat.completions.create(
+                    **request, stream=True, timeout=DETECTOR_REQUEST_TIMEOUT
+                )
+                content = await self._read_stream(stream)
+            else:
+                response = await self.client.chat.completions.create(
+                    **request, timeout=DETECTOR_REQUEST_TIMEOUT
+                )
+                content = response.choices[0].message.content
             
             # Parse JSON response
-            content = response.choices[0].message.content
-            parsed = json.loads(content)
+            parsed = _json_loads(content)
             
             logger.debug(f"LLM response parsed successfully")
             return parsed
@@ -223,6 +805,42 @@ class ClarificationDetector:
             logger.error(f"LLM call failed: {e}")
             raise
     
+    async def _read_stream(self, stream) -> str:
+        """
+        Accumulate a streamed completion, failing fast on non-JSON output.
+        
+        If the first non-whitespace token is not the start of a JSON object
+        (e.g. the model answered in prose or returned an error message), the
+        stream is closed immediately instead of waiting for the full body.
+        
+        Args:
+            stream: Async iterator of chat completion chunks
+            
+        Returns:
+            The full message content
+            
+        Raises:
+            json.JSONDecodeError: If the response does not start with "{"
+        """
+        parts = []
+        started = False
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            
+            if not started and delta.strip():
+                started = True
+                if not delta.lstrip().startswith("{"):
+                    await stream.close()
+                    raise json.JSONDecodeError("Expected a JSON object", delta, 0)
+            
+            parts.append(delta)
+        
+        return "".join(parts)
+    
     def _validate_response(
         self, 
         llm_response: Dict[str, Any], 
@@ -262,6 +880,10 @@ class ClarificationDetector:
             validation["issues"].append(f"Expected 12 factors, got {len(factors)}")
             return validation
         
+        # Index factors by id once so per-factor checks are O(1) lookups
+        factors_by_id = {f.get("id"): f for f in factors}
+        valid_obs_ids = set(context.get("observation_ids", []))
+        
         # Validate each factor
         for factor in factors:
             factor_id = factor.get("id")
@@ -284,7 +906,6 @@ class ClarificationDetector:
             
             # Verify observation IDs are valid (if cited)
             obs_ids_cited = factor.get("observation_ids_cited", [])
-            valid_obs_ids = context.get("observation_ids", [])
             for obs_id in obs_ids_cited:
                 if obs_id not in valid_obs_ids:
                     validation["issues"].append(
@@ -294,11 +915,9 @@ class ClarificationDetector:
         
         # Factor 7 specific validation: if triggered, must have absolutist words
         # Use defensive coding - don't crash if factor 7 is missing
-        factor_7 = next((f for f in factors if f.get("id") == 7), None)
+        factor_7 = factors_by_id.get(7)
         if factor_7 and factor_7.get("triggered", False):
-            absolutist_words = ["always", "never", "all", "every", "none", "invariably"]
-            prop_text = context["proposition_text"].lower()
-            if not any(word in prop_text for word in absolutist_words):
+            if not _ABSOLUTIST_WORDS & _tokenize(context["proposition_text"]):
                 validation["issues"].append(
                     "Factor 7 (generalization) triggered but no absolutist words found in text"
                 )
@@ -315,7 +934,8 @@ class ClarificationDetector:
         self,
         proposition_id: int,
         llm_response: Dict[str, Any],
-        validation_result: Dict[str, Any]
+        validation_result: Dict[str, Any],
+        model: Optional[str] = None
     ) -> ClarificationAnalysis:
         """
         Create a ClarificationAnalysis record from LLM response.
@@ -324,6 +944,7 @@ class ClarificationDetector:
             proposition_id: ID of the proposition analyzed
             llm_response: Parsed LLM response
             validation_result: Results from validation
+            model: Model that produced the response (defaults to the configured model)
             
         Returns:
             ClarificationAnalysis instance ready to be persisted
@@ -331,24 +952,21 @@ class ClarificationDetector:
         factors = llm_response["factors"]
         aggregate = llm_response["aggregate"]
         
-        # Extract per-factor scores (in order 1-12)
-        factor_scores = {f["id"]: f["score"] for f in factors}
-        
-        # Build triggered factors list
-        triggered = [
-            f["name"] for f in factors 
-            if f.get("triggered", False)
-        ]
-        
-        # Build evidence log
-        evidence_log = {
-            f["name"]: {
-                "evidence": f.get("evidence", []),
-                "reasoning": f.get("reasoning", ""),
-                "observation_ids": f.get("observation_ids_cited", [])
-            }
-            for f in factors
-        }
+        # Build per-factor scores (index = factor id), triggered list and
+        # evidence log in a single pass over the factors
+        scores = [0.0] * 13
+        triggered = []
+        evidence_log = {}
+        for f in factors:
+            factor_id = f["id"]
+            name = f["name"]
+            score = f["score"]
+            # Non-int ids (e.g. "3" or null) are skipped, leaving a 0.0 score
+            if isinstance(factor_id, int) and 1 <= factor_id <= 12:
+                scores[factor_id] = score
+            if f.get("triggered", False):
+                triggered.append(name)
+            evidence_log[name] = _compact_factor(f)
         
         # Create the analysis record
         analysis = ClarificationAnalysis(
@@ -358,19 +976,8 @@ class ClarificationDetector:
             needs_clarification=aggregate.get("needs_clarification", False),
             clarification_score=aggregate.get("clarification_score", 0.0),
             
-            # Per-factor scores
-            factor_1_identity=factor_scores.get(1, 0.0),
-            factor_2_surveillance=factor_scores.get(2, 0.0),
-            factor_3_intent=factor_scores.get(3, 0.0),
-            factor_4_face_threat=factor_scores.get(4, 0.0),
-            factor_5_over_positive=factor_scores.get(5, 0.0),
-            factor_6_opacity=factor_scores.get(6, 0.0),
-            factor_7_generalization=factor_scores.get(7, 0.0),
-            factor_8_privacy=factor_scores.get(8, 0.0),
-            factor_9_actor_observer=factor_scores.get(9, 0.0),
-            factor_10_reputation=factor_scores.get(10, 0.0),
-            factor_11_ambiguity=factor_scores.get(11, 0.0),
-            factor_12_tone=factor_scores.get(12, 0.0),
+            # Per-factor scores (one vector, mapped onto the 12 factor columns)
+            factor_scores=scores[1:],
             
             # Detailed results
             triggered_factors={"factors": triggered},
@@ -379,7 +986,7 @@ class ClarificationDetector:
             llm_raw_output=llm_response,
             
             # Metadata
-            model_used=self.clarification_config.model,
+            model_used=model or self.clarification_config.model,
             prompt_version=self.prompt_version,
             validation_passed=validation_result["passed"]
         )
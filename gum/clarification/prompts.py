@@ -6,8 +6,10 @@ This module contains the comprehensive prompt that analyzes propositions
 against 12 psychological factors to determine clarification needs.
 """
 
-# Prompt version for tracking
-PROMPT_VERSION = "v1.0"
+import string
+
+# Prompt version for tracking (v1.1: rubric moved to the system message)
+PROMPT_VERSION = "v1.1"
 
 # Main comprehensive analysis prompt
 CLARIFICATION_ANALYSIS_PROMPT = """You are an expert in cognitive psychology and human communication analyzing user behavior propositions.
@@ -372,3 +374,48 @@ Return ONLY valid JSON (no markdown, no extra text):
 Analyze now:
 """
 
+
+
+# ---------------------------------------------------------------------------
+# Split prompt: static rubric as the system message, context as the user message
+# ---------------------------------------------------------------------------
+#
+# Everything except the CONTEXT section is identical on every call. Sending it
+# as the system message gives the provider a stable prefix to cache, and the
+# per-proposition user message stays small. The context template is parsed
+# once at import so rendering is a join over a handful of segments instead of
+# re-parsing the whole prompt with str.format on every call.
+
+_CONTEXT_HEADER = "## CONTEXT\n"
+_RUBRIC_HEADER = "## THE 12 FACTORS TO ANALYZE"
+_CLOSING = "Analyze now:\n"
+
+_intro, _rest = CLARIFICATION_ANALYSIS_PROMPT.split(_CONTEXT_HEADER, 1)
+_context, _rubric = _rest.split(_RUBRIC_HEADER, 1)
+_rubric = _RUBRIC_HEADER + _rubric[: -len(_CLOSING)]
+
+# Static system message (``format()`` with no fields just unescapes {{ }})
+CLARIFICATION_SYSTEM_PROMPT = (_intro + _rubric).format().rstrip() + "\n\nAlways return valid JSON."
+
+# Pre-parsed user message: literal text segments interleaved with field names
+_CONTEXT_SEGMENTS = [
+    (literal, field)
+    for literal, field, _, _ in string.Formatter().parse(_CONTEXT_HEADER + _context + _CLOSING)
+]
+
+
+def render_clarification_context(context: dict) -> str:
+    """
+    Render the per-proposition user message for the split prompt.
+    
+    Args:
+        context: Dictionary with user_name, proposition_text, reasoning,
+            confidence and observations
+            
+    Returns:
+        The CONTEXT section of the prompt, filled in
+    """
+    return "".join(
+        literal + (str(context[field]) if field is not None else "")
+        for literal, field in _CONTEXT_SEGMENTS
+    )
@@ -0,0 +1,170 @@
+"""
+Persistent cache of generated clarifying questions.
+
+This module provides:
+- QuestionResultCache: SQLite-backed store of generator output, keyed by
+  model, factor, proposition text and observation IDs
+- Cache key hashing (blake2b)
+- LRUResponseCache: bounded in-memory mapping for QuestionGenerator's
+  per-request LLM response cache
+
+Re-running the engine over the same flagged propositions, or over
+propositions that repeat text, then costs a local lookup instead of an
+LLM call.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default max entries kept by LRUResponseCache
+DEFAULT_RESPONSE_CACHE_SIZE = 4096
+
+# Results stored between QuestionResultCache commits
+DEFAULT_COMMIT_EVERY = 64
+
+
+class QuestionResultCache:
+    """SQLite-backed cache of QuestionGenerator results."""
+
+    def __init__(self, path: str, commit_every: int = DEFAULT_COMMIT_EVERY):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite cache file
+            commit_every: Results stored per commit; uncommitted results are
+                still visible to get and are committed by flush/close
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.commit_every = max(1, commit_every)
+        self._uncommitted = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        # WAL keeps the per-result commits cheap and readers unblocked
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS question_results ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(
+        model: str,
+        factor_id: int,
+        prop_text: str,
+        observation_ids: Iterable[Any]
+    ) -> str:
+        """
+        Build the cache key for one generation input.
+
+        Args:
+            model: Generator model name
+            factor_id: Factor ID
+            prop_text: Proposition text
+            observation_ids: IDs of the observations shown to the generator
+
+        Returns:
+            32-character hex digest
+        """
+        obs_part = ",".join(sorted(str(obs_id) for obs_id in observation_ids))
+        raw = f"{model}\0{factor_id}\0{prop_text}\0{obs_part}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached generator result.
+
+        Args:
+            key: Key from key_for
+
+        Returns:
+            The cached result dict, or None on a miss
+        """
+        row = self._conn.execute(
+            "SELECT result FROM question_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a generator result.
+
+        Args:
+            key: Key from key_for
+            result: Generator result dict (question, reasoning, evidence, ...)
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO question_results (key, result) VALUES (?, ?)",
+            (key, json.dumps(result, ensure_ascii=False))
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit any stored results not yet committed."""
+        if self._uncommitted:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit pending results and close the database connection."""
+        self.flush()
+        self._conn.close()
+
+
+class LRUResponseCache(MutableMapping):
+    """
+    In-memory mapping that evicts the least recently used entry when full.
+    
+    Attributes:
+        max_entries (int): Maximum entries kept
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum entries kept before LRU eviction
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,10 +4,14 @@ Configuration and mappings for clarifying question generation.
 This module provides:
 - Factor ID to method mapping (few-shot vs controlled QG)
 - Factor names and human-readable descriptions
+- FACTOR_TABLE: per-factor (method, name, description) in one lookup
 - Validation thresholds and constants
+
+The per-factor getters are memoized; FACTOR_TABLE is static data.
 """
 
-from typing import Optional, Dict
+import functools
+from typing import NamedTuple, Optional, Dict, Tuple
 
 # Factor ID to method mapping
 FACTOR_METHOD_MAP: Dict[int, str] = {
@@ -57,6 +61,30 @@ FACTOR_DESCRIPTIONS: Dict[int, str] = {
     12: "Tone Imbalance - The proposition's assertiveness doesn't match the evidence"
 }
 
+
+
+class FactorInfo(NamedTuple):
+    """Method, name and description of one factor."""
+    method: str
+    name: str
+    description: str
+
+
+# One lookup yields everything known about a factor
+FACTOR_TABLE: Dict[int, FactorInfo] = {
+    fid: FactorInfo(FACTOR_METHOD_MAP[fid], FACTOR_NAMES[fid], FACTOR_DESCRIPTIONS[fid])
+    for fid in FACTOR_METHOD_MAP
+}
+
+# Reverse lookup and per-method factor IDs, built once at import
+FACTOR_NAME_TO_ID: Dict[str, int] = {name: fid for fid, name in FACTOR_NAMES.items()}
+FEW_SHOT_IDS: Tuple[int, ...] = tuple(
+    fid for fid, method in FACTOR_METHOD_MAP.items() if method == "few_shot"
+)
+CONTROLLED_QG_IDS: Tuple[int, ...] = tuple(
+    fid for fid, method in FACTOR_METHOD_MAP.items() if method == "controlled_qg"
+)
+
 # Validation thresholds
 MAX_REASONING_WORDS = 30
 HARD_REASONING_LIMIT = 40
@@ -69,7 +97,32 @@ MAX_GENERATION_RETRIES = 2
 # Evidence settings
 MAX_EVIDENCE_ITEMS = 3
 
+# Observation text longer than these is cut to that length, ending in TRUNCATION_SUFFIX
+MAX_EVIDENCE_TEXT_CHARS = 100
+MAX_SUMMARY_TEXT_CHARS = 150
+TRUNCATION_SUFFIX = "..."
+
+
+def get_factor_info(factor_id: int) -> FactorInfo:
+    """
+    Get the method, name and description of a factor in one lookup.
+    
+    Args:
+        factor_id: The factor ID (1-12)
+        
+    Returns:
+        FactorInfo(method, name, description)
+        
+    Raises:
+        ValueError: If factor_id is not in valid range
+    """
+    try:
+        return FACTOR_TABLE[factor_id]
+    except KeyError:
+        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.") from None
+
 
+@functools.lru_cache(maxsize=16)
 def get_method_for_factor(factor_id: int) -> str:
     """
     Get the generation method for a given factor.
@@ -83,11 +136,13 @@ def get_method_for_factor(factor_id: int) -> str:
     Raises:
         ValueError: If factor_id is not in valid range
     """
-    if factor_id not in FACTOR_METHOD_MAP:
-        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.")
-    return FACTOR_METHOD_MAP[factor_id]
+    try:
+        return FACTOR_TABLE[factor_id].method
+    except KeyError:
+        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.") from None
 
 
+@functools.lru_cache(maxsize=16)
 def get_factor_name(factor_id: int) -> str:
     """
     Get the name of a factor.
@@ -101,11 +156,13 @@ def get_factor_name(factor_id: int) -> str:
     Raises:
         ValueError: If factor_id is not in valid range
     """
-    if factor_id not in FACTOR_NAMES:
-        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.")
-    return FACTOR_NAMES[factor_id]
+    try:
+        return FACTOR_TABLE[factor_id].name
+    except KeyError:
+        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.") from None
 
 
+@functools.lru_cache(maxsize=16)
 def get_factor_description(factor_id: int) -> str:
     """
     Get the human-readable description of a factor.
@@ -119,9 +176,10 @@ def get_factor_description(factor_id: int) -> str:
     Raises:
         ValueError: If factor_id is not in valid range
     """
-    if factor_id not in FACTOR_DESCRIPTIONS:
-        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.")
-    return FACTOR_DESCRIPTIONS[factor_id]
+    try:
+        return FACTOR_TABLE[factor_id].description
+    except KeyError:
+        raise ValueError(f"Invalid factor_id: {factor_id}. Must be 1-12.") from None
 
 
 def get_factor_id_from_name(factor_name: str) -> Optional[int]:
@@ -134,10 +192,7 @@ def get_factor_id_from_name(factor_name: str) -> Optional[int]:
     Returns:
         Factor ID (1-12) or None if not found
     """
-    for factor_id, name in FACTOR_NAMES.items():
-        if name == factor_name:
-            return factor_id
-    return None
+    return FACTOR_NAME_TO_ID.get(factor_name)
 
 
 def validate_factor_id(factor_id: int) -> bool:
@@ -163,22 +218,22 @@ def get_all_factor_ids() -> list[int]:
     return list(FACTOR_METHOD_MAP.keys())
 
 
-def get_few_shot_factor_ids() -> list[int]:
+def get_few_shot_factor_ids() -> Tuple[int, ...]:
     """
     Get factor IDs that use few-shot generation.
     
     Returns:
-        List of factor IDs that use few-shot method
+        Tuple of factor IDs that use few-shot method
     """
-    return [fid for fid, method in FACTOR_METHOD_MAP.items() if method == "few_shot"]
+    return FEW_SHOT_IDS
 
 
-def get_controlled_qg_factor_ids() -> list[int]:
+def get_controlled_qg_factor_ids() -> Tuple[int, ...]:
     """
     Get factor IDs that use controlled QG generation.
     
     Returns:
-        List of factor IDs that use controlled QG method
+        Tuple of factor IDs that use controlled QG method
     """
-    return [fid for fid, method in FACTOR_METHOD_MAP.items() if method == "controlled_qg"]
+    return CONTROLLED_QG_IDS
 
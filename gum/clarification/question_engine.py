@@ -3,31 +3,58 @@ Main orchestrator for the clarifying question generation pipeline.
 
 This module provides:
 - ClarifyingQuestionEngine class
-- Pipeline execution (load -> filter -> generate -> validate -> write)
+- Streaming pipeline execution (load -> filter -> generate -> validate -> write),
+  with loading, LLM calls and disk writes overlapping
 - Statistics tracking
-- JSONL output
+- Optional persistent cache of generator results (skips repeat LLM calls)
+- Streaming JSONL output, with proposition text in a sidecar file
 - Database persistence (optional)
 """
 
+import asyncio
 import json
 import logging
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import Any, AsyncIterator, BinaryIO, Deque, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 from openai import AsyncOpenAI
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .question_loader import (
-    load_flagged_propositions,
-    filter_propositions,
-    get_proposition_factor_pairs
+    iter_flagged_propositions,
+    iter_proposition_factor_pairs
 )
-from .question_generator import QuestionGenerator
+from .question_cache import QuestionResultCache
+from .question_generator import QuestionGenerator, build_async_openai
 from .question_validator import QuestionValidator
-from .question_config import get_factor_id_from_name
+from .question_config import get_factor_name, get_factor_id_from_name
 
 logger = logging.getLogger(__name__)
 
+# Default number of (proposition, factor) pairs generated concurrently
+DEFAULT_CONCURRENCY = 16
+
+# Default number of same-factor pairs packed into one LLM call (1 = no batching)
+DEFAULT_BATCH_SIZE = 1
+
+# JSONL output is written through a 1 MiB buffer and flushed every
+# FLUSH_EVERY records so `tail -f` sees progress and a crash loses little
+OUTPUT_BUFFER_SIZE = 1 << 20
+FLUSH_EVERY = 64
+
+# Max serialized results waiting for the background writer
+WRITE_QUEUE_SIZE = 1024
+
+# Failures are streamed to a sidecar file; only the most recent are kept
+# in memory for the run summary
+RECENT_FAILURES = 50
+
 
 class ClarifyingQuestionEngine:
     """Main orchestrator for clarifying question generation pipeline."""
@@ -39,7 +66,10 @@ class ClarifyingQuestionEngine:
         input_source: str = "file",
         input_file_path: Optional[str] = None,
         output_path: Optional[str] = None,
-        db_session: Optional[AsyncSession] = None
+        db_session: Optional[AsyncSession] = None,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        cache_path: Optional[str] = None
     ):
         """
         Initialize the question engine.
@@ -51,6 +81,12 @@ class ClarifyingQuestionEngine:
             input_file_path: Path to input file (for file source)
             output_path: Path to output JSONL file
             db_session: Optional database session for saving questions
+            concurrency: Max (proposition, factor) pairs generated at once
+                (defaults to config.clarification.concurrency)
+            batch_size: Same-factor pairs generated per LLM call
+                (defaults to config.clarification.question_batch_size)
+            cache_path: SQLite file caching generator results across runs
+                (None disables the cache)
         """
         self.client = openai_client
         self.config = config
@@ -58,51 +94,93 @@ class ClarifyingQuestionEngine:
         self.input_file_path = input_file_path
         self.db_session = db_session
         
+        # Config has nested clarification.* settings; resolve the section once
+        clarification = getattr(config, 'clarification', None)
+        
+        if concurrency is None:
+            concurrency = getattr(clarification, 'concurrency', None)
+            if not isinstance(concurrency, int):
+                concurrency = DEFAULT_CONCURRENCY
+        self.concurrency = max(1, concurrency)
+        if batch_size is None:
+            batch_size = getattr(clarification, 'question_batch_size', None)
+            if not isinstance(batch_size, int):
+                batch_size = DEFAULT_BATCH_SIZE
+        self.batch_size = max(1, batch_size)
+        
         # Set default output path
         if output_path is None:
             output_path = "test_results_200_props/clarifying_questions.jsonl"
         self.output_path = Path(output_path)
+        # Create the output directory once, not on every run
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize generator and validator
-        # Config has nested clarification.model structure
-        model = getattr(getattr(config, 'clarification', None), 'model', 'gpt-4') if hasattr(config, 'clarification') else 'gpt-4'
-        self.generator = QuestionGenerator(openai_client, model=model)
+        self._model = getattr(clarification, 'model', 'gpt-4') if clarification is not None else 'gpt-4'
+        self.generator = QuestionGenerator(openai_client, model=self._model)
         self.validator = QuestionValidator()
         
-        # Statistics
-        self.stats = {
-            "total_processed": 0,
-            "successful": 0,
-            "failed": 0,
-            "validation_errors": 0,
-            "generation_errors": 0
+        # Statistics (plain ints on the hot path; see the `stats` property)
+        self._n_total = 0
+        self._n_ok = 0
+        self._n_fail = 0
+        self._n_validation_errors = 0
+        self._n_generation_errors = 0
+        
+        self.failures: Deque[Dict[str, Any]] = deque(maxlen=RECENT_FAILURES)
+        self.failures_path = self.output_path.with_suffix('.failures.jsonl')
+        self._failures_file: Optional[BinaryIO] = None
+        
+        # Proposition text is written once per proposition to a sidecar
+        # instead of being repeated on every factor's result
+        self.propositions_path = self.output_path.with_suffix('.propositions.jsonl')
+        self._propositions_file: Optional[BinaryIO] = None
+        self._written_prop_ids: Set[Any] = set()
+        
+        # Generator result cache, open only while a run is in progress
+        self.cache_path = cache_path
+        self._result_cache: Optional[QuestionResultCache] = None
+        
+        # Serialized (bytes) JSONL lines waiting for the writer (None ends a run)
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters for pairs processed so far, as a dict."""
+        return {
+            "total_processed": self._n_total,
+            "successful": self._n_ok,
+            "failed": self._n_fail,
+            "validation_errors": self._n_validation_errors,
+            "generation_errors": self._n_generation_errors
         }
-        
-        self.failures: List[Dict[str, Any]] = []
     
     async def run(
         self,
-        prop_ids: Optional[List[int]] = None,
-        factor_ids: Optional[List[int]] = None,
+        prop_ids: Optional[Iterable[int]] = None,
+        factor_ids: Optional[Iterable[int]] = None,
         db_session: Optional[AsyncSession] = None
     ) -> Dict[str, Any]:
         """
         Main pipeline execution.
         
-        Steps:
+        Steps run as one streaming pipeline: propositions are loaded and
+        filtered lazily, so generation starts with the first pair and peak
+        memory is bounded by the in-flight window, not the input size.
         1. Load flagged propositions
         2. Filter by prop_ids/factor_ids if provided
-        3. For each (prop × factor):
+        3. For each (prop × factor), with at most `concurrency` in flight,
+           handled in completion order:
             a. Generate question + reasoning + evidence
             b. Validate output
             c. If invalid, log warning and skip
-            d. Append to results list
-        4. Write JSONL output file
+            d. Append the result to the JSONL output file as it completes
+        4. Save results to the database (if a session was given)
         5. Return stats summary
         
         Args:
-            prop_ids: Optional list of prop IDs to process
-            factor_ids: Optional list of factor IDs to process
+            prop_ids: Optional prop IDs to process (list, set or frozenset)
+            factor_ids: Optional factor IDs to process (list, set or frozenset)
             db_session: Database session (required if input_source="db")
             
         Returns:
@@ -111,100 +189,324 @@ class ClarifyingQuestionEngine:
             - successful: int
             - failed: int
             - output_file: str
-            - failures: List[Dict]
+            - failures_file: str (every failure, as JSONL)
+            - propositions_file: str (prop_id -> prop_text, one JSONL record
+              per proposition with results; results carry only prop_id)
+            - failures: List[Dict] (the most recent failures only)
+            - cache_hits: int (pairs served from the result cache)
         """
         logger.info("Starting clarifying question generation pipeline")
         start_time = datetime.now()
         
-        # Step 1: Load propositions
-        propositions = await load_flagged_propositions(
-            source=self.input_source,
-            file_path=self.input_file_path,
-            db_session=db_session if db_session else self.db_session
-        )
-        
-        logger.info(f"Loaded {len(propositions)} flagged propositions")
-        
-        # Step 2: Filter if needed
+        # Step 1-2: Stream propositions, filtered as they are loaded. Filters
+        # are frozensets so every membership test downstream is O(1)
+        prop_ids = frozenset(prop_ids) if prop_ids else None
         if factor_ids:
             # Convert factor IDs to names for filtering
-            from .question_config import get_factor_name
-            factor_names = [get_factor_name(fid) for fid in factor_ids]
+            factor_names = frozenset(get_factor_name(fid) for fid in factor_ids)
         else:
             factor_names = None
         
-        filtered_props = filter_propositions(
+        propositions = iter_flagged_propositions(
+            source=self.input_source,
+            file_path=self.input_file_path,
+            db_session=db_session if db_session else self.db_session
+        )
+        
+        # Step 3: Expand into (prop, factor) pairs, grouped into LLM-call chunks
+        pairs = iter_proposition_factor_pairs(
             propositions,
             prop_ids=prop_ids,
             factor_names=factor_names
         )
+        chunks = self._iter_chunks(pairs)
+        
+        # Results are only held in memory when they must also go to the DB
+        db_results = [] if self.db_session else None
+        
+        # Step 5 (runs alongside step 4): Stream each result to the JSONL file
+        # as it completes. The writes happen on a background thread so disk
+        # latency never stalls the in-flight LLM requests
+        logger.info("Streaming results to %s", self.output_path)
+        writer_task = asyncio.create_task(self._writer_loop())
+        self._failures_file = open(self.failures_path, 'wb')
+        self._propositions_file = open(self.propositions_path, 'wb')
+        self._written_prop_ids = set()
+        if self.cache_path:
+            self._result_cache = QuestionResultCache(self.cache_path)
+        cache_hits = 0
+        
+        # Step 4: Process pairs concurrently (LLM calls are I/O-bound) with at
+        # most `concurrency` chunks in flight, handling each as it finishes so
+        # progress, stats and output stream back. With batching, same-factor
+        # pairs share one LLM call. Tasks are created as slots free up, so only
+        # `concurrency` coroutines exist at once; a full window also pauses
+        # loading (backpressure)
+        pending: Set[asyncio.Task] = set()
+        try:
+            async for chunk in chunks:
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    await self._handle_finished(done, db_results)
+                pending.add(asyncio.create_task(self._process_chunk(chunk)))
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                await self._handle_finished(done, db_results)
+        finally:
+            for task in pending:
+                task.cancel()
+            await self._write_queue.put(None)
+            written = await writer_task
+            self._failures_file.close()
+            self._failures_file = None
+            self._propositions_file.close()
+            self._propositions_file = None
+            if self._result_cache is not None:
+                cache_hits = self._result_cache.hits
+                self._result_cache.close()
+                self._result_cache = None
+        
+        logger.info("Successfully wrote %d results", written)
         
-        logger.info(f"Filtered to {len(filtered_props)} propositions")
+        # Step 5b: Save to database if session provided
+        if db_results is not None:
+            await self._save_to_database(db_results)
         
-        # Step 3: Expand into (prop, factor) pairs
-        pairs = get_proposition_factor_pairs(filtered_props)
+        # Step 6: Generate summary
+        elapsed = (datetime.now() - start_time).total_seconds()
+        
+        summary = {
+            **self.stats,
+            "output_file": str(self.output_path),
+            "elapsed_seconds": elapsed,
+            "failures_file": str(self.failures_path),
+            "propositions_file": str(self.propositions_path),
+            "cache_hits": cache_hits,
+            "failures": list(self.failures)
+        }
+        
+        logger.info("Pipeline complete: %d successful, %d failed", self._n_ok, self._n_fail)
+        logger.info("Results written to %s", self.output_path)
+        
+        return summary
+    
+    async def _iter_chunks(
+        self,
+        pairs: AsyncIterator[Tuple[Dict[str, Any], str]]
+    ) -> AsyncIterator[List[Tuple[Dict[str, Any], str, int]]]:
+        """
+        Resolve factor IDs and group streamed pairs into LLM-call chunks.
+        
+        Each distinct factor name is resolved once. Without batching every
+        pair is its own chunk; with batching, pairs are buffered per factor and
+        a chunk is emitted as soon as a factor has batch_size pairs, with any
+        partial chunks flushed at the end.
         
-        logger.info(f"Processing {len(pairs)} (proposition, factor) pairs")
+        Args:
+            pairs: Async iterator of (prop, factor_name) tuples
+            
+        A pair naming an unknown factor is recorded as a generation failure
+        and skipped.
         
-        # Step 4: Process each pair
-        results = []
+        Yields:
+            Lists of (prop, factor_name, factor_id) tuples sharing one factor
+        """
+        name_to_id: Dict[str, int] = {}
+        buffers: Dict[int, List[Tuple[Dict[str, Any], str, int]]] = {}
         
-        for i, (prop, factor_name) in enumerate(pairs):
-            self.stats["total_processed"] += 1
+        async for prop, factor_name in pairs:
+            factor_id = name_to_id.get(factor_name)
+            if factor_id is None:
+                factor_id = get_factor_id_from_name(factor_name)
+                if factor_id is None:
+                    self._record_outcome(prop, factor_name, None, ValueError(f"Invalid factor name: {factor_name}"))
+                    continue
+                name_to_id[factor_name] = factor_id
+            
+            if self.batch_size == 1:
+                yield [(prop, factor_name, factor_id)]
+                continue
             
-            if (i + 1) % 10 == 0:
-                logger.info(f"Progress: {i + 1}/{len(pairs)} pairs processed")
+            buffer = buffers.setdefault(factor_id, [])
+            buffer.append((prop, factor_name, factor_id))
+            if len(buffer) >= self.batch_size:
+                yield buffers.pop(factor_id)
+        
+        for buffer in buffers.values():
+            yield buffer
+    
+    async def _process_chunk(
+        self,
+        chunk: List[Tuple[Dict[str, Any], str, int]]
+    ) -> List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Process a chunk of pairs, capturing exceptions per pair.
+        
+        A single pair goes through _process_pair; larger chunks are generated
+        with one batched LLM call.
+        
+        Args:
+            chunk: List of (prop, factor_name, factor_id) tuples sharing one factor
             
+        Returns:
+            List of (prop, factor_name, result or None, exception or None) tuples
+        """
+        if len(chunk) == 1:
+            prop, factor_name, factor_id = chunk[0]
             try:
-                result = await self._process_pair(prop, factor_name)
-                
-                if result:
-                    results.append(result)
-                    self.stats["successful"] += 1
-                else:
-                    self.stats["failed"] += 1
-                    
+                return [(prop, factor_name, await self._process_pair(prop, factor_name, factor_id), None)]
             except Exception as e:
-                logger.error(f"Failed to process prop {prop['prop_id']}, factor {factor_name}: {e}")
-                self.stats["failed"] += 1
-                self.stats["generation_errors"] += 1
-                self.failures.append({
-                    "prop_id": prop["prop_id"],
-                    "factor": factor_name,
-                    "error": str(e),
-                    "error_type": "generation"
-                })
+                return [(prop, factor_name, None, e)]
         
-        # Step 5: Write output
-        self._write_jsonl(results)
+        try:
+            return await self._process_batch(chunk)
+        except Exception as e:
+            # Fail the chunk as its own pairs, as the single-pair path does
+            return [(prop, factor_name, None, e) for prop, factor_name, _ in chunk]
+    
+    async def _process_batch(
+        self,
+        chunk: List[Tuple[Dict[str, Any], str, int]]
+    ) -> List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Process a multi-pair chunk with one batched LLM call.
         
-        # Step 5b: Save to database if session provided
-        if self.db_session:
-            await self._save_to_database(results)
+        Args:
+            chunk: List of (prop, factor_name, factor_id) tuples sharing one factor
+            
+        Returns:
+            List of (prop, factor_name, result or None, exception or None) tuples
+        """
+        # Only pairs missing from the cache go to the LLM
+        keys = [self._cache_key(prop, factor_id) for prop, _, factor_id in chunk]
+        generated = [self._cached_result(key, prop) for key, (prop, _, _) in zip(keys, chunk)]
+        misses = [i for i, result in enumerate(generated) if result is None]
+        
+        if misses:
+            fresh = await self.generator.generate_question_pairs_batch([
+                {
+                    "prop_id": chunk[i][0]["prop_id"],
+                    "prop_text": chunk[i][0]["prop_text"],
+                    "factor_id": chunk[i][2],
+                    "observations": chunk[i][0].get("observations", []),
+                    "prop_reasoning": chunk[i][0].get("prop_reasoning")
+                }
+                for i in misses
+            ])
+            fresh_misses = set(misses)
+            for i, result in zip(misses, fresh):
+                generated[i] = result
+        else:
+            fresh_misses = set()
         
-        # Step 6: Generate summary
-        elapsed = (datetime.now() - start_time).total_seconds()
+        outcomes = []
+        for i, ((prop, factor_name, _), result) in enumerate(zip(chunk, generated)):
+            if isinstance(result, Exception):
+                outcomes.append((prop, factor_name, None, result))
+                continue
+            key = keys[i] if i in fresh_misses else None
+            outcomes.append((prop, factor_name, self._finalize_and_cache(key, prop, factor_name, result), None))
+        return outcomes
+    
+    async def _handle_finished(
+        self,
+        done: Set[asyncio.Task],
+        db_results: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Record finished chunks and queue their results for writing.
         
-        summary = {
-            "total_processed": self.stats["total_processed"],
-            "successful": self.stats["successful"],
-            "failed": self.stats["failed"],
-            "validation_errors": self.stats["validation_errors"],
-            "generation_errors": self.stats["generation_errors"],
-            "output_file": str(self.output_path),
-            "elapsed_seconds": elapsed,
-            "failures": self.failures
-        }
+        Results finished together share one timestamp, taken once per call.
+        
+        Args:
+            done: Completed _process_chunk tasks
+            db_results: List collecting results for the DB save, or None
+        """
+        timestamp = datetime.now().isoformat()
+        for task in done:
+            for prop, factor_name, result, error in task.result():
+                self._record_outcome(prop, factor_name, result, error)
+                if not result:
+                    continue
+                
+                result["timestamp"] = timestamp
+                self._record_proposition(prop)
+                await self._write_queue.put(self._serialize_result(result))
+                
+                if db_results is not None:
+                    db_results.append(result)
+    
+    def _record_outcome(
+        self,
+        prop: Dict[str, Any],
+        factor_name: str,
+        result: Optional[Dict[str, Any]],
+        error: Optional[Exception]
+    ) -> None:
+        """
+        Update stats and failures for a finished pair.
         
-        logger.info(f"Pipeline complete: {self.stats['successful']} successful, {self.stats['failed']} failed")
-        logger.info(f"Results written to {self.output_path}")
+        Args:
+            prop: Proposition dict
+            factor_name: Factor name
+            result: Result dict or None if failed
+            error: Exception raised while processing, if any
+        """
+        self._n_total += 1
+        processed = self._n_total
+        
+        if processed % 10 == 0:
+            logger.info("Progress: %d pairs processed", processed)
+        
+        if error is not None:
+            logger.error("Failed to process prop %s, factor %s: %s", prop['prop_id'], factor_name, error)
+            self._n_fail += 1
+            self._n_generation_errors += 1
+            self._record_failure({
+                "prop_id": prop["prop_id"],
+                "factor": factor_name,
+                "error": str(error),
+                "error_type": "generation"
+            })
+        elif result:
+            self._n_ok += 1
+        else:
+            self._n_fail += 1
+    
+    def _record_proposition(self, prop: Dict[str, Any]) -> None:
+        """
+        Write a proposition's text to the sidecar file the first time it has a result.
         
-        return summary
+        Args:
+            prop: Proposition dict
+        """
+        prop_id = prop["prop_id"]
+        if prop_id in self._written_prop_ids:
+            return
+        self._written_prop_ids.add(prop_id)
+        if self._propositions_file is not None:
+            self._propositions_file.write(self._serialize_result({
+                "prop_id": prop_id,
+                "prop_text": prop["prop_text"]
+            }))
+    
+    def _record_failure(self, failure: Dict[str, Any]) -> None:
+        """
+        Append a failure to the sidecar JSONL file and the recent-failures buffer.
+        
+        Args:
+            failure: Failure record (prop_id, factor, error, error_type)
+        """
+        self.failures.append(failure)
+        if self._failures_file is not None:
+            self._failures_file.write(self._serialize_result(failure))
     
     async def _process_pair(
         self,
         prop: Dict[str, Any],
-        factor_name: str
+        factor_name: str,
+        factor_id: int
     ) -> Optional[Dict[str, Any]]:
         """
         Process a single (proposition, factor) pair.
@@ -212,38 +514,124 @@ class ClarifyingQuestionEngine:
         Args:
             prop: Proposition dict
             factor_name: Factor name
+            factor_id: Factor ID resolved from factor_name
             
         Returns:
             Result dict or None if failed
         """
         prop_id = prop["prop_id"]
-        prop_text = prop["prop_text"]
-        observations = prop.get("observations", [])
-        prop_reasoning = prop.get("prop_reasoning")
         
-        # Get factor ID
-        factor_id = get_factor_id_from_name(factor_name)
-        if factor_id is None:
-            logger.error(f"Invalid factor name: {factor_name}")
+        key = self._cache_key(prop, factor_id)
+        result = self._cached_result(key, prop)
+        
+        # Generate question
+        if result is None:
+            try:
+                result = await self.generator.generate_question_pair(
+                    prop_id=prop_id,
+                    prop_text=prop["prop_text"],
+                    factor_id=factor_id,
+                    observations=prop.get("observations", []),
+                    prop_reasoning=prop.get("prop_reasoning")
+                )
+            except Exception as e:
+                logger.error("Generation failed for prop %s, factor %s: %s", prop_id, factor_name, e)
+                raise
+            
+            return self._finalize_and_cache(key, prop, factor_name, result)
+        
+        return self._finalize_result(prop, factor_name, result)
+    
+    def _finalize_and_cache(
+        self,
+        key: Optional[str],
+        prop: Dict[str, Any],
+        factor_name: str,
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Finalize a freshly generated result, caching it only if it validates.
+        
+        An invalid answer is never cached, so a later run regenerates it.
+        
+        Args:
+            key: Key from _cache_key (None skips caching)
+            prop: Proposition dict
+            factor_name: Factor name
+            result: Result dict from the generator
+            
+        Returns:
+            The finalized result dict
+        """
+        generated = dict(result)
+        finalized = self._finalize_result(prop, factor_name, result)
+        if key is not None and finalized["validation_passed"]:
+            self._result_cache.put(key, generated)
+        return finalized
+    
+    def _cache_key(self, prop: Dict[str, Any], factor_id: int) -> Optional[str]:
+        """
+        Build the result-cache key for a pair.
+        
+        Args:
+            prop: Proposition dict
+            factor_id: Factor ID
+            
+        Returns:
+            Cache key, or None when no cache is open
+        """
+        if self._result_cache is None:
+            return None
+        return QuestionResultCache.key_for(
+            self.generator.model,
+            factor_id,
+            prop["prop_text"],
+            self._get_observation_ids(prop.get("observations", []))
+        )
+    
+    def _cached_result(self, key: Optional[str], prop: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a cached generator result, re-targeted at this proposition.
+        
+        Args:
+            key: Key from _cache_key (None skips the lookup)
+            prop: Proposition dict the result is for
+            
+        Returns:
+            Generator result dict, or None on a miss
+        """
+        if key is None:
             return None
+        result = self._result_cache.get(key)
+        if result is not None:
+            # Another proposition with the same text may have produced it
+            result["prop_id"] = prop["prop_id"]
+        return result
+    
+    def _finalize_result(
+        self,
+        prop: Dict[str, Any],
+        factor_name: str,
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Validate a generated result and attach run metadata.
+        
+        Args:
+            prop: Proposition dict
+            factor_name: Factor name
+            result: Result dict from the generator
+            
+        Returns:
+            The result dict, annotated with validation outcome and metadata
+        """
+        prop_id = prop["prop_id"]
+        observations = prop.get("observations", [])
         
         # Get factor score from proposition data if available
         factor_scores = prop.get("factor_scores", {})
         factor_score = factor_scores.get(factor_name, 0.0)
         
-        # Generate question
-        try:
-            result = await self.generator.generate_question_pair(
-                prop_id=prop_id,
-                prop_text=prop_text,
-                factor_id=factor_id,
-                observations=observations,
-                prop_reasoning=prop_reasoning
-            )
-        except Exception as e:
-            logger.error(f"Generation failed for prop {prop_id}, factor {factor_name}: {e}")
-            raise
-        
         # Validate
         obs_ids = self._get_observation_ids(observations)
         is_valid, errors = self.validator.validate_full_output(result, obs_ids)
@@ -253,9 +641,9 @@ class ClarifyingQuestionEngine:
         result["validation_warnings"] = errors if not is_valid else []
         
         if not is_valid:
-            logger.warning(f"Validation failed for prop {prop_id}, factor {factor_name}: {errors}")
-            self.stats["validation_errors"] += 1
-            self.failures.append({
+            logger.warning("Validation failed for prop %s, factor %s: %s", prop_id, factor_name, errors)
+            self._n_validation_errors += 1
+            self._record_failure({
                 "prop_id": prop_id,
                 "factor": factor_name,
                 "error": "; ".join(errors),
@@ -264,9 +652,8 @@ class ClarifyingQuestionEngine:
             # Still return result even if validation fails (for inspection)
             result["validation_errors"] = errors
         
-        # Add metadata
-        result["prop_text"] = prop_text
-        result["timestamp"] = datetime.now().isoformat()
+        # Add metadata (prop_text lives in the propositions sidecar; the
+        # timestamp is stamped when the result is handled)
         result["factor_score"] = factor_score
         
         return result
@@ -281,37 +668,75 @@ class ClarifyingQuestionEngine:
         Returns:
             Set of observation IDs
         """
-        obs_ids = set()
-        
-        for obs in observations:
-            if isinstance(obs, dict):
-                obs_id = obs.get('id')
-            else:
-                obs_id = getattr(obs, 'id', None)
-            
-            if obs_id is not None:
-                obs_ids.add(obs_id)
+        if not observations:
+            return set()
         
-        return obs_ids
+        # A proposition's observations are homogeneous, so check the type once
+        if isinstance(observations[0], dict):
+            return {obs_id for obs in observations if (obs_id := obs.get('id')) is not None}
+        return {obs_id for obs in observations if (obs_id := getattr(obs, 'id', None)) is not None}
     
-    def _write_jsonl(self, results: List[Dict[str, Any]]) -> None:
+    async def _writer_loop(self) -> int:
         """
-        Write results to JSONL file.
+        Drain the write queue into the output file until a None sentinel.
         
-        Args:
-            results: List of result dicts
+        Lines already queued are written together in one executor call, so a
+        burst of results costs a single thread hop.
+        
+        Returns:
+            Number of lines written
         """
-        # Ensure output directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        written = 0
+        done = False
+        
+        with open(self.output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            while not done:
+                lines = [await self._write_queue.get()]
+                while not self._write_queue.empty():
+                    lines.append(self._write_queue.get_nowait())
+                
+                if lines[-1] is None:
+                    done = True
+                    lines.pop()
+                if not lines:
+                    continue
+                
+                # Bound data loss on a crash without flushing every line
+                flush = (written + len(lines)) // FLUSH_EVERY > written // FLUSH_EVERY
+                await loop.run_in_executor(None, self._write_lines, f, lines, flush)
+                written += len(lines)
         
-        logger.info(f"Writing {len(results)} results to {self.output_path}")
+        return written
+    
+    @staticmethod
+    def _write_lines(f: Any, lines: List[bytes], flush: bool) -> None:
+        """
+        Write lines to the output file (runs on a worker thread).
         
-        with open(self.output_path, 'w') as f:
-            for result in results:
-                json_line = json.dumps(result, ensure_ascii=False)
-                f.write(json_line + "\n")
+        Args:
+            f: Output file open in binary mode
+            lines: Serialized JSONL lines
+            flush: Whether to flush the buffer afterwards
+        """
+        f.writelines(lines)
+        if flush:
+            f.flush()
+    
+    @staticmethod
+    def _serialize_result(result: Dict[str, Any]) -> bytes:
+        """
+        Serialize a result dict as one compact, UTF-8 encoded JSONL line.
         
-        logger.info(f"Successfully wrote {len(results)} results")
+        Args:
+            result: Result dict
+            
+        Returns:
+            JSON bytes terminated by a newline
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
     
     async def _save_to_database(self, results: List[Dict[str, Any]]) -> None:
         """
@@ -324,13 +749,13 @@ class ClarifyingQuestionEngine:
             logger.warning("No database session available, skipping DB save")
             return
         
-        logger.info(f"Saving {len(results)} questions to database")
+        logger.info("Saving %d questions to database", len(results))
         
         # Import here to avoid circular imports
-        from ..clarification_models import ClarifyingQuestion
-        from sqlalchemy import select
+        from ..clarification_models import ClarifyingQuestion, ClarificationAnalysis
+        from sqlalchemy import select, insert
         
-        saved_count = 0
+        rows = []
         skipped_count = 0
         
         for result in results:
@@ -340,68 +765,66 @@ class ClarifyingQuestionEngine:
                 factor = result.get('factor')
                 question = result.get('question')
                 reasoning = result.get('reasoning')
-                evidence = result.get('evidence', [])
-                generation_method = result.get('method', 'unknown')
-                validation_passed = result.get('validation_passed', True)
-                validation_warnings = result.get('validation_warnings', [])
-                factor_score = result.get('factor_score', 0.0)
                 
                 # Skip if essential data is missing
                 if not all([prop_id, factor, question, reasoning]):
-                    logger.warning(f"Skipping result with missing data: {result}")
+                    logger.warning("Skipping result with missing data: %s", result)
                     skipped_count += 1
                     continue
                 
                 # Get factor ID
                 factor_id = get_factor_id_from_name(factor)
                 if factor_id is None:
-                    logger.error(f"Invalid factor name: {factor}, skipping")
+                    logger.error("Invalid factor name: %s, skipping", factor)
                     skipped_count += 1
                     continue
                 
-                # Get analysis ID if available
-                analysis_id = None
-                if self.input_source == "db":
-                    # Try to find corresponding analysis
-                    from ..clarification_models import ClarificationAnalysis
-                    analysis_query = select(ClarificationAnalysis).where(
-                        ClarificationAnalysis.proposition_id == prop_id
-                    )
-                    analysis_result = await self.db_session.execute(analysis_query)
-                    analysis = analysis_result.scalar_one_or_none()
-                    if analysis:
-                        analysis_id = analysis.id
-                
-                # Create question record
-                clarifying_question = ClarifyingQuestion(
-                    proposition_id=prop_id,
-                    analysis_id=analysis_id,
-                    factor_name=factor,
-                    factor_id=factor_id,
-                    factor_score=factor_score,
-                    question=question,
-                    reasoning=reasoning,
-                    evidence=evidence,
-                    generation_method=generation_method,
-                    model_used=self.generator.model,
-                    validation_passed=validation_passed,
-                    validation_warnings=validation_warnings
-                )
-                
-                self.db_session.add(clarifying_question)
-                saved_count += 1
+                rows.append({
+                    "proposition_id": prop_id,
+                    "analysis_id": None,
+                    "factor_name": factor,
+                    "factor_id": factor_id,
+                    "factor_score": result.get('factor_score', 0.0),
+                    "question": question,
+                    "reasoning": reasoning,
+                    "evidence": result.get('evidence', []),
+                    "generation_method": result.get('method', 'unknown'),
+                    "model_used": self.generator.model,
+                    "validation_passed": result.get('validation_passed', True),
+                    "validation_warnings": result.get('validation_warnings', []),
+                })
                 
             except Exception as e:
-                logger.error(f"Error saving question to database: {e}")
+                logger.error("Error saving question to database: %s", e)
                 skipped_count += 1
                 continue
         
-        # Commit all at once
+        if not rows:
+            logger.info("No questions to save, skipped %d", skipped_count)
+            return
+        
         try:
+            # Resolve analysis IDs with one query instead of one per result
+            if self.input_source == "db":
+                analysis_query = select(
+                    ClarificationAnalysis.proposition_id,
+                    ClarificationAnalysis.id
+                ).where(
+                    ClarificationAnalysis.proposition_id.in_({row["proposition_id"] for row in rows})
+                )
+                analysis_result = await self.db_session.execute(analysis_query)
+                analysis_ids = dict(analysis_result.all())
+                for row in rows:
+                    row["analysis_id"] = analysis_ids.get(row["proposition_id"])
+            
+            # Bulk insert: SQLAlchemy batches this into multi-row INSERTs
+            await self.db_session.execute(insert(ClarifyingQuestion), rows)
+            
+            # Commit all at once
             await self.db_session.commit()
-            logger.info(f"Successfully saved {saved_count} questions to database, skipped {skipped_count}")
+            logger.info("Successfully saved %d questions to database, skipped %d", len(rows), skipped_count)
         except Exception as e:
-            logger.error(f"Error committing questions to database: {e}")
+            logger.error("Error committing questions to database: %s", e)
             await self.db_session.rollback()
 
 
@@ -412,7 +835,9 @@ async def run_engine_simple(
     input_file_path: Optional[str] = None,
     output_path: Optional[str] = None,
     prop_ids: Optional[List[int]] = None,
-    factor_ids: Optional[List[int]] = None
+    factor_ids: Optional[List[int]] = None,
+    concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Simple helper to run the engine with API key.
@@ -425,18 +850,24 @@ async def run_engine_simple(
         output_path: Output file path
         prop_ids: Optional prop IDs to filter
         factor_ids: Optional factor IDs to filter
+        concurrency: Max (proposition, factor) pairs generated at once
+            (defaults to config.clarification.concurrency)
+        batch_size: Same-factor pairs generated per LLM call
+            (defaults to config.clarification.question_batch_size)
         
     Returns:
         Summary dict
     """
-    client = AsyncOpenAI(api_key=openai_api_key)
+    client = build_async_openai(api_key=openai_api_key)
     
     engine = ClarifyingQuestionEngine(
         openai_client=client,
         config=config,
         input_source=input_source,
         input_file_path=input_file_path,
-        output_path=output_path
+        output_path=output_path,
+        concurrency=concurrency,
+        batch_size=batch_size
     )
     
     return await engine.run(
@@ -3,57 +3,348 @@ Core generation logic for clarifying questions.
 
 This module provides:
 - QuestionGenerator class with two methods: few-shot and controlled QG
+- Batched generation of several same-factor pairs in one LLM call
 - Evidence extraction from observations
 - Retry logic with validation
+- build_async_openai: AsyncOpenAI client with a connection pool sized for
+  high-concurrency generation
+- A per-event-loop pool of default clients and semaphores, so generators
+  created per batch share connections and concurrency limits
+- Optional direct aiohttp transport for chat completions (use_aiohttp)
+- Optional streamed completions that stop at the end of the JSON object
 """
 
+import functools
+import hashlib
 import json
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
+import os
+import random
+import weakref
+from typing import Any, Callable, Dict, List, MutableMapping, NamedTuple, Optional, Tuple
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+    Timeout
+)
+try:
+    import httpx
+except ImportError:  # newer openai releases are built on httpx2
+    import httpx2 as httpx
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .question_config import (
-    get_method_for_factor,
+    get_factor_info,
     get_factor_name,
     get_factor_id_from_name,
     MAX_GENERATION_RETRIES,
-    MAX_EVIDENCE_ITEMS
+    MAX_EVIDENCE_ITEMS,
+    MAX_EVIDENCE_TEXT_CHARS
 )
 from .question_prompts import (
     build_few_shot_prompt,
     build_controlled_qg_prompt,
-    format_observation_summary
+    build_batch_prompt,
+    format_observation_summary_fast,
+    normalize_observations,
+    truncate_text
 )
 from .question_validator import QuestionValidator
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size for generator clients. Concurrent generation past the
+# pool size queues on the local pool instead of the API rate limit
+DEFAULT_MAX_CONNECTIONS = 2000
+
+# Generation calls can be long (batched prompts), so allow a generous timeout
+LLM_TIMEOUT_SECONDS = 120.0
+
+# Per-host connection cap for the aiohttp transport
+AIOHTTP_LIMIT_PER_HOST = 500
+
+# Default items packed into one LLM call by generate_batch_marshaled
+DEFAULT_ROWS_PER_CALL = 6
+
+# API call retries: attempts per call, and the cap on any one backoff wait
+MAX_API_RETRIES = 3
+MAX_BACKOFF_SECONDS = 30.0
+
+# Transient failures worth retrying (timeouts are APIConnectionErrors).
+# Anything else, e.g. an auth or bad-request error, fails immediately
+_RETRYABLE_ERRORS: Tuple[type, ...] = (APIConnectionError, RateLimitError, InternalServerError)
+if HAS_AIOHTTP:
+    _RETRYABLE_ERRORS += (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+# Outputs with reasoning longer than this are validated in a worker thread,
+# so the regex checks don't stall other generations on the event loop
+THREAD_VALIDATION_CHARS = 2000
+
+# LLM responses are parsed with orjson when available. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch the stdlib type
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+
+class _PooledClient(NamedTuple):
+    """A shared default client and its semaphores, keyed by max_concurrent."""
+    client: AsyncOpenAI
+    semaphores: Dict[int, asyncio.Semaphore]
+
+
+# Default clients shared by generators running on the same event loop, keyed
+# by (model, api_key, base_url) (see _pooled_client). Clients and semaphores
+# are bound to the loop they are used on, so every loop gets its own entries,
+# dropped along with the loop
+_CLIENT_POOL: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str], Optional[str]], _PooledClient]]" = weakref.WeakKeyDictionary()
+
+
+class _JsonObjectScanner:
+    """
+    Find where the first top-level JSON object ends in streamed text.
+    
+    Tracks brace depth outside of strings, so a streamed response can be cut
+    off as soon as its closing brace arrives.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> Optional[int]:
+        """
+        Scan the next piece of text.
+        
+        Args:
+            chunk: Text following everything fed so far
+            
+        Returns:
+            Index in chunk just past the object's closing brace, or None if
+            the object is not complete yet
+        """
+        for i, ch in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return None
+
+
+def build_async_openai(
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client with a connection pool sized for generation.
+    
+    Build one client and reuse it for every call; the pool keeps connections
+    alive between requests.
+    
+    Args:
+        api_key: OpenAI API key (defaults to the environment)
+        base_url: Optional API base URL for OpenAI-compatible servers
+        max_connections: Max open connections (keep-alive pool is 75% of this)
+        
+    Returns:
+        Configured AsyncOpenAI client
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_build_http_client(max_connections)
+    )
+
+
+def _pooled_client(
+    model: str,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+) -> Optional[_PooledClient]:
+    """
+    Get the running event loop's shared default client for a model.
+    
+    Entries are keyed by model and by the API key and base URL taken from the
+    environment (as build_async_openai does), so callers with different
+    credentials or endpoints never share a client. The first caller for a key
+    creates the client, so its max_connections sizes the pool.
+    
+    Args:
+        model: Model name
+        max_connections: Connection pool size for a new client
+        
+    Returns:
+        The pooled client entry, or None outside a running event loop
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    
+    pools = _CLIENT_POOL.setdefault(loop, {})
+    api_key = os.environ.get("OPENAI_API_KEY")
+    base_url = os.environ.get("OPENAI_BASE_URL")
+    key = (model, api_key, base_url)
+    entry = pools.get(key)
+    if entry is None:
+        entry = _PooledClient(build_async_openai(api_key, base_url, max_connections), {})
+        pools[key] = entry
+    return entry
+
+
+def _build_http_client(max_connections: int) -> DefaultAsyncHttpxClient:
+    """Build the pooled HTTP client used by build_async_openai."""
+    return DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=int(max_connections * 0.75)
+        ),
+        timeout=Timeout(LLM_TIMEOUT_SECONDS)
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an LLM call error is transient (connection, rate limit, 5xx)."""
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return True
+    status = getattr(error, "status", None)  # aiohttp.ClientResponseError
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a failed LLM call.
+    
+    Honors a Retry-After header when the error carries one; otherwise uses
+    full-jitter exponential backoff so concurrent callers don't retry in
+    lockstep.
+    
+    Args:
+        error: The exception the call failed with
+        attempt: Zero-based number of the attempt that failed
+        
+    Returns:
+        Delay in seconds, at most MAX_BACKOFF_SECONDS
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if headers:
+        try:
+            return min(float(headers.get("retry-after")), MAX_BACKOFF_SECONDS)
+        except (TypeError, ValueError):
+            pass  # missing, or an HTTP date
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, 2 ** attempt))
+
+
+def _connection_limit(client: Any) -> Optional[int]:
+    """
+    Best-effort read of an AsyncOpenAI client's connection pool size.
+    
+    Args:
+        client: AsyncOpenAI client (or a stand-in)
+        
+    Returns:
+        Max connections of the client's pool, or None if it can't be read
+    """
+    pool = getattr(getattr(getattr(client, "_client", None), "_transport", None), "_pool", None)
+    limit = getattr(pool, "_max_connections", None)
+    return limit if isinstance(limit, int) else None
+
 
 class QuestionGenerator:
     """Generates clarifying questions using few-shot or controlled QG methods."""
     
     def __init__(
         self,
-        openai_client: AsyncOpenAI,
+        openai_client: Optional[AsyncOpenAI] = None,
         model: str = "gpt-4o",  # gpt-4o supports JSON mode
         temperature: float = 0.7,
-        max_tokens: int = 300
+        max_tokens: int = 300,
+        use_aiohttp: bool = False,
+        cache: Optional[MutableMapping[str, str]] = None,
+        stream: bool = False
     ):
         """
         Initialize question generator.
         
         Args:
-            openai_client: AsyncOpenAI client
+            openai_client: AsyncOpenAI client, reused for every call
+                (default: the running event loop's pooled client for this
+                model, or a new one outside a running loop)
             model: Model name to use
             temperature: Sampling temperature
             max_tokens: Max tokens for generation
+            use_aiohttp: POST chat completions directly with a shared aiohttp
+                session (using the client's API key and base URL) instead of
+                going through the OpenAI SDK. Ignored if aiohttp is missing.
+            cache: Optional mapping of request hash -> LLM response text, e.g.
+                an LRUResponseCache or a diskcache.Cache for reuse across
+                processes. Off by default: at temperature > 0 a cached answer
+                replaces a fresh sample, so only enable it for runs that
+                should be repeatable.
+            stream: Stream completions through the OpenAI client and return
+                as soon as the JSON object is complete, closing the stream
+                instead of waiting for the rest of the response
         """
+        if openai_client is None:
+            pooled = _pooled_client(model)
+            openai_client = pooled.client if pooled is not None else build_async_openai()
         self.client = openai_client
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.validator = QuestionValidator()
+        
+        if use_aiohttp and not HAS_AIOHTTP:
+            logger.warning("aiohttp is not installed; using the OpenAI client for LLM calls")
+            use_aiohttp = False
+        self.use_aiohttp = use_aiohttp
+        self._aiohttp_session = None
+        self.stream = stream
+        
+        self.cache = cache
+        self.cache_hits = 0
+        
+        # Single-flight map: identical concurrent requests share one API call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced_calls = 0
+    
+    async def aclose(self) -> None:
+        """Close the aiohttp session, if one was opened."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+    
+    async def __aenter__(self) -> "QuestionGenerator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
     async def generate_question_pair(
         self,
@@ -84,8 +375,7 @@ class QuestionGenerator:
         Raises:
             Exception: If generation fails after retries
         """
-        method = get_method_for_factor(factor_id)
-        factor_name = get_factor_name(factor_id)
+        method, factor_name, _ = get_factor_info(factor_id)
         
         logger.info(f"Generating question for prop {prop_id}, factor {factor_name} using {method}")
         
@@ -111,6 +401,96 @@ class QuestionGenerator:
             logger.error(f"Failed to generate question for prop {prop_id}, factor {factor_name}: {e}")
             raise
     
+    async def generate_question_pairs_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Generate questions for several pairs of the same factor in one LLM call.
+        
+        Entries the model omits, mangles, or (for controlled QG factors) that
+        fail validation are regenerated sequentially with
+        generate_question_pair, so they keep the usual retry behavior.
+        
+        Args:
+            items: List of dicts with prop_id, prop_text, factor_id, observations
+                and optional prop_reasoning; all must share one factor_id
+            
+        Returns:
+            List aligned with items; each entry is a result dict (same shape as
+            generate_question_pair) or the Exception that item failed with
+            
+        Raises:
+            ValueError: If items span more than one factor
+        """
+        if not items:
+            return []
+        
+        factor_id = items[0]["factor_id"]
+        if any(item["factor_id"] != factor_id for item in items):
+            raise ValueError("All items in a batch must share one factor_id")
+        
+        method, factor_name, _ = get_factor_info(factor_id)
+        
+        logger.info(f"Generating {len(items)} questions for factor {factor_name} in one batch")
+        
+        entries: List[Optional[Dict[str, str]]] = [None] * len(items)
+        if len(items) > 1:
+            prepared = [self._preprocess_observations(item["observations"]) for item in items]
+            system_prompt, user_prompt = build_batch_prompt(
+                [(item["prop_text"], summary) for item, (summary, _) in zip(items, prepared)],
+                factor_id
+            )
+            try:
+                response = await self._call_llm(
+                    system_prompt, user_prompt, max_tokens=self.max_tokens * len(items)
+                )
+                entries = self._parse_batch_response(response, len(items))
+            except Exception as e:
+                logger.warning(f"Batch generation failed for factor {factor_name}, falling back to single calls: {e}")
+        
+        results: List[Any] = [None] * len(items)
+        retry = []
+        
+        for i, (item, parsed) in enumerate(zip(items, entries)):
+            if parsed is not None and method == "controlled_qg":
+                is_valid, _ = await self._validate_output({
+                    "question": parsed["question"],
+                    "reasoning": parsed["reasoning"],
+                    "factor": factor_name,
+                    "prop_id": item["prop_id"]
+                })
+                if not is_valid:
+                    parsed = None
+            
+            if parsed is None:
+                retry.append(i)
+                continue
+            
+            results[i] = {
+                "question": parsed["question"],
+                "reasoning": parsed["reasoning"],
+                "evidence": prepared[i][1],
+                "factor": factor_name,
+                "prop_id": item["prop_id"]
+            }
+        
+        # Fallbacks run one at a time, so a batch holds at most one request in
+        # flight, as the batch call did (it often failed on a rate limit)
+        for i in retry:
+            try:
+                results[i] = await self.generate_question_pair(
+                    prop_id=items[i]["prop_id"],
+                    prop_text=items[i]["prop_text"],
+                    factor_id=factor_id,
+                    observations=items[i]["observations"],
+                    prop_reasoning=items[i].get("prop_reasoning")
+                )
+            except Exception as e:
+                results[i] = e
+        
+        return results
+    
     async def _generate_from_few_shot(
         self,
         prop_id: int,
@@ -139,7 +519,7 @@ class QuestionGenerator:
         Returns:
             Dict with question, reasoning, evidence
         """
-        observation_summary = format_observation_summary(observations)
+        observation_summary, evidence = self._preprocess_observations(observations)
         system_prompt, user_prompt = build_few_shot_prompt(
             prop_text, factor_id, observation_summary
         )
@@ -150,9 +530,6 @@ class QuestionGenerator:
         # Parse response
         parsed = self._parse_json_response(response)
         
-        # Extract evidence
-        evidence = self._extract_evidence(observations, factor_id)
-        
         result = {
             "question": parsed["question"],
             "reasoning": parsed["reasoning"],
@@ -194,8 +571,11 @@ class QuestionGenerator:
         if max_retries is None:
             max_retries = MAX_GENERATION_RETRIES
         
-        observation_summary = format_observation_summary(observations)
+        # Summary and evidence don't change between attempts
+        observation_summary, evidence = self._preprocess_observations(observations)
+        factor_name = get_factor_name(factor_id)
         validation_feedback = ""
+        use_cache = True
         
         for attempt in range(max_retries + 1):
             try:
@@ -205,16 +585,17 @@ class QuestionGenerator:
                 )
                 
                 # Call LLM
-                response = await self._call_llm(system_prompt, user_prompt)
+                response = await self._call_llm(system_prompt, user_prompt, use_cache=use_cache)
+                use_cache = True
                 
                 # Parse response
                 parsed = self._parse_json_response(response)
                 
                 # Validate
-                is_valid, errors = self.validator.validate_full_output({
+                is_valid, errors = await self._validate_output({
                     "question": parsed["question"],
                     "reasoning": parsed["reasoning"],
-                    "factor": get_factor_name(factor_id),
+                    "factor": factor_name,
                     "prop_id": prop_id
                 })
                 
@@ -223,12 +604,9 @@ class QuestionGenerator:
                     if not is_valid:
                         logger.warning(f"Final attempt for prop {prop_id} still has validation errors: {errors}")
                         # Truncate reasoning if too long
-                        if "Reasoning: " in str(errors):
+                        if any(error.startswith("Reasoning: ") for error in errors):
                             parsed["reasoning"] = self.validator.truncate_reasoning(parsed["reasoning"])
                     
-                    # Extract evidence
-                    evidence = self._extract_evidence(observations, factor_id)
-                    
                     result = {
                         "question": parsed["question"],
                         "reasoning": parsed["reasoning"],
@@ -239,58 +617,237 @@ class QuestionGenerator:
                 else:
                     # Retry with feedback
                     validation_feedback = self.validator.get_validation_feedback(errors)
+                    # No delay: the retry is a new prompt, not a resubmission
                     logger.info(f"Retrying generation for prop {prop_id} (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(0.5)  # Brief delay between retries
                     
             except Exception as e:
                 if attempt == max_retries:
                     raise
                 logger.warning(f"Attempt {attempt + 1} failed for prop {prop_id}: {e}")
+                # The same prompt must get a fresh response, not the cached one
+                use_cache = False
                 await asyncio.sleep(0.5)
         
         # Should not reach here
         raise RuntimeError(f"Failed to generate valid question after {max_retries} retries")
     
-    async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+    async def _validate_output(self, output: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
-        Call LLM with retry logic.
+        Validate a generated output, off the event loop when the reasoning is long.
+        
+        Args:
+            output: Dict with question, reasoning, factor, prop_id
+            
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        if len(output.get("reasoning") or "") > THREAD_VALIDATION_CHARS:
+            return await asyncio.to_thread(self.validator.validate_full_output, output)
+        return self.validator.validate_full_output(output)
+    
+    async def _call_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Call LLM with retry logic, serving repeat requests from the cache.
+        
+        A request identical to one already in flight waits for that call's
+        response instead of sending its own.
         
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
+            max_tokens: Token limit for this call (default: self.max_tokens)
+            use_cache: Reuse a cached or in-flight response for the same
+                request (a fresh response is cached either way)
             
         Returns:
             Response text
         """
-        max_api_retries = 3
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+        
+        key = self._request_key(system_prompt, user_prompt, max_tokens)
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+        
+        task = self._inflight.get(key) if use_cache else None
+        if task is None:
+            task = asyncio.ensure_future(self._request_llm(system_prompt, user_prompt, max_tokens))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        else:
+            self.coalesced_calls += 1
+        
+        # Shielded so one caller being cancelled doesn't cancel the others
+        response = await asyncio.shield(task)
+        
+        if self.cache is not None and self._is_json(response):
+            self.cache[key] = response
+        
+        return response
+    
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished request from the single-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
+    
+    def _request_key(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """
+        Hash everything that determines an LLM response.
+        
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            max_tokens: Token limit for the call
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        raw = json.dumps([self.model, self.temperature, max_tokens, system_prompt, user_prompt], default=str)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _is_json(response: Optional[str]) -> bool:
+        """Whether a response is valid JSON (only those are worth caching)."""
+        try:
+            _json_loads(response)
+        except (TypeError, ValueError):
+            return False
+        return True
+    
+    async def _request_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int
+    ) -> str:
+        """
+        Send one chat completion request, retrying transient API errors.
+        
+        Connection errors, timeouts, rate limits and server errors are retried
+        (up to MAX_API_RETRIES attempts) after _retry_delay; other errors are
+        raised at once.
+        
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            max_tokens: Token limit for this call
+            
+        Returns:
+            Response text
+        """
+        max_api_retries = MAX_API_RETRIES
+        
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
+        }
         
         for attempt in range(max_api_retries):
             try:
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                    response_format={"type": "json_object"}
-                )
+                if self.use_aiohttp:
+                    return await self._post_chat_completion(request)
+                
+                if self.stream:
+                    return await self._stream_chat_completion(request)
+                
+                response = await self.client.chat.completions.create(**request)
                 
                 return response.choices[0].message.content
                 
             except Exception as e:
+                if not _is_retryable(e):
+                    logger.error(f"API call failed with a non-retryable error: {e}")
+                    raise
                 if attempt == max_api_retries - 1:
                     logger.error(f"API call failed after {max_api_retries} attempts: {e}")
                     raise
                 
-                # Exponential backoff
-                wait_time = 2 ** attempt
-                logger.warning(f"API call failed (attempt {attempt + 1}/{max_api_retries}), retrying in {wait_time}s: {e}")
+                wait_time = _retry_delay(e, attempt)
+                logger.warning(f"API call failed (attempt {attempt + 1}/{max_api_retries}), retrying in {wait_time:.1f}s: {e}")
                 await asyncio.sleep(wait_time)
         
         raise RuntimeError("Should not reach here")
     
+    async def _post_chat_completion(self, request: Dict[str, Any]) -> str:
+        """
+        POST a chat completion request with the shared aiohttp session.
+        
+        Args:
+            request: Chat completions request body
+            
+        Returns:
+            Response message content
+            
+        Raises:
+            aiohttp.ClientResponseError: On a non-2xx response
+        """
+        if self._aiohttp_session is None:
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0, limit_per_host=AIOHTTP_LIMIT_PER_HOST, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=LLM_TIMEOUT_SECONDS)
+            )
+        
+        url = str(self.client.base_url).rstrip("/") + "/chat/completions"
+        headers = {"Authorization": f"Bearer {self.client.api_key}"}
+        async with self._aiohttp_session.post(url, json=request, headers=headers) as response:
+            response.raise_for_status()
+            data = await response.json()
+        
+        return data["choices"][0]["message"]["content"]
+    
+    async def _stream_chat_completion(self, request: Dict[str, Any]) -> str:
+        """
+        Stream a chat completion, stopping once the JSON object is complete.
+        
+        Args:
+            request: Chat completions request body
+            
+        Returns:
+            Response text up to the object's closing brace, or everything
+            received if the stream ends first (left for the JSON parser to
+            reject)
+        """
+        stream = await self.client.chat.completions.create(**request, stream=True)
+        scanner = _JsonObjectScanner()
+        parts = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                
+                end = scanner.feed(content)
+                if end is not None:
+                    parts.append(content[:end])
+                    break
+                parts.append(content)
+        finally:
+            await stream.close()
+        
+        return "".join(parts)
+    
     def _parse_json_response(self, response: str) -> Dict[str, str]:
         """
         Parse JSON response from LLM.
@@ -305,7 +862,7 @@ class QuestionGenerator:
             ValueError: If response is not valid JSON or missing fields
         """
         try:
-            parsed = json.loads(response)
+            parsed = _json_loads(response)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON response: {e}\nResponse: {response}")
         
@@ -320,6 +877,87 @@ class QuestionGenerator:
             "reasoning": parsed["reasoning"].strip()
         }
     
+    def _parse_batch_response(
+        self,
+        response: str,
+        expected: int
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Parse a batch JSON response into per-proposition entries.
+        
+        Args:
+            response: Response text ({"questions": [{"index", "question", "reasoning"}, ...]})
+            expected: Number of propositions in the batch
+            
+        Returns:
+            List of `expected` entries; each is a dict with question and
+            reasoning, or None where the model gave nothing usable
+            
+        Raises:
+            ValueError: If response is not valid JSON or has no questions list
+        """
+        try:
+            parsed = _json_loads(response)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON response: {e}\nResponse: {response}")
+        
+        questions = parsed.get("questions") if isinstance(parsed, dict) else None
+        if not isinstance(questions, list):
+            raise ValueError(f"Response missing 'questions' list: {parsed}")
+        
+        entries: List[Optional[Dict[str, str]]] = [None] * expected
+        for position, entry in enumerate(questions):
+            if not isinstance(entry, dict):
+                continue
+            question = entry.get("question")
+            reasoning = entry.get("reasoning")
+            if not isinstance(question, str) or not isinstance(reasoning, str):
+                continue
+            
+            # Prefer the model's 1-based index; fall back to list position
+            index = entry.get("index")
+            slot = index - 1 if isinstance(index, int) else position
+            if 0 <= slot < expected and entries[slot] is None:
+                entries[slot] = {"question": question.strip(), "reasoning": reasoning.strip()}
+        
+        return entries
+    
+    def _preprocess_observations(
+        self,
+        observations: List[Any],
+        summary_max: int = 5,
+        evidence_limit: Optional[int] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Build the prompt's observation summary and the evidence list in one pass.
+        
+        Produces the same output as format_observation_summary(observations,
+        summary_max) and _extract_evidence(observations, ..., evidence_limit),
+        reading each observation's fields once.
+        
+        Args:
+            observations: List of observation objects or dicts
+            summary_max: Max observations listed in the summary
+            evidence_limit: Max evidence items (default: MAX_EVIDENCE_ITEMS)
+            
+        Returns:
+            Tuple of (observation_summary, evidence)
+        """
+        if evidence_limit is None:
+            evidence_limit = MAX_EVIDENCE_ITEMS
+        
+        if not observations:
+            return "No specific observations provided.", []
+        
+        columns = normalize_observations(observations[:max(summary_max, evidence_limit)])
+        summary = format_observation_summary_fast(
+            columns.ids, columns.summary_texts, len(observations), summary_max
+        )
+        evidence = self._extract_evidence_fast(
+            columns.ids, columns.evidence_texts, columns.sources, evidence_limit
+        )
+        return summary, evidence
+    
     def _extract_evidence(
         self,
         observations: List[Any],
@@ -343,26 +981,39 @@ class QuestionGenerator:
         if not observations:
             return []
         
-        evidence = []
+        columns = normalize_observations(observations[:limit])
+        return self._extract_evidence_fast(
+            columns.ids, columns.evidence_texts, columns.sources, limit
+        )
+    
+    @staticmethod
+    def _extract_evidence_fast(
+        ids: List[Any],
+        texts: List[str],
+        sources: List[str],
+        limit: int
+    ) -> List[str]:
+        """
+        Build evidence citations from pre-normalized observation columns.
         
-        for obs in observations[:limit]:
-            # Handle both dict and object formats
-            if isinstance(obs, dict):
-                obs_id = obs.get('id', 'unknown')
-                obs_text = obs.get('observation_text', obs.get('text', obs.get('content', '')))
-                source = obs.get('source', 'unknown')
-            else:
-                obs_id = getattr(obs, 'id', 'unknown')
-                obs_text = getattr(obs, 'observation_text', getattr(obs, 'content', ''))
-                source = getattr(obs, 'source', 'unknown')
+        Args:
+            ids: Observation IDs (from normalize_observations)
+            texts: Matching evidence texts
+            sources: Matching sources
+            limit: Max number of observations considered
             
+        Returns:
+            List of evidence strings in format "obs_{id}: {summary}"
+        """
+        evidence = []
+        
+        for obs_id, obs_text, source in zip(ids[:limit], texts[:limit], sources[:limit]):
             # Skip placeholder observations in evidence
             if source == 'placeholder':
                 continue
             
             # Truncate long observations
-            if len(obs_text) > 100:
-                obs_text = obs_text[:100] + "..."
+            obs_text = truncate_text(obs_text, MAX_EVIDENCE_TEXT_CHARS)
             
             # Format evidence citation
             if source == 'preview':
@@ -379,20 +1030,71 @@ class BatchQuestionGenerator:
     
     def __init__(
         self,
-        openai_client: AsyncOpenAI,
+        openai_client: Optional[AsyncOpenAI] = None,
         model: str = "gpt-4",
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        max_connections: Optional[int] = None,
+        use_aiohttp: bool = False,
+        stream: bool = False
     ):
         """
         Initialize batch generator.
         
+        max_concurrent and max_connections scale together: a client whose
+        pool is smaller than max_concurrent would queue requests locally, so
+        it is copied onto a pool of max_connections.
+        
+        Without openai_client, generators created on the same event loop
+        share a pooled client (see _pooled_client) and, for equal
+        max_concurrent, one semaphore: generators created per batch reuse
+        warm connections and share one concurrency limit.
+        
         Args:
-            openai_client: AsyncOpenAI client
+            openai_client: AsyncOpenAI client (default: the pooled client)
             model: Model name
             max_concurrent: Max concurrent generations
+            max_connections: Connection pool size (default:
+                DEFAULT_MAX_CONNECTIONS, and never below max_concurrent)
+            use_aiohttp: Send LLM calls over aiohttp (see QuestionGenerator)
+            stream: Stream completions (see QuestionGenerator)
         """
-        self.generator = QuestionGenerator(openai_client, model)
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        if max_connections is None:
+            max_connections = DEFAULT_MAX_CONNECTIONS
+        max_connections = max(max_connections, max_concurrent)
+        
+        semaphore = None
+        if openai_client is None:
+            pooled = _pooled_client(model, max_connections)
+            if pooled is None:
+                openai_client = build_async_openai(max_connections=max_connections)
+            else:
+                openai_client = pooled.client
+                semaphore = pooled.semaphores.get(max_concurrent)
+                if semaphore is None:
+                    semaphore = pooled.semaphores[max_concurrent] = asyncio.Semaphore(max_concurrent)
+        
+        limit = _connection_limit(openai_client)
+        if limit is not None and limit < max_concurrent:
+            logger.info(f"Client pool of {limit} connections is below max_concurrent={max_concurrent}; using a pool of {max_connections}")
+            openai_client = openai_client.copy(http_client=_build_http_client(max_connections))
+        
+        self.max_concurrent = max_concurrent
+        self.max_connections = max_connections
+        self.generator = QuestionGenerator(
+            openai_client, model, use_aiohttp=use_aiohttp, stream=stream
+        )
+        self.semaphore = semaphore if semaphore is not None else asyncio.Semaphore(max_concurrent)
+    
+    async def aclose(self) -> None:
+        """Close the generator's aiohttp session, if one was opened."""
+        await self.generator.aclose()
+    
+    @staticmethod
+    async def aclose_all() -> None:
+        """Close the running event loop's pooled clients and drop them from the pool."""
+        pools = _CLIENT_POOL.pop(asyncio.get_running_loop(), {})
+        for pooled in pools.values():
+            await pooled.client.close()
     
     async def generate_batch(
         self,
@@ -407,10 +1109,103 @@ class BatchQuestionGenerator:
         Returns:
             List of result dicts (same order as input)
         """
-        tasks = [self._generate_with_semaphore(item) for item in items]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return await self.generate_batch_streaming(items)
+    
+    async def generate_batch_streaming(
+        self,
+        items: List[Dict[str, Any]],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate questions with a fixed pool of max_concurrent workers.
+        
+        Workers pull items from a queue, so only max_concurrent generations
+        (and their prompts) exist at once, however large the batch.
+        
+        Args:
+            items: List of dicts with prop_id, prop_text, factor_id, observations
+            on_progress: Optional callback, called as on_progress(done, total)
+                after each item finishes
+            
+        Returns:
+            List of result dicts (same order as input)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+        
+        results: List[Any] = [None] * len(items)
+        done = 0
+        
+        async def worker() -> None:
+            nonlocal done
+            while not queue.empty():
+                index, item = queue.get_nowait()
+                try:
+                    results[index] = await self._generate_with_semaphore(item)
+                except Exception as e:
+                    results[index] = e
+                done += 1
+                if on_progress is not None:
+                    on_progress(done, len(items))
+        
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrent, len(items)))))
         
-        # Convert exceptions to error dicts
+        return self._to_error_dicts(items, results)
+    
+    async def generate_batch_marshaled(
+        self,
+        items: List[Dict[str, Any]],
+        rows_per_call: int = DEFAULT_ROWS_PER_CALL
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate questions with several same-factor items packed into each LLM call.
+        
+        Items are grouped by factor_id and each group is split into calls of
+        up to rows_per_call items that share one prompt (see
+        QuestionGenerator.generate_question_pairs_batch). Larger values make
+        fewer, slower calls, which helps when the API's requests-per-minute
+        limit is the bottleneck. Calls run concurrently up to max_concurrent.
+        
+        Args:
+            items: List of dicts with prop_id, prop_text, factor_id, observations
+            rows_per_call: Max items per LLM call
+            
+        Returns:
+            List of result dicts (same order as input)
+        """
+        rows_per_call = max(1, rows_per_call)
+        
+        by_factor: Dict[int, List[int]] = {}
+        for i, item in enumerate(items):
+            by_factor.setdefault(item["factor_id"], []).append(i)
+        
+        calls = [
+            indices[start:start + rows_per_call]
+            for indices in by_factor.values()
+            for start in range(0, len(indices), rows_per_call)
+        ]
+        outcomes = await asyncio.gather(*(
+            self._generate_rows_with_semaphore([items[i] for i in call])
+            for call in calls
+        ), return_exceptions=True)
+        
+        results: List[Any] = [None] * len(items)
+        for call, outcome in zip(calls, outcomes):
+            for position, i in enumerate(call):
+                # A whole call only fails if it raised before any fallback
+                results[i] = outcome if isinstance(outcome, Exception) else outcome[position]
+        
+        return self._to_error_dicts(items, results)
+    
+    async def _generate_rows_with_semaphore(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Generate one marshaled call with semaphore for concurrency control."""
+        async with self.semaphore:
+            return await self.generator.generate_question_pairs_batch(rows)
+    
+    @staticmethod
+    def _to_error_dicts(items: List[Dict[str, Any]], results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert exceptions in results to error dicts."""
         processed_results = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -4,19 +4,21 @@ Input loading for flagged propositions from file or database.
 This module provides:
 - Loading from JSON file (flagged_propositions.json)
 - Loading from database (ClarificationAnalysis table)
+- Streaming variants (async iterators) so the engine can start generating
+  before every proposition is loaded
 - Standardized output format for processing
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterable, AsyncIterator, List, Dict, Any, Iterable, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from ..clarification_models import ClarificationAnalysis
 from ..models import Observation, Proposition, observation_proposition
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 from .question_config import get_factor_id_from_name, validate_factor_id
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,43 @@ async def load_flagged_propositions(
         raise ValueError(f"Invalid source: {source}. Must be 'file' or 'db'")
 
 
+async def iter_flagged_propositions(
+    source: str = "file",
+    file_path: Optional[str] = None,
+    db_session: Optional[AsyncSession] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream flagged propositions from file or database, one at a time.
+    
+    Yields the same dicts as load_flagged_propositions, but each one as soon
+    as it is ready (for the database, before the next proposition's
+    observations are queried). Errors surface on the first iteration.
+    
+    Args:
+        source: "file" or "db"
+        file_path: Path to JSON file (default: DEFAULT_FILE_PATH)
+        db_session: Database session (required if source="db")
+        
+    Yields:
+        Flagged proposition dicts
+        
+    Raises:
+        ValueError: If source is invalid or required params missing
+        FileNotFoundError: If file source and file doesn't exist
+    """
+    if source == "file":
+        props = _iter_from_file(file_path)
+    elif source == "db":
+        if db_session is None:
+            raise ValueError("db_session required when source='db'")
+        props = _iter_from_db(db_session)
+    else:
+        raise ValueError(f"Invalid source: {source}. Must be 'file' or 'db'")
+    
+    async for prop in props:
+        yield prop
+
+
 async def _load_from_file(file_path: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Load flagged propositions from JSON file.
@@ -77,6 +116,25 @@ async def _load_from_file(file_path: Optional[str] = None) -> List[Dict[str, Any
     Returns:
         List of proposition dicts
         
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If file is not valid JSON
+    """
+    normalized = [prop async for prop in _iter_from_file(file_path)]
+    logger.info(f"Loaded {len(normalized)} flagged propositions")
+    return normalized
+
+
+async def _iter_from_file(file_path: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream normalized flagged propositions from a JSON file.
+    
+    Args:
+        file_path: Path to JSON file (default: DEFAULT_FILE_PATH)
+        
+    Yields:
+        Proposition dicts
+        
     Raises:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
@@ -103,14 +161,10 @@ async def _load_from_file(file_path: Optional[str] = None) -> List[Dict[str, Any
         raise ValueError(f"Unexpected data format in {file_path}")
     
     # Normalize format
-    normalized = []
     for prop in propositions:
         normalized_prop = _normalize_proposition_format(prop)
         if normalized_prop:
-            normalized.append(normalized_prop)
-    
-    logger.info(f"Loaded {len(normalized)} flagged propositions")
-    return normalized
+            yield normalized_prop
 
 
 async def _load_from_db(session: AsyncSession) -> List[Dict[str, Any]]:
@@ -123,17 +177,38 @@ async def _load_from_db(session: AsyncSession) -> List[Dict[str, Any]]:
     Returns:
         List of proposition dicts
     """
+    propositions = [prop async for prop in _iter_from_db(session)]
+    logger.info(f"Loaded {len(propositions)} flagged propositions from database")
+    return propositions
+
+
+async def _iter_from_db(session: AsyncSession) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream flagged propositions from database.
+    
+    Args:
+        session: Database session
+        
+    Yields:
+        Proposition dicts
+    """
     logger.info("Loading flagged propositions from database")
     
-    # Query ClarificationAnalysis for flagged propositions
-    query = select(ClarificationAnalysis).where(
+    # Query ClarificationAnalysis for flagged propositions. The raw LLM output
+    # and evidence log are large JSON blobs the loader never reads, so leave
+    # them out of the row fetch; the proposition is loaded up front in one
+    # extra query instead of lazily per analysis.
+    query = select(ClarificationAnalysis).options(
+        defer(ClarificationAnalysis.llm_raw_output),
+        defer(ClarificationAnalysis.evidence_log),
+        selectinload(ClarificationAnalysis.proposition)
+    ).where(
         ClarificationAnalysis.needs_clarification == True
     )
     
     result = await session.execute(query)
     analyses = result.scalars().all()
     
-    propositions = []
     for analysis in analyses:
         # Get triggered factors
         triggered_factors = []
@@ -177,26 +252,10 @@ async def _load_from_db(session: AsyncSession) -> List[Dict[str, Any]]:
             "observations": observations,
             "prop_reasoning": getattr(analysis, 'reasoning_log', None),  # ClarificationAnalysis has 'reasoning_log' not 'reasoning'
             "clarification_score": analysis.clarification_score,
-            "factor_scores": {
-                "identity_mismatch": analysis.factor_1_identity,
-                "surveillance": analysis.factor_2_surveillance,
-                "inferred_intent": analysis.factor_3_intent,
-                "face_threat": analysis.factor_4_face_threat,
-                "over_positive": analysis.factor_5_over_positive,
-                "opacity": analysis.factor_6_opacity,
-                "generalization": analysis.factor_7_generalization,
-                "privacy": analysis.factor_8_privacy,
-                "actor_observer": analysis.factor_9_actor_observer,
-                "reputation_risk": analysis.factor_10_reputation,
-                "ambiguity": analysis.factor_11_ambiguity,
-                "tone_imbalance": analysis.factor_12_tone,
-            }
+            "factor_scores": analysis.get_factor_scores()
         }
         
-        propositions.append(prop_dict)
-    
-    logger.info(f"Loaded {len(propositions)} flagged propositions from database")
-    return propositions
+        yield prop_dict
 
 
 def _normalize_proposition_format(prop: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -287,16 +346,16 @@ def _normalize_proposition_format(prop: Dict[str, Any]) -> Optional[Dict[str, An
 
 def filter_propositions(
     propositions: List[Dict[str, Any]],
-    prop_ids: Optional[List[int]] = None,
-    factor_names: Optional[List[str]] = None
+    prop_ids: Optional[Iterable[int]] = None,
+    factor_names: Optional[Iterable[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Filter propositions by prop_ids and/or factor names.
     
     Args:
         propositions: List of proposition dicts
-        prop_ids: Optional list of prop IDs to include
-        factor_names: Optional list of factor names to include
+        prop_ids: Optional prop IDs to include (a set/frozenset is used as-is)
+        factor_names: Optional factor names to include (a set/frozenset is used as-is)
         
     Returns:
         Filtered list of propositions
@@ -305,12 +364,12 @@ def filter_propositions(
     
     # Filter by prop IDs
     if prop_ids:
-        prop_id_set = set(prop_ids)
+        prop_id_set = _as_set(prop_ids)
         filtered = [p for p in filtered if p["prop_id"] in prop_id_set]
     
     # Filter by factors
     if factor_names:
-        factor_set = set(factor_names)
+        factor_set = _as_set(factor_names)
         filtered = [
             p for p in filtered
             if any(f in factor_set for f in p.get("triggered_factors", []))
@@ -319,6 +378,11 @@ def filter_propositions(
     return filtered
 
 
+def _as_set(values: Iterable[Any]) -> Any:
+    """Return values as a set, reusing it when it already is a set/frozenset."""
+    return values if isinstance(values, (set, frozenset)) else set(values)
+
+
 async def _enrich_with_db_observations(
     session: AsyncSession,
     propositions: List[Dict[str, Any]]
@@ -405,3 +469,33 @@ def get_proposition_factor_pairs(
     
     return pairs
 
+
+async def iter_proposition_factor_pairs(
+    propositions: AsyncIterable[Dict[str, Any]],
+    prop_ids: Optional[Iterable[int]] = None,
+    factor_names: Optional[Iterable[str]] = None
+) -> AsyncIterator[Tuple[Dict[str, Any], str]]:
+    """
+    Stream (proposition, factor) pairs, applying filter_propositions rules.
+    
+    Args:
+        propositions: Async iterable of proposition dicts
+        prop_ids: Optional prop IDs to include
+        factor_names: Optional factor names; a proposition is kept if any of
+            its triggered factors matches, and then yields all of them
+        
+    Yields:
+        (proposition_dict, factor_name) tuples
+    """
+    prop_id_set = _as_set(prop_ids) if prop_ids else None
+    factor_set = _as_set(factor_names) if factor_names else None
+    
+    async for prop in propositions:
+        if prop_id_set is not None and prop["prop_id"] not in prop_id_set:
+            continue
+        triggered = prop.get("triggered_factors", [])
+        if factor_set is not None and not any(f in factor_set for f in triggered):
+            continue
+        
+        for factor_name in triggered:
+            yield prop, factor_name
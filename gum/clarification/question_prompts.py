@@ -4,11 +4,44 @@ Prompt templates and few-shot examples for clarifying question generation.
 This module provides:
 - Few-shot examples for factors 3, 6, 8, 11
 - Controlled QG prompt templates
-- Functions to build prompts dynamically
+- Batch prompt template (several propositions sharing one factor)
+- Functions to build prompts dynamically (per-factor parts cached)
+- Proposition name normalization ("Arnav is" -> "you are"), configurable
 """
 
-from typing import Dict, List, Any
-from .question_config import get_factor_description
+import functools
+import re
+from typing import Dict, List, Any, NamedTuple, Optional, Sequence
+from .question_config import (
+    get_factor_description,
+    MAX_SUMMARY_TEXT_CHARS,
+    TRUNCATION_SUFFIX
+)
+
+
+class ObservationColumns(NamedTuple):
+    """Observation fields as parallel lists (see normalize_observations)."""
+    ids: List[Any]
+    summary_texts: List[str]
+    evidence_texts: List[str]
+    sources: List[str]
+
+
+# Names rewritten to "you" in prompts (see set_user_names)
+DEFAULT_USER_NAMES = ("Arnav Sharma", "Arnav")
+
+# Replacements for a single-word name followed by one of these suffixes
+_NAME_SUFFIX_REPLACEMENTS = {
+    "'s": "your",
+    " is": "you are",
+    " has": "you have",
+    " was": "you were",
+}
+
+# Fused name pattern, compiled by set_user_names
+_NAME_RE: Optional["re.Pattern[str]"] = None
+
+_YOU_YOU_RE = re.compile(r"\byou you\b", re.IGNORECASE)
 
 
 # Few-shot examples for factors that use this method
@@ -18,19 +51,19 @@ FEW_SHOT_EXAMPLES: Dict[int, List[Dict[str, Any]]] = {
             "prop": "You value communication with friends and professional contacts, as evidenced by multiple messaging sessions.",
             "question": "When you messaged those contacts, was it mostly to coordinate plans or to socialize?",
             "reasoning": "This proposition infers motive from messaging patterns; clarifying confirms the actual intent.",
-            "evidence": ["obs_451: multiple WhatsApp Web sessions on 2025-09-29", "obs_452: opened chat with 3 different contacts"]
+            "evidence": ["[451]multiple WhatsApp Web sessions on 2025-09-29", "[452]opened chat with 3 different contacts"]
         },
         {
             "prop": "You are interested in improving documentation quality based on repeated editing of README files.",
             "question": "When you edited those README files, were you improving documentation or working on something else?",
             "reasoning": "This assumes motivation from file edits; asking confirms whether documentation was the actual goal.",
-            "evidence": ["obs_203: edited README.md multiple times", "obs_204: opened documentation folder"]
+            "evidence": ["[203]edited README.md multiple times", "[204]opened documentation folder"]
         },
         {
             "prop": "You prioritize learning new technologies, as shown by browsing technical documentation sites.",
             "question": "When you browsed those technical sites, were you learning something new or troubleshooting a specific problem?",
             "reasoning": "This infers learning intent from browsing; clarifying distinguishes between learning and problem-solving.",
-            "evidence": ["obs_312: visited React documentation", "obs_313: browsed Python tutorials"]
+            "evidence": ["[312]visited React documentation", "[313]browsed Python tutorials"]
         }
     ],
     6: [  # Opacity
@@ -58,19 +91,19 @@ FEW_SHOT_EXAMPLES: Dict[int, List[Dict[str, Any]]] = {
             "prop": "You are editing a document titled 'Personal Health Goals 2025' with specific medical information.",
             "question": "Would you prefer to discuss this more privately, or is this detail level okay?",
             "reasoning": "This touches sensitive health domains; asking checks consent level.",
-            "evidence": ["obs_176: editing document with health information"]
+            "evidence": ["[176]editing document with health information"]
         },
         {
             "prop": "You have been reviewing financial statements and bank account details in multiple spreadsheets.",
             "question": "Would you prefer we keep this level of financial detail in observations, or generalize it?",
             "reasoning": "Financial information is sensitive; asking confirms appropriate privacy boundaries.",
-            "evidence": ["obs_289: opened banking spreadsheet", "obs_290: reviewed account balances"]
+            "evidence": ["[289]opened banking spreadsheet", "[290]reviewed account balances"]
         },
         {
             "prop": "You had a conversation with a therapist about relationship difficulties, as captured in calendar events.",
             "question": "This touches on personal matters. Would you like us to exclude this type of information from observations?",
             "reasoning": "Relationship and therapy contexts are highly sensitive; asking respects privacy preferences.",
-            "evidence": ["obs_401: calendar event with therapist", "obs_402: relationship discussion notes"]
+            "evidence": ["[401]calendar event with therapist", "[402]relationship discussion notes"]
         }
     ],
     11: [  # Ambiguity
@@ -116,6 +149,7 @@ Guidelines:
 - Be specific but respectful
 - Ask about the actual claim/behavior, not about the system's method or process
 
+Observations are listed as [id]text, separated by " | ".
 Factor: {factor_description}
 Proposition: {proposition_text}
 Observations: {observation_summary}
@@ -149,6 +183,7 @@ Below are examples of good clarifying questions for similar cases:
 
 Now generate a similar clarifying question for the following:
 
+Observations are listed as [id]text, separated by " | ".
 Factor: {factor_description}
 Proposition: {proposition_text}
 Observations: {observation_summary}
@@ -166,6 +201,100 @@ FEW_SHOT_USER_PROMPT = """Return JSON with exactly this structure:
 }}"""
 
 
+# Batch system prompt template: several propositions that share one factor
+BATCH_SYSTEM_PROMPT = """You are generating clarifying questions for several flagged propositions that share the same factor.
+
+Each proposition is a statement the SYSTEM made about the user, not something the user said.
+
+IMPORTANT: For each proposition, ask the user directly about THE CLAIM IN THE PROPOSITION, not about how the system determined it.
+- Always address the user as "you" - if a proposition mentions a name, convert it to "you"/"your"
+- DO NOT ask about "how the system determined" or "the system's observation"
+- DO NOT reference "the system" in your questions
+- DO ask the user to confirm, clarify, or correct THE ACTUAL CLAIM
+- Ask ONE neutral, polite, non-judgmental question per proposition
+- Treat each proposition independently
+
+{examples}Observations are listed as [id]text, separated by " | ".
+Factor: {factor_description}
+
+{propositions}
+
+For each proposition, generate a clarifying question and a brief reasoning (≤30 words) explaining why you asked.
+"""
+
+
+# Batch user prompt (not formatted, so braces are literal)
+BATCH_USER_PROMPT = """Return JSON with exactly this structure, one entry per proposition, in order:
+{
+    "questions": [
+        {"index": 1, "question": "your clarifying question here", "reasoning": "your brief reasoning here (≤30 words)"}
+    ]
+}"""
+
+
+# Per-factor system prompt templates, filled in on first use. Only the
+# {proposition_text} and {observation_summary} placeholders remain
+_FEW_SHOT_TEMPLATE_CACHE: Dict[int, str] = {}
+_CONTROLLED_TEMPLATE_CACHE: Dict[int, str] = {}
+
+# Formatted few-shot examples per factor (see format_few_shot_examples)
+_FORMATTED_EXAMPLES_CACHE: Dict[int, str] = {}
+
+
+def _escape_braces(text: str) -> str:
+    """Escape braces so text survives a later str.format call unchanged."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _few_shot_template(factor_id: int) -> str:
+    """
+    Get the few-shot system prompt for a factor with examples filled in.
+    
+    Args:
+        factor_id: The factor ID
+        
+    Returns:
+        Template with {proposition_text} and {observation_summary} placeholders
+        
+    Raises:
+        ValueError: If factor doesn't use few-shot method
+    """
+    template = _FEW_SHOT_TEMPLATE_CACHE.get(factor_id)
+    if template is None:
+        template = FEW_SHOT_SYSTEM_PROMPT.format(
+            examples=_escape_braces(format_few_shot_examples(factor_id)),
+            factor_description=_escape_braces(get_factor_description(factor_id)),
+            proposition_text="{proposition_text}",
+            observation_summary="{observation_summary}"
+        )
+        _FEW_SHOT_TEMPLATE_CACHE[factor_id] = template
+    return template
+
+
+def _controlled_qg_template(factor_id: int) -> str:
+    """
+    Get the controlled QG system prompt for a factor with its description filled in.
+    
+    Args:
+        factor_id: The factor ID
+        
+    Returns:
+        Template with {proposition_text} and {observation_summary} placeholders
+        
+    Raises:
+        ValueError: If factor_id is not in valid range
+    """
+    template = _CONTROLLED_TEMPLATE_CACHE.get(factor_id)
+    if template is None:
+        template = CONTROLLED_QG_SYSTEM_PROMPT.format(
+            factor_description=_escape_braces(get_factor_description(factor_id)),
+            proposition_text="{proposition_text}",
+            observation_summary="{observation_summary}"
+        )
+        _CONTROLLED_TEMPLATE_CACHE[factor_id] = template
+    return template
+
+
 def get_few_shot_examples(factor_id: int) -> List[Dict[str, Any]]:
     """
     Get few-shot examples for a factor.
@@ -188,27 +317,38 @@ def format_few_shot_examples(factor_id: int) -> str:
     """
     Format few-shot examples as a string for prompt inclusion.
     
+    FEW_SHOT_EXAMPLES is static, so each factor is formatted once and cached.
+    
     Args:
         factor_id: The factor ID
         
     Returns:
         Formatted examples string
+        
+    Raises:
+        ValueError: If factor doesn't use few-shot method
     """
-    examples = get_few_shot_examples(factor_id)
-    formatted = []
-    
-    for i, ex in enumerate(examples, 1):
-        example_text = f"""Example {i}:
-Proposition: "{ex['prop']}"
-Question: "{ex['question']}"
-Reasoning: "{ex['reasoning']}"
-"""
-        if ex.get('evidence'):
-            evidence_str = ", ".join(ex['evidence'])
-            example_text += f"Evidence: [{evidence_str}]\n"
-        formatted.append(example_text)
-    
-    return "\n".join(formatted)
+    formatted = _FORMATTED_EXAMPLES_CACHE.get(factor_id)
+    if formatted is None:
+        formatted = "\n".join(
+            _format_example(i, ex)
+            for i, ex in enumerate(get_few_shot_examples(factor_id), 1)
+        )
+        _FORMATTED_EXAMPLES_CACHE[factor_id] = formatted
+    return formatted
+
+
+def _format_example(number: int, example: Dict[str, Any]) -> str:
+    """Format one few-shot example, with its evidence line if it has any."""
+    text = (
+        f"Example {number}:\n"
+        f"Proposition: \"{example['prop']}\"\n"
+        f"Question: \"{example['question']}\"\n"
+        f"Reasoning: \"{example['reasoning']}\"\n"
+    )
+    if example.get('evidence'):
+        text += f"Evidence: {' | '.join(example['evidence'])}\n"
+    return text
 
 
 def build_few_shot_prompt(
@@ -227,15 +367,10 @@ def build_few_shot_prompt(
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
-    factor_description = get_factor_description(factor_id)
-    examples = format_few_shot_examples(factor_id)
-    
     # Normalize proposition text to use "you" instead of names
     normalized_prop = normalize_proposition_for_prompt(prop_text)
     
-    system_prompt = FEW_SHOT_SYSTEM_PROMPT.format(
-        examples=examples,
-        factor_description=factor_description,
+    system_prompt = _few_shot_template(factor_id).format(
         proposition_text=normalized_prop,
         observation_summary=observation_summary
     )
@@ -261,13 +396,10 @@ def build_controlled_qg_prompt(
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
-    factor_description = get_factor_description(factor_id)
-    
     # Normalize proposition text to use "you" instead of names
     normalized_prop = normalize_proposition_for_prompt(prop_text)
     
-    system_prompt = CONTROLLED_QG_SYSTEM_PROMPT.format(
-        factor_description=factor_description,
+    system_prompt = _controlled_qg_template(factor_id).format(
         proposition_text=normalized_prop,
         observation_summary=observation_summary
     )
@@ -279,11 +411,88 @@ def build_controlled_qg_prompt(
     return system_prompt, CONTROLLED_QG_USER_PROMPT
 
 
+def build_batch_prompt(
+    items: List[tuple[str, str]],
+    factor_id: int
+) -> tuple[str, str]:
+    """
+    Build one prompt (system + user) covering several propositions for a factor.
+    
+    Few-shot factors include their examples, as in build_few_shot_prompt.
+    
+    Args:
+        items: List of (prop_text, observation_summary) tuples, numbered from 1
+        factor_id: The factor ID shared by every proposition
+        
+    Returns:
+        Tuple of (system_prompt, user_prompt)
+    """
+    factor_description = get_factor_description(factor_id)
+    
+    examples = ""
+    if factor_id in FEW_SHOT_EXAMPLES:
+        examples = (
+            "Below are examples of good clarifying questions for similar cases:\n\n"
+            f"{format_few_shot_examples(factor_id)}\n"
+        )
+    
+    propositions = "\n\n".join(
+        f"Proposition {i}: {normalize_proposition_for_prompt(prop_text)}\n"
+        f"Observations for proposition {i}:\n{observation_summary}"
+        for i, (prop_text, observation_summary) in enumerate(items, 1)
+    )
+    
+    system_prompt = BATCH_SYSTEM_PROMPT.format(
+        examples=examples,
+        factor_description=factor_description,
+        propositions=propositions
+    )
+    
+    return system_prompt, BATCH_USER_PROMPT
+
+
+def set_user_names(names: Sequence[str]) -> None:
+    """
+    Set the user's names that prompts rewrite to "you".
+    
+    The fused pattern is compiled here, once, rather than per proposition.
+    Multi-word names (e.g. a full name) become "you"; single-word names also
+    absorb a following "'s", "is", "has" or "was" ("your", "you are", ...).
+    
+    Args:
+        names: User names, e.g. ("Arnav Sharma", "Arnav")
+    """
+    global _NAME_RE
+    
+    full_names = sorted((n for n in names if " " in n.strip()), key=len, reverse=True)
+    first_names = sorted((n for n in names if n.strip() and " " not in n.strip()), key=len, reverse=True)
+    
+    alternatives = []
+    if full_names:
+        alternatives.append(r"\b(?:" + "|".join(re.escape(n.strip()) for n in full_names) + r")\b")
+    if first_names:
+        alternatives.append(
+            r"\b(?:" + "|".join(re.escape(n) for n in first_names) + r")"
+            r"(?P<suffix>'s| is| has| was)?\b"
+        )
+    _NAME_RE = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+
+def _replace_name(match: "re.Match[str]") -> str:
+    """Replacement for one _NAME_RE match."""
+    suffix = match.group("suffix")
+    return _NAME_SUFFIX_REPLACEMENTS[suffix.lower()] if suffix else "you"
+
+
+set_user_names(DEFAULT_USER_NAMES)
+
+
 def normalize_proposition_for_prompt(prop_text: str) -> str:
     """
     Normalize proposition text for prompts - convert names to "you".
     
     This helps ensure questions are directed at the user, not about them in third person.
+    The names come from set_user_names (default: DEFAULT_USER_NAMES).
     
     Args:
         prop_text: Original proposition text (may contain names)
@@ -291,31 +500,14 @@ def normalize_proposition_for_prompt(prop_text: str) -> str:
     Returns:
         Normalized text with names converted to "you"/"your"
     """
-    # Common patterns to replace
-    # "Arnav Sharma" -> "you"
-    # "Arnav's" -> "your"
-    # "Arnav is" -> "you are"
-    # "Arnav has" -> "you have"
-    # "Arnav was" -> "you were"
-    # "Arnav" -> "you" (standalone)
-    
-    normalized = prop_text
+    # "Arnav Sharma" -> "you", "Arnav's" -> "your", "Arnav is" -> "you are",
+    # "Arnav has" -> "you have", "Arnav was" -> "you were", "Arnav" -> "you"
+    if _NAME_RE is None:
+        return prop_text
+    normalized = _NAME_RE.sub(_replace_name, prop_text)
     
-    # Replace common name patterns
-    import re
-    
-    # "Arnav Sharma" or just "Arnav" (but not if followed by apostrophe - handle separately)
-    normalized = re.sub(r'\bArnav Sharma\b', 'you', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\bArnav\'s\b', "your", normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\bArnav is\b', 'you are', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\bArnav has\b', 'you have', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\bArnav was\b', 'you were', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\bArnav\b', 'you', normalized, flags=re.IGNORECASE)
-    
-    # Fix any awkward "you you" cases from multiple replacements
-    normalized = re.sub(r'\byou you\b', 'you', normalized, flags=re.IGNORECASE)
-    
-    return normalized
+    # Fix any awkward "you you" cases from the replacements
+    return _YOU_YOU_RE.sub("you", normalized)
 
 
 def format_observation_summary(observations: List[Any], max_obs: int = 5) -> str:
@@ -332,24 +524,98 @@ def format_observation_summary(observations: List[Any], max_obs: int = 5) -> str
     if not observations:
         return "No specific observations provided."
     
-    summaries = []
-    for i, obs in enumerate(observations[:max_obs], 1):
+    columns = normalize_observations(observations[:max_obs])
+    return format_observation_summary_fast(
+        columns.ids, columns.summary_texts, len(observations), max_obs
+    )
+
+
+def format_observation_summary_fast(
+    ids: Sequence[Any],
+    texts: Sequence[str],
+    total: int,
+    max_obs: int = 5
+) -> str:
+    """
+    Format pre-normalized observations for prompt inclusion.
+    
+    Same output as format_observation_summary, without per-item type checks.
+    
+    Args:
+        ids: Observation IDs (from normalize_observations)
+        texts: Matching summary texts
+        total: Number of observations before any slicing (for the "more" line)
+        max_obs: Maximum number of observations to include
+        
+    Returns:
+        Formatted observation summary string
+    """
+    if not total:
+        return "No specific observations provided."
+    
+    # Compact "[id]text | [id]text" form (explained once in the system
+    # prompts) keeps the per-proposition prompt tokens down
+    summary = " | ".join(
+        f"[{obs_id}]{truncate_text(text, MAX_SUMMARY_TEXT_CHARS)}"
+        for obs_id, text in zip(ids[:max_obs], texts[:max_obs])
+    )
+    
+    if total > max_obs:
+        summary += f" | (+{total - max_obs} more)"
+    
+    return summary
+
+
+def normalize_observations(observations: Sequence[Any]) -> ObservationColumns:
+    """
+    Read the prompt-relevant fields of each observation once, into parallel lists.
+    
+    Observations may be dicts or objects. Summaries use observation_text (or
+    text); evidence also falls back to content.
+    
+    Args:
+        observations: List of observation dicts or objects
+        
+    Returns:
+        ObservationColumns(ids, summary_texts, evidence_texts, sources)
+    """
+    columns = ObservationColumns([], [], [], [])
+    for obs in observations:
         # Handle both dict and object formats
         if isinstance(obs, dict):
-            obs_id = obs.get('id', 'unknown')
-            obs_text = obs.get('observation_text', obs.get('text', ''))
+            columns.ids.append(obs.get('id', 'unknown'))
+            columns.summary_texts.append(obs.get('observation_text', obs.get('text', '')))
+            columns.evidence_texts.append(obs.get('observation_text', obs.get('text', obs.get('content', ''))))
+            columns.sources.append(obs.get('source', 'unknown'))
         else:
-            obs_id = getattr(obs, 'id', 'unknown')
-            obs_text = getattr(obs, 'observation_text', '')
-        
-        # Truncate long observations
-        if len(obs_text) > 150:
-            obs_text = obs_text[:150] + "..."
-        
-        summaries.append(f"  - obs_{obs_id}: {obs_text}")
+            columns.ids.append(getattr(obs, 'id', 'unknown'))
+            columns.summary_texts.append(getattr(obs, 'observation_text', ''))
+            columns.evidence_texts.append(getattr(obs, 'observation_text', getattr(obs, 'content', '')))
+            columns.sources.append(getattr(obs, 'source', 'unknown'))
+    return columns
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Cut text to at most max_chars characters, marking the cut with TRUNCATION_SUFFIX.
     
-    if len(observations) > max_obs:
-        summaries.append(f"  ... and {len(observations) - max_obs} more observations")
+    Text that already fits is returned as is, without copying. The suffix
+    counts toward max_chars.
     
-    return "\n".join(summaries)
+    Args:
+        text: Text to truncate
+        max_chars: Max characters in the result
+        
+    Returns:
+        The text, or a prefix of it ending in the suffix
+    """
+    if len(text) <= max_chars:
+        return text
+    return _truncate_long_text(text, max_chars)
+
+
+@functools.lru_cache(maxsize=4096)
+def _truncate_long_text(text: str, max_chars: int) -> str:
+    """Truncate text known to be too long; cached, as one observation recurs across pairs."""
+    return f"{text[:max(0, max_chars - len(TRUNCATION_SUFFIX))]}{TRUNCATION_SUFFIX}"
 
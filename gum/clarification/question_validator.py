@@ -5,6 +5,7 @@ This module provides:
 - Question validation (single focus, non-leading, polite tone, length)
 - Reasoning validation (word count, content checks)
 - Evidence validation (format, existence)
+- Quick check that accepts clean outputs without building error lists
 - Reasoning truncation helper
 """
 
@@ -17,6 +18,11 @@ from .question_config import (
     MAX_QUESTION_LENGTH,
 )
 
+# Accept both numeric IDs (obs_123) and string IDs (obs_preview_780_0, obs_abc)
+_EVIDENCE_RE = re.compile(r"^obs_([\w_]+):\s*.+")
+_COMMAND_RE = re.compile(r"^(tell me|explain|describe|clarify)\s", re.IGNORECASE)
+_PLACEHOLDERS = ("todo", "tbd", "placeholder", "insert reasoning")
+
 
 class QuestionValidator:
     """Validates generated clarifying questions and reasoning."""
@@ -61,6 +67,55 @@ class QuestionValidator:
         self.reject_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.REJECT_PATTERNS]
         self.politeness_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.POLITENESS_INDICATORS]
         self.system_reference_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.SYSTEM_REFERENCE_PATTERNS]
+        
+        # Single alternations for quick_check: one scan instead of one per pattern
+        self._any_rejected = re.compile(
+            "|".join(self.REJECT_PATTERNS + self.SYSTEM_REFERENCE_PATTERNS), re.IGNORECASE
+        )
+        self._any_polite = re.compile("|".join(self.POLITENESS_INDICATORS), re.IGNORECASE)
+    
+    def quick_check(self, output: Dict[str, Any]) -> bool:
+        """
+        Cheaply check whether an output passes every validation rule.
+        
+        Runs the same rules as validate_full_output but stops at the first
+        problem and builds no error messages. True means validate_full_output
+        would return (True, []); False means run it to find out why.
+        
+        Args:
+            output: Output dict with question, reasoning, evidence, etc.
+            
+        Returns:
+            True if the output is valid with no warnings
+        """
+        question = output.get("question")
+        reasoning = output.get("reasoning")
+        if not isinstance(question, str) or not isinstance(reasoning, str):
+            return False
+        if "factor" not in output or "prop_id" not in output:
+            return False
+        
+        question = question.strip()
+        if not MIN_QUESTION_LENGTH <= len(question) <= MAX_QUESTION_LENGTH:
+            return False
+        if question.count("?") != 1:
+            return False
+        if self._any_rejected.search(question) or not self._any_polite.search(question):
+            return False
+        if _COMMAND_RE.search(question) and not question.endswith("?"):
+            return False
+        
+        # Soft reasoning warnings also fail full validation, so stay within them
+        if not 5 <= len(reasoning.split()) <= MAX_REASONING_WORDS:
+            return False
+        lowered = reasoning.lower()
+        if any(placeholder in lowered for placeholder in _PLACEHOLDERS):
+            return False
+        
+        evidence = output.get("evidence")
+        if evidence:
+            return all(isinstance(ev, str) and _EVIDENCE_RE.match(ev.strip()) for ev in evidence)
+        return True
     
     def validate_question(self, question: str) -> Tuple[bool, List[str]]:
         """
@@ -200,8 +255,7 @@ class QuestionValidator:
             return True, []
         
         # Check format of each evidence item
-        # Accept both numeric IDs (obs_123) and string IDs (obs_preview_780_0, obs_abc)
-        evidence_pattern = re.compile(r"^obs_([\w_]+):\s*.+")
+        evidence_pattern = _EVIDENCE_RE
         
         for i, ev in enumerate(evidence):
             if not ev or not ev.strip():
@@ -244,6 +298,10 @@ class QuestionValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        # Most generated outputs are clean; skip the per-rule error collection
+        if self.quick_check(output):
+            return True, []
+        
         all_errors = []
         
         # Check required fields
@@ -19,6 +19,39 @@ from sqlalchemy.sql import func
 from .models import Base, Proposition
 
 
+# Per-factor score columns of ClarificationAnalysis, in factor-id order (1-12)
+FACTOR_SCORE_COLUMNS = (
+    "factor_1_identity",
+    "factor_2_surveillance",
+    "factor_3_intent",
+    "factor_4_face_threat",
+    "factor_5_over_positive",
+    "factor_6_opacity",
+    "factor_7_generalization",
+    "factor_8_privacy",
+    "factor_9_actor_observer",
+    "factor_10_reputation",
+    "factor_11_ambiguity",
+    "factor_12_tone",
+)
+
+# Factor names matching FACTOR_SCORE_COLUMNS
+FACTOR_SCORE_NAMES = (
+    "identity_mismatch",
+    "surveillance",
+    "inferred_intent",
+    "face_threat",
+    "over_positive",
+    "opacity",
+    "generalization",
+    "privacy",
+    "actor_observer",
+    "reputation_risk",
+    "ambiguity",
+    "tone_imbalance",
+)
+
+
 class ClarifyingQuestion(Base):
     """Stores generated clarifying questions for propositions.
     
@@ -162,7 +195,7 @@ class ClarificationAnalysis(Base):
     )
     
     # Overall decision
-    needs_clarification: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    needs_clarification: Mapped[bool] = mapped_column(Boolean, nullable=False, index=True)
     clarification_score: Mapped[float] = mapped_column(Float, nullable=False)
     
     # Per-factor scores (all 12 factors, each 0.0-1.0)
@@ -210,22 +243,19 @@ class ClarificationAnalysis(Base):
             f"needs_clarification={self.needs_clarification})>"
         )
     
+    @property
+    def factor_scores(self) -> list[float]:
+        """All 12 factor scores as a vector, in factor-id order."""
+        return [getattr(self, column) for column in FACTOR_SCORE_COLUMNS]
+    
+    @factor_scores.setter
+    def factor_scores(self, scores: list[float]) -> None:
+        for column, score in zip(FACTOR_SCORE_COLUMNS, scores, strict=True):
+            setattr(self, column, score)
+    
     def get_factor_scores(self) -> dict[str, float]:
         """Return all 12 factor scores as a dictionary."""
-        return {
-            "identity_mismatch": self.factor_1_identity,
-            "surveillance": self.factor_2_surveillance,
-            "inferred_intent": self.factor_3_intent,
-            "face_threat": self.factor_4_face_threat,
-            "over_positive": self.factor_5_over_positive,
-            "opacity": self.factor_6_opacity,
-            "generalization": self.factor_7_generalization,
-            "privacy": self.factor_8_privacy,
-            "actor_observer": self.factor_9_actor_observer,
-            "reputation_risk": self.factor_10_reputation,
-            "ambiguity": self.factor_11_ambiguity,
-            "tone_imbalance": self.factor_12_tone,
-        }
+        return dict(zip(FACTOR_SCORE_NAMES, self.factor_scores))
     
     def get_top_factors(self, n: int = 3) -> list[tuple[str, float]]:
         """Return the top N factors by score."""
@@ -2,9 +2,10 @@
 Configuration management for Conversational GUM Refinement system.
 """
 
+import functools
 import os
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 @dataclass 
 class DecisionConfig:
@@ -50,7 +51,21 @@ class ClarificationConfig:
     shadow_mode: bool = True  # Collect data but don't route to Gates yet
     threshold: float = 0.6  # Aggregate score threshold for flagging
     model: str = "gpt-4-turbo"  # LLM model to use
+    # Cheaper models tried before `model` (opt-in, e.g. ["gpt-4o-mini"]);
+    # escalate only when their score is inside the ambiguity band or
+    # validation quality is low
+    cascade_models: List[str] = field(default_factory=list)
+    cascade_ambiguity_band: Tuple[float, float] = (0.4, 0.7)
     temperature: float = 0.1  # Low temperature for consistency
+    stream_responses: bool = True  # Stream LLM output and abort early on non-JSON
+    prefilter_enabled: bool = True  # Skip the LLM for high-confidence propositions with no cues
+    prefilter_min_confidence: int = 8  # GUM confidence (1-10) required to skip the LLM
+    cache_enabled: bool = False  # Reuse analyses of repeated propositions with the same observations
+    cache_semantic: bool = False  # Also match paraphrases by embedding (needs sentence-transformers)
+    cache_threshold: float = 0.95  # Cosine similarity required for a semantic cache hit
+    cache_max_entries: int = 2048  # LRU capacity per (model, prompt version)
+    concurrency: int = 16  # Max (proposition, factor) pairs the question engine generates at once
+    question_batch_size: int = 1  # Same-factor pairs per question-generation LLM call (1 = no batching)
 
 
 @dataclass
@@ -90,6 +105,21 @@ class GumConfig:
             self.clarification.shadow_mode = os.getenv('CLARIFICATION_SHADOW_MODE').lower() == 'true'
         if os.getenv('CLARIFICATION_MODEL'):
             self.clarification.model = os.getenv('CLARIFICATION_MODEL')
+        if os.getenv('CLARIFICATION_CASCADE_MODELS') is not None:
+            # Comma-separated; empty disables the cascade
+            self.clarification.cascade_models = [
+                m.strip() for m in os.getenv('CLARIFICATION_CASCADE_MODELS').split(',') if m.strip()
+            ]
+        if os.getenv('CLARIFICATION_PREFILTER_ENABLED'):
+            self.clarification.prefilter_enabled = os.getenv('CLARIFICATION_PREFILTER_ENABLED').lower() == 'true'
+        if os.getenv('CLARIFICATION_CACHE_ENABLED'):
+            self.clarification.cache_enabled = os.getenv('CLARIFICATION_CACHE_ENABLED').lower() == 'true'
+        if os.getenv('CLARIFICATION_CACHE_SEMANTIC'):
+            self.clarification.cache_semantic = os.getenv('CLARIFICATION_CACHE_SEMANTIC').lower() == 'true'
+        if os.getenv('CLARIFICATION_CONCURRENCY'):
+            self.clarification.concurrency = int(os.getenv('CLARIFICATION_CONCURRENCY'))
+        if os.getenv('CLARIFICATION_QUESTION_BATCH_SIZE'):
+            self.clarification.question_batch_size = int(os.getenv('CLARIFICATION_QUESTION_BATCH_SIZE'))
             
     @classmethod
     def load_from_dict(cls, config_dict: Dict) -> 'GumConfig':
@@ -113,5 +143,15 @@ class GumConfig:
                     
         return config
 
-# Global default configuration
-DEFAULT_CONFIG = GumConfig()
+@functools.cache
+def default_config() -> GumConfig:
+    """Return the shared default configuration, built on first use."""
+    return GumConfig()
+
+
+def __getattr__(name: str):
+    # Keep ``DEFAULT_CONFIG`` importable without constructing it (and reading
+    # the environment) at module import time.
+    if name == "DEFAULT_CONFIG":
+        return default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -250,4 +250,34 @@ async def get_related_observations(
         .limit(limit)
     )
     result = await session.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+    return result.scalars().all()
+
+
+async def get_related_observation_summaries(
+    session: AsyncSession,
+    proposition_id: int,
+    *,
+    limit: int = 5,
+    max_chars: int = 200,
+) -> list:
+    """Return ``(id, observer_name, content)`` rows for a proposition's observations.
+
+    Unlike ``get_related_observations`` this does not load ORM objects, and
+    ``content`` is cut to ``max_chars + 1`` characters in SQL, so prompt
+    builders only transfer what they render. A ``content`` longer than
+    ``max_chars`` means the observation was truncated.
+    """
+    stmt = (
+        select(
+            Observation.id,
+            Observation.observer_name,
+            func.substr(Observation.content, 1, max_chars + 1).label("content"),
+        )
+        .join(observation_proposition)
+        .join(Proposition)
+        .where(Proposition.id == proposition_id)
+        .order_by(Observation.created_at.desc())
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return result.all()
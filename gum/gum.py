@@ -13,7 +13,6 @@ from typing import Callable, List
 from .models import observation_proposition
 import traceback
 
-from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import insert
 
@@ -35,6 +34,8 @@ from gum.prompts.gum import AUDIT_PROMPT, PROPOSE_PROMPT, REVISE_PROMPT, SIMILAR
 from .batcher import ObservationBatcher
 from .config import GumConfig
 from .clarification import ClarificationDetector
+from .clarification.detector import create_openai_client
+from .clarification.analysis_cache import SemanticAnalysisCache
 
 class gum:
     """A class for managing general user models.
@@ -105,7 +106,8 @@ class gum:
         self.revise_prompt = revise_prompt or REVISE_PROMPT
         self.audit_prompt = audit_prompt or AUDIT_PROMPT
 
-        self.client = AsyncOpenAI(
+        # One pooled keep-alive client for every LLM call this instance makes
+        self.client = create_openai_client(
             base_url=api_base or os.getenv("GUM_LM_API_BASE"), 
             api_key=api_key or os.getenv("GUM_LM_API_KEY") or os.getenv("OPENAI_API_KEY") or "None"
         )
@@ -131,6 +133,8 @@ class gum:
         self.config = config or GumConfig()
         self.decision_engine = None
         self.attention_monitor = None
+        self._clarification_cache: SemanticAnalysisCache | None = None
+        self._clarification_detector: ClarificationDetector | None = None
 
     def start_update_loop(self):
         """Start the asynchronous update loop for processing observer updates."""
@@ -552,35 +556,44 @@ class gum:
         
         self.logger.info(f"Running clarification detection on {len(propositions)} propositions...")
         
-        # Initialize detector
-        detector = ClarificationDetector(self.client, self.config)
+        # Keep one detector (and analysis cache) for the lifetime of this gum
+        # instance so repeated propositions skip the LLM call
+        if self._clarification_detector is None:
+            clarification_config = self.config.clarification
+            if clarification_config.cache_enabled:
+                self._clarification_cache = SemanticAnalysisCache(
+                    threshold=clarification_config.cache_threshold,
+                    max_entries=clarification_config.cache_max_entries,
+                    use_embeddings=clarification_config.cache_semantic,
+                )
+            self._clarification_detector = ClarificationDetector(
+                self.client, self.config, cache=self._clarification_cache
+            )
+        detector = self._clarification_detector
         
-        # Analyze each proposition
-        for prop in propositions:
-            try:
-                analysis = await detector.analyze(prop, session)
+        # Analyze all propositions, overlapping their LLM calls
+        try:
+            analyses = await detector.analyze_batch(propositions, session)
+        except Exception as e:
+            self.logger.error(f"Error running clarification detection: {e}")
+            return
+        
+        for prop, analysis in zip(propositions, analyses):
+            if analysis.needs_clarification:
+                self.logger.info(
+                    f"Proposition {prop.id} flagged for clarification "
+                    f"(score={analysis.clarification_score:.2f})"
+                )
                 
-                if analysis.needs_clarification:
-                    self.logger.info(
-                        f"Proposition {prop.id} flagged for clarification "
-                        f"(score={analysis.clarification_score:.2f})"
-                    )
-                    
-                    # In shadow mode, just log; otherwise could enqueue for Gates
-                    if not self.config.clarification.shadow_mode:
-                        # TODO: Implement Gates integration
-                        self.logger.info(f"Would route to Gates (not implemented yet)")
-                else:
-                    self.logger.debug(
-                        f"Proposition {prop.id} does not need clarification "
-                        f"(score={analysis.clarification_score:.2f})"
-                    )
-                    
-            except Exception as e:
-                self.logger.error(
-                    f"Error analyzing proposition {prop.id} for clarification: {e}"
+                # In shadow mode, just log; otherwise could enqueue for Gates
+                if not self.config.clarification.shadow_mode:
+                    # TODO: Implement Gates integration
+                    self.logger.info(f"Would route to Gates (not implemented yet)")
+            else:
+                self.logger.debug(
+                    f"Proposition {prop.id} does not need clarification "
+                    f"(score={analysis.clarification_score:.2f})"
                 )
-                # Continue with other propositions even if one fails
 
     async def _handle_audit(self, obs: Observation) -> bool:
         if not self.audit_enabled:
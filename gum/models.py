@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import pathlib
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from sqlalchemy import (
     Column,
     DateTime,
@@ -168,6 +175,20 @@ class Proposition(Base):
         return f"<Proposition(id={self.id}, text={preview})>"
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON columns (evidence logs, raw LLM output) with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _json_deserializer(value: str):
+    """Deserialize JSON columns with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 FTS_TOKENIZER = "porter ascii"
 
 def create_fts_table(conn) -> None:
@@ -318,6 +339,8 @@ async def init_db(
             "isolation_level": None,
         },
         poolclass=None,
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
     )
 
     async with engine.begin() as conn:
@@ -0,0 +1,91 @@
+"""
+Unit tests for analysis_cache module.
+
+Tests:
+- Exact-match fallback on normalized text
+- Semantic hits above the similarity threshold
+- Partitioning by model, prompt version and context key
+- Exact matching unless an embedder is given
+- LRU eviction
+"""
+
+import numpy as np
+
+from gum.clarification.analysis_cache import SemanticAnalysisCache
+
+
+def _bag_of_letters(text):
+    """Tiny deterministic embedder for tests."""
+    vector = np.zeros(26, dtype=np.float32)
+    for ch in text.lower():
+        if "a" <= ch <= "z":
+            vector[ord(ch) - ord("a")] += 1
+    return vector
+
+
+class TestExactMatchCache:
+    """Test the cache without an embedding model."""
+
+    def test_normalized_text_hits(self):
+        """Test that whitespace/case differences still hit."""
+        cache = SemanticAnalysisCache(use_embeddings=False)
+        cache.put("Arnav  always codes", "gpt-4", "v1.0", {"factors": []})
+
+        assert cache.get("arnav always codes ", "gpt-4", "v1.0") == {"factors": []}
+        assert cache.get("Arnav never codes", "gpt-4", "v1.0") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_partitioned_by_model_and_prompt_version(self):
+        """Test that a different model or prompt version never hits."""
+        cache = SemanticAnalysisCache(use_embeddings=False)
+        cache.put("text", "gpt-4", "v1.0", {"ok": True})
+
+        assert cache.get("text", "gpt-4o-mini", "v1.0") is None
+        assert cache.get("text", "gpt-4", "v2.0") is None
+        assert cache.get("text", "gpt-4", "v1.0") == {"ok": True}
+
+    def test_partitioned_by_context_key(self):
+        """Test that a response is only reused for the same observations."""
+        cache = SemanticAnalysisCache(use_embeddings=False)
+        cache.put("text", "gpt-4", "v1.0", {"ok": True}, context_key="1,2")
+
+        assert cache.get("text", "gpt-4", "v1.0", context_key="1,3") is None
+        assert cache.get("text", "gpt-4", "v1.0") is None
+        assert cache.get("text", "gpt-4", "v1.0", context_key="1,2") == {"ok": True}
+
+    def test_exact_matching_by_default(self):
+        """Test that semantic matching is opt-in."""
+        assert not SemanticAnalysisCache().semantic
+        assert SemanticAnalysisCache(embed=_bag_of_letters).semantic
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = SemanticAnalysisCache(max_entries=2, use_embeddings=False)
+        cache.put("a", "m", "v", {"id": "a"})
+        cache.put("b", "m", "v", {"id": "b"})
+        cache.get("a", "m", "v")  # refresh "a"
+        cache.put("c", "m", "v", {"id": "c"})
+
+        assert cache.get("b", "m", "v") is None
+        assert cache.get("a", "m", "v") == {"id": "a"}
+        assert cache.get("c", "m", "v") == {"id": "c"}
+
+
+class TestSemanticCache:
+    """Test the cache with an embedding function."""
+
+    def test_near_duplicate_hits(self):
+        """Test that a paraphrase above the threshold reuses the response."""
+        cache = SemanticAnalysisCache(embed=_bag_of_letters, threshold=0.95)
+        cache.put("Arnav works late at night", "m", "v", {"id": 1})
+
+        assert cache.get("Arnav works late at nights", "m", "v") == {"id": 1}
+        assert cache.get("Completely unrelated proposition", "m", "v") is None
+
+    def test_semantic_hit_requires_same_context(self):
+        """Test that a paraphrase with different observations misses."""
+        cache = SemanticAnalysisCache(embed=_bag_of_letters, threshold=0.95)
+        cache.put("Arnav works late at night", "m", "v", {"id": 1}, context_key="7")
+
+        assert cache.get("Arnav works late at nights", "m", "v", context_key="8") is None
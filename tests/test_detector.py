@@ -0,0 +1,421 @@
+"""
+Unit tests for the clarification detector.
+
+Tests:
+- Batch analysis overlaps LLM calls up to the concurrency limit
+- Failed analyses in a batch become error records
+- Batch API submit/ingest round-trip
+- User name and absolutist-word heuristics
+- Streamed responses and fail-fast on non-JSON output
+- Rule-based pre-filter skips the LLM for easy negatives
+- Evidence log size caps
+- Cheap-to-expensive model cascade
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gum.clarification.detector import (
+    DETECTOR_REQUEST_TIMEOUT,
+    ClarificationDetector,
+    create_openai_client,
+)
+
+
+FACTOR_NAMES = [
+    "identity_mismatch", "surveillance", "inferred_intent", "face_threat",
+    "over_positive", "opacity", "generalization", "privacy",
+    "actor_observer", "reputation_risk", "ambiguity", "tone_imbalance",
+]
+
+
+def make_llm_response(score=0.2):
+    """Build a well-formed LLM response with all 12 factors."""
+    return {
+        "factors": [
+            {
+                "id": i,
+                "name": name,
+                "score": score,
+                "triggered": False,
+                "evidence": [],
+                "reasoning": "",
+                "observation_ids_cited": [],
+            }
+            for i, name in enumerate(FACTOR_NAMES, 1)
+        ],
+        "aggregate": {
+            "clarification_score": score,
+            "needs_clarification": score >= 0.6,
+            "reasoning_summary": "test",
+        },
+    }
+
+
+def make_proposition(prop_id):
+    return SimpleNamespace(
+        id=prop_id,
+        text=f"Arnav does thing number {prop_id}",
+        reasoning="Observed in logs",
+        confidence=7,
+    )
+
+
+def make_detector(create, stream=False, cascade_models=None):
+    client = MagicMock()
+    client.chat.completions.create = create
+    config = SimpleNamespace(
+        clarification=SimpleNamespace(
+            model="gpt-4", temperature=0.1, threshold=0.6, stream_responses=stream,
+            cascade_models=cascade_models or [], cascade_ambiguity_band=(0.4, 0.7)
+        )
+    )
+    detector = ClarificationDetector(client, config)
+
+    async def build_context(proposition, session):
+        return {
+            "user_name": "Arnav",
+            "proposition_text": proposition.text,
+            "reasoning": proposition.reasoning,
+            "confidence": proposition.confidence,
+            "observations": "No observations available.",
+            "observation_ids": [],
+        }
+
+    detector._build_context = build_context
+    return detector
+
+
+def make_session():
+    session = MagicMock()
+    session.flush = AsyncMock()
+    return session
+
+
+class TestAnalyzeBatch:
+    """Test ClarificationDetector.analyze_batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency_limit(self):
+        """Test that LLM calls overlap but never exceed the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            message = SimpleNamespace(content=json.dumps(make_llm_response()))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        detector = make_detector(create)
+        session = make_session()
+        propositions = [make_proposition(i) for i in range(1, 7)]
+
+        analyses = await detector.analyze_batch(propositions, session, concurrency=3)
+
+        assert peak == 3
+        assert [a.proposition_id for a in analyses] == [1, 2, 3, 4, 5, 6]
+        assert all(a.validation_passed for a in analyses)
+        session.add_all.assert_called_once()
+        assert len(session.add_all.call_args.args[0]) == 6
+        session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_failures_become_error_records(self):
+        """Test that one failing LLM call does not sink the batch."""
+        async def create(**kwargs):
+            prompt = kwargs["messages"][-1]["content"]
+            if "number 2" in prompt:
+                raise RuntimeError("rate limited")
+            message = SimpleNamespace(content=json.dumps(make_llm_response()))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        detector = make_detector(create)
+        session = make_session()
+        propositions = [make_proposition(i) for i in range(1, 4)]
+
+        analyses = await detector.analyze_batch(propositions, session)
+
+        assert [a.validation_passed for a in analyses] == [True, False, True]
+        assert "rate limited" in analyses[1].reasoning_log
+        assert session.add_all.call_args.args[0] == [analyses[0], analyses[2]]
+
+
+class TestBatchAPI:
+    """Test the offline OpenAI Batch API path."""
+
+    @pytest.mark.asyncio
+    async def test_submit_then_ingest(self):
+        """Test that submitted requests round-trip into analyses."""
+        detector = make_detector(AsyncMock())
+        client = detector.client
+        uploaded = {}
+
+        async def files_create(file, purpose):
+            uploaded["lines"] = file[1].decode().splitlines()
+            return SimpleNamespace(id="file-in")
+
+        client.files.create = files_create
+        client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+        client.batches.retrieve = AsyncMock(
+            return_value=SimpleNamespace(status="completed", output_file_id="file-out")
+        )
+
+        session = make_session()
+        propositions = {i: make_proposition(i) for i in (1, 2)}
+        session.get = AsyncMock(side_effect=lambda model, pid: propositions.get(pid))
+
+        batch_id = await detector.submit_batch(list(propositions.values()), session)
+        assert batch_id == "batch-1"
+        requests = [json.loads(line) for line in uploaded["lines"]]
+        assert [r["custom_id"] for r in requests] == ["1", "2"]
+        assert requests[0]["body"]["model"] == "gpt-4"
+
+        output_lines = [
+            json.dumps({
+                "custom_id": "1",
+                "response": {"body": {"choices": [
+                    {"message": {"content": json.dumps(make_llm_response(0.8))}}
+                ]}},
+                "error": None,
+            }),
+            json.dumps({
+                "custom_id": "2",
+                "response": None,
+                "error": {"message": "model overloaded"},
+            }),
+        ]
+        client.files.content = AsyncMock(
+            return_value=SimpleNamespace(text="\n".join(output_lines))
+        )
+
+        analyses = await detector.ingest_batch(batch_id, session, poll_interval=0)
+
+        assert analyses[0].needs_clarification is True
+        assert analyses[1].validation_passed is False
+        assert session.add_all.call_args.args[0] == [analyses[0]]
+
+
+class TestTextHeuristics:
+    """Test the regex-based name extraction and Factor 7 check."""
+
+    def test_extract_user_name(self):
+        """Test first capitalized word (plus last name) within 5 words."""
+        detector = make_detector(AsyncMock())
+        assert detector._extract_user_name("Arnav Sharma is a coder") == "Arnav Sharma"
+        assert detector._extract_user_name("the user Arnav codes daily") == "Arnav"
+        assert detector._extract_user_name("a b c d e Arnav") == "the user"
+        assert detector._extract_user_name("") == "the user"
+
+    def test_factor_7_requires_whole_absolutist_word(self):
+        """Test that 'all' inside 'usually' no longer counts as absolutist."""
+        detector = make_detector(AsyncMock())
+        response = make_llm_response()
+        response["factors"][6]["triggered"] = True
+        response["factors"][6]["evidence"] = ["quote"]
+
+        context = {"proposition_text": "Arnav usually codes", "observation_ids": []}
+        assert detector._validate_response(response, context)["evidence_quality"] == "medium"
+
+        context["proposition_text"] = "Arnav codes Everything himself"
+        assert detector._validate_response(response, context)["evidence_quality"] == "high"
+
+
+class FakeStream:
+    """Minimal stand-in for openai's AsyncStream of completion chunks."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed or self.consumed >= len(self.pieces):
+            raise StopAsyncIteration
+        piece = self.pieces[self.consumed]
+        self.consumed += 1
+        delta = SimpleNamespace(content=piece)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    async def close(self):
+        self.closed = True
+
+
+class TestStreaming:
+    """Test streamed LLM responses."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_is_parsed(self):
+        """Test that chunks are reassembled into the full JSON response."""
+        body = json.dumps(make_llm_response(0.7))
+        pieces = [body[i:i + 50] for i in range(0, len(body), 50)]
+
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            return FakeStream(pieces)
+
+        detector = make_detector(create, stream=True)
+        context = await detector._build_context(make_proposition(1), None)
+
+        assert await detector._call_llm(context) == make_llm_response(0.7)
+
+    @pytest.mark.asyncio
+    async def test_detector_requests_set_their_own_timeout(self):
+        """Test that the short timeout applies per request, not to the shared client."""
+        create = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(make_llm_response(0.7))))]
+        ))
+        detector = make_detector(create)
+        context = await detector._build_context(make_proposition(1), None)
+
+        await detector._call_llm(context)
+
+        assert create.call_args.kwargs["timeout"] is DETECTOR_REQUEST_TIMEOUT
+        assert create_openai_client(api_key="test").timeout.read > DETECTOR_REQUEST_TIMEOUT.read
+
+    @pytest.mark.asyncio
+    async def test_non_json_stream_fails_fast(self):
+        """Test that prose output aborts after the first chunk."""
+        stream = FakeStream(["I'm sorry, ", "I can't help ", "with that."])
+
+        async def create(**kwargs):
+            return stream
+
+        detector = make_detector(create, stream=True)
+        context = await detector._build_context(make_proposition(1), None)
+
+        with pytest.raises(json.JSONDecodeError):
+            await detector._call_llm(context)
+        assert stream.closed
+        assert stream.consumed == 1
+
+
+class TestPrefilter:
+    """Test the rule-based pre-filter."""
+
+    @pytest.mark.asyncio
+    async def test_easy_negative_skips_llm(self):
+        """Test that a confident, cue-free proposition never calls the LLM."""
+        create = AsyncMock()
+        detector = make_detector(create)
+        proposition = SimpleNamespace(
+            id=1, text="Arnav uses VS Code for Python projects", reasoning="r", confidence=9
+        )
+        context = await detector._build_context(proposition, None)
+
+        analysis = await detector._analyze_context(proposition, context)
+
+        create.assert_not_called()
+        assert analysis.needs_clarification is False
+        assert analysis.model_used == "rule-prefilter"
+        assert analysis.factor_scores == [0.0] * 12
+
+    @pytest.mark.parametrize("text,confidence", [
+        ("Arnav always uses VS Code", 9),            # absolutist
+        ("Arnav is clearly a perfectionist", 9),     # trait + booster
+        ("Arnav opened VS Code at 11pm", 9),         # over-specific
+        ("Arnav is seeing a therapist", 9),          # sensitive domain
+        ("Arnav uses VS Code for Python projects", 7),  # low confidence
+    ])
+    def test_cues_or_low_confidence_go_to_llm(self, text, confidence):
+        """Test that any cue or lower confidence keeps the LLM call."""
+        detector = make_detector(AsyncMock())
+        context = {"proposition_text": text, "confidence": confidence}
+        assert detector._should_skip_llm(context) is False
+
+
+class TestCreateAnalysis:
+    """Test ClarificationDetector._create_analysis."""
+
+    def test_evidence_log_is_capped(self):
+        """Test that long evidence lists and strings are trimmed."""
+        detector = make_detector(AsyncMock())
+        response = make_llm_response()
+        response["factors"][0]["evidence"] = ["x" * 1000] * 9
+        response["factors"][0]["reasoning"] = "y" * 2000
+
+        analysis = detector._create_analysis(1, response, {"passed": True})
+
+        entry = analysis.evidence_log["identity_mismatch"]
+        assert len(entry["evidence"]) == 5
+        assert all(len(e) == 256 for e in entry["evidence"])
+        assert len(entry["reasoning"]) == 512
+        assert analysis.llm_raw_output is response
+
+    def test_non_int_factor_ids_are_skipped(self):
+        """Test that string or null factor ids don't lose the analysis."""
+        detector = make_detector(AsyncMock())
+        response = make_llm_response(0.9)
+        response["factors"][0]["id"] = "1"
+        response["factors"][1]["id"] = None
+
+        analysis = detector._create_analysis(1, response, {"passed": True})
+
+        assert analysis.factor_1_identity == 0.0
+        assert analysis.factor_2_surveillance == 0.0
+        assert analysis.factor_3_intent == 0.9
+
+    def test_null_evidence_and_reasoning(self):
+        """Test that null evidence/reasoning from the LLM are stored as empty."""
+        detector = make_detector(AsyncMock())
+        response = make_llm_response()
+        response["factors"][0].update(evidence=None, reasoning=None, observation_ids_cited=None)
+
+        analysis = detector._create_analysis(1, response, {"passed": True})
+
+        assert analysis.evidence_log["identity_mismatch"] == {
+            "evidence": [], "reasoning": "", "observation_ids": []
+        }
+
+
+class TestCascade:
+    """Test the cheap-model-first cascade."""
+
+    @staticmethod
+    def make_create(scores, calls):
+        async def create(**kwargs):
+            calls.append(kwargs["model"])
+            content = json.dumps(make_llm_response(scores[kwargs["model"]]))
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        return create
+
+    @pytest.mark.asyncio
+    async def test_confident_cheap_answer_is_accepted(self):
+        """Test that a score outside the band stops at the cheap model."""
+        calls = []
+        create = self.make_create({"gpt-4o-mini": 0.1, "gpt-4": 0.9}, calls)
+        detector = make_detector(create, cascade_models=["gpt-4o-mini"])
+        proposition = make_proposition(1)
+        context = await detector._build_context(proposition, None)
+
+        analysis = await detector._analyze_context(proposition, context)
+
+        assert calls == ["gpt-4o-mini"]
+        assert analysis.model_used == "gpt-4o-mini"
+        assert analysis.clarification_score == 0.1
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_cheap_answer_escalates(self):
+        """Test that a score inside the band escalates to the final model."""
+        calls = []
+        create = self.make_create({"gpt-4o-mini": 0.5, "gpt-4": 0.9}, calls)
+        detector = make_detector(create, cascade_models=["gpt-4o-mini"])
+        proposition = make_proposition(1)
+        context = await detector._build_context(proposition, None)
+
+        analysis = await detector._analyze_context(proposition, context)
+
+        assert calls == ["gpt-4o-mini", "gpt-4"]
+        assert analysis.model_used == "gpt-4"
+        assert analysis.needs_clarification is True
@@ -0,0 +1,83 @@
+"""
+Unit tests for question_cache module.
+
+Tests:
+- Cache key stability and sensitivity
+- Round-trip and persistence across connections
+- Batched commits
+- LRU eviction of the in-memory response cache
+"""
+
+from gum.clarification.question_cache import LRUResponseCache, QuestionResultCache
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+    
+    def test_key_ignores_observation_order(self):
+        """Test that observation ID order does not change the key."""
+        a = QuestionResultCache.key_for("gpt-4", 3, "Prop", [2, 1, "preview_1_0"])
+        b = QuestionResultCache.key_for("gpt-4", 3, "Prop", ["preview_1_0", 1, 2])
+        assert a == b
+        assert len(a) == 32
+    
+    def test_key_depends_on_every_input(self):
+        """Test that model, factor, text and observations all change the key."""
+        base = QuestionResultCache.key_for("gpt-4", 3, "Prop", [1])
+        assert base != QuestionResultCache.key_for("gpt-4o", 3, "Prop", [1])
+        assert base != QuestionResultCache.key_for("gpt-4", 6, "Prop", [1])
+        assert base != QuestionResultCache.key_for("gpt-4", 3, "Other", [1])
+        assert base != QuestionResultCache.key_for("gpt-4", 3, "Prop", [1, 2])
+
+
+class TestCacheStorage:
+    """Test storing and loading results."""
+    
+    def test_round_trip_persists(self, tmp_path):
+        """Test that results survive reopening the cache file."""
+        path = tmp_path / "cache" / "questions.sqlite"
+        result = {"question": "Could you clarify?", "reasoning": "It is vague.", "evidence": []}
+        
+        cache = QuestionResultCache(str(path))
+        assert cache.get("k") is None
+        cache.put("k", result)
+        cache.close()
+        
+        cache = QuestionResultCache(str(path))
+        assert cache.get("k") == result
+        assert (cache.hits, cache.misses) == (1, 0)
+        cache.close()
+
+
+class TestLRUResponseCache:
+    """Test the in-memory LLM response cache."""
+    
+    def test_least_recently_used_is_evicted(self):
+        """Test that reads refresh entries and the oldest one is dropped."""
+        cache = LRUResponseCache(max_entries=2)
+        cache["a"] = "1"
+        cache["b"] = "2"
+        assert cache.get("a") == "1"  # refresh "a"
+        cache["c"] = "3"
+        
+        assert "b" not in cache
+        assert dict(cache) == {"a": "1", "c": "3"}
+    
+    def test_commits_are_batched(self, tmp_path):
+        """Test that puts are committed every commit_every results and on close."""
+        path = tmp_path / "questions.sqlite"
+        result = {"question": "Could you clarify?", "reasoning": "It is vague.", "evidence": []}
+        
+        cache = QuestionResultCache(str(path), commit_every=2)
+        cache.put("a", result)
+        assert cache.get("a") == result
+        assert cache._conn.in_transaction
+        cache.put("b", result)
+        assert not cache._conn.in_transaction
+        cache.put("c", result)
+        cache.close()
+        
+        cache = QuestionResultCache(str(path))
+        assert [cache.get(k) for k in "abc"] == [result] * 3
+        cache.close()
+
@@ -21,7 +21,9 @@ from gum.clarification.question_config import (
     get_controlled_qg_factor_ids,
     FACTOR_METHOD_MAP,
     FACTOR_NAMES,
-    FACTOR_DESCRIPTIONS
+    FACTOR_DESCRIPTIONS,
+    FACTOR_NAME_TO_ID,
+    get_factor_info
 )
 
 
@@ -75,6 +77,17 @@ class TestFactorMappings:
         with pytest.raises(ValueError, match="Invalid factor_id"):
             get_factor_description(100)
     
+    def test_factor_getters_are_memoized(self):
+        """Test that repeat lookups hit the cache and bad IDs still raise."""
+        get_factor_name(2)
+        hits = get_factor_name.cache_info().hits
+        
+        assert get_factor_name(2) == "surveillance"
+        assert get_factor_name.cache_info().hits == hits + 1
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid factor_id"):
+                get_factor_name(99)
+    
     def test_get_factor_id_from_name_valid(self):
         """Test reverse lookup from name to ID."""
         assert get_factor_id_from_name("identity_mismatch") == 1
@@ -145,6 +158,23 @@ class TestDataIntegrity:
         names = list(FACTOR_NAMES.values())
         assert len(names) == len(set(names))
     
+    def test_factor_info_matches_maps(self):
+        """Test that get_factor_info agrees with the individual maps."""
+        for fid in range(1, 13):
+            method, name, description = get_factor_info(fid)
+            assert method == FACTOR_METHOD_MAP[fid]
+            assert name == FACTOR_NAMES[fid]
+            assert description == FACTOR_DESCRIPTIONS[fid]
+        
+        with pytest.raises(ValueError):
+            get_factor_info(13)
+    
+    def test_name_to_id_inverts_names(self):
+        """Test that the reverse lookup matches FACTOR_NAMES."""
+        assert len(FACTOR_NAME_TO_ID) == 12
+        for fid, name in FACTOR_NAMES.items():
+            assert FACTOR_NAME_TO_ID[name] == fid
+    
     def test_methods_valid(self):
         """Test that all methods are either few_shot or controlled_qg."""
         valid_methods = {"few_shot", "controlled_qg"}
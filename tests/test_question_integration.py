@@ -7,6 +7,7 @@ Tests:
 - Error handling across module boundaries
 """
 
+import asyncio
 import json
 import pytest
 import tempfile
@@ -14,8 +15,14 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from gum.clarification.question_engine import ClarifyingQuestionEngine
-from gum.clarification.question_generator import QuestionGenerator
+from gum.clarification.question_generator import (
+    BatchQuestionGenerator,
+    QuestionGenerator,
+    build_async_openai
+)
+from gum.clarification.question_cache import LRUResponseCache
 from gum.clarification.question_loader import load_flagged_propositions
+from gum.clarification.question_prompts import format_observation_summary
 
 
 class TestPipelineIntegration:
@@ -146,6 +153,355 @@ class TestPipelineIntegration:
                 Path(output_path).unlink()
 
 
+    @pytest.mark.asyncio
+    async def test_pipeline_respects_concurrency_limit(
+        self, mock_openai_client, mock_config
+    ):
+        """Test that pairs run concurrently but never above the limit."""
+        data = [
+            {
+                "prop_id": i,
+                "prop_text": f"Prop {i}",
+                "triggered_factors": ["opacity"],
+                "observations": []
+            }
+            for i in range(1, 7)
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json.dump(data, f)
+            input_file = f.name
+        
+        output_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jsonl')
+        output_path = output_file.name
+        output_file.close()
+        
+        in_flight = [0]
+        peak = [0]
+        
+        async def mock_create(*args, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = json.dumps({
+                "question": "Could you clarify what you meant by that?",
+                "reasoning": "This proposition is vague; clarifying grounds it."
+            })
+            return response
+        
+        mock_openai_client.chat.completions.create = mock_create
+        
+        try:
+            engine = ClarifyingQuestionEngine(
+                openai_client=mock_openai_client,
+                config=mock_config,
+                input_source="file",
+                input_file_path=input_file,
+                output_path=output_path,
+                concurrency=2
+            )
+            
+            summary = await engine.run()
+            
+            assert summary["total_processed"] == 6
+            assert summary["successful"] == 6
+            assert peak[0] == 2
+        
+        finally:
+            Path(input_file).unlink()
+            if Path(output_path).exists():
+                Path(output_path).unlink()
+
+    
+    def test_concurrency_defaults_to_clarification_config(self, mock_openai_client):
+        """Test that the engine reads its limit from config.clarification."""
+        from gum.config import ClarificationConfig
+        
+        config = MagicMock()
+        config.clarification = ClarificationConfig(concurrency=3)
+        engine = ClarifyingQuestionEngine(openai_client=mock_openai_client, config=config)
+        assert engine.concurrency == 3
+        
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client, config=config, concurrency=5
+        )
+        assert engine.concurrency == 5
+
+    
+    @pytest.mark.asyncio
+    async def test_writer_loop_drains_queue(self, mock_openai_client, mock_config, tmp_path):
+        """Test that the background writer writes every queued line in order."""
+        output_path = tmp_path / "out.jsonl"
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            output_path=str(output_path)
+        )
+        
+        writer = asyncio.create_task(engine._writer_loop())
+        for i in range(150):
+            await engine._write_queue.put(engine._serialize_result({"i": i}))
+        await engine._write_queue.put(None)
+        
+        assert await writer == 150
+        lines = output_path.read_text().splitlines()
+        assert [json.loads(line)["i"] for line in lines] == list(range(150))
+
+    
+    def test_get_observation_ids(self, mock_openai_client, mock_config):
+        """Test observation ID extraction from dicts, objects and empty lists."""
+        engine = ClarifyingQuestionEngine(openai_client=mock_openai_client, config=mock_config)
+        
+        assert engine._get_observation_ids([]) == set()
+        assert engine._get_observation_ids([{"id": 1}, {"id": 2}, {"text": "no id"}]) == {1, 2}
+        assert engine._get_observation_ids([MagicMock(id=3), MagicMock(id=None)]) == {3}
+
+    
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_serialize_result_is_compact_utf8(self, has_orjson, monkeypatch):
+        """Test that both serializers emit compact UTF-8 JSONL bytes."""
+        from gum.clarification import question_engine
+        
+        if has_orjson and not question_engine.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(question_engine, "HAS_ORJSON", has_orjson)
+        
+        line = ClarifyingQuestionEngine._serialize_result({"question": "Café?", "evidence": [1, 2]})
+        assert line == '{"question":"Café?","evidence":[1,2]}\n'.encode("utf-8")
+
+    
+    @pytest.mark.asyncio
+    async def test_failures_streamed_to_sidecar(
+        self, mock_openai_client, mock_config, sample_flagged_file, tmp_path
+    ):
+        """Test that generation failures land in the .failures.jsonl sidecar."""
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=RuntimeError("boom"))
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="file",
+            input_file_path=sample_flagged_file,
+            output_path=str(tmp_path / "questions.jsonl")
+        )
+        
+        summary = await engine.run()
+        
+        assert summary["failures_file"] == str(tmp_path / "questions.failures.jsonl")
+        with open(summary["failures_file"]) as f:
+            failures = [json.loads(line) for line in f]
+        assert len(failures) == summary["generation_errors"] == 2
+        assert {failure["prop_id"] for failure in failures} == {1, 2}
+        assert summary["failures"] == failures
+
+    
+    @pytest.mark.asyncio
+    async def test_results_stamped_when_handled(
+        self, mock_openai_client, mock_config, sample_flagged_file, tmp_path
+    ):
+        """Test that each group of finished results gets a fresh timestamp."""
+        from datetime import datetime, timedelta
+        
+        ticks = iter(range(100))
+        
+        class FakeDatetime:
+            @staticmethod
+            def now():
+                return datetime(2025, 1, 1) + timedelta(minutes=next(ticks))
+        
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="file",
+            input_file_path=sample_flagged_file,
+            output_path=str(tmp_path / "questions.jsonl"),
+            concurrency=1
+        )
+        
+        with patch("gum.clarification.question_engine.datetime", FakeDatetime):
+            await engine.run()
+        
+        with open(tmp_path / "questions.jsonl") as f:
+            timestamps = [json.loads(line)["timestamp"] for line in f]
+        assert len(timestamps) == 2
+        assert timestamps[0] < timestamps[1]
+        assert timestamps[0] > datetime(2025, 1, 1).isoformat()
+    
+    @pytest.mark.asyncio
+    async def test_unknown_factor_recorded_as_failure(self, mock_openai_client, mock_config, tmp_path):
+        """Test that a pair with an unknown factor fails alone and the run continues."""
+        async def fake_propositions(**kwargs):
+            yield {
+                "prop_id": 1,
+                "prop_text": "You value communication with friends.",
+                "triggered_factors": ["not_a_factor", "inferred_intent"],
+                "observations": []
+            }
+        
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="db",
+            output_path=str(tmp_path / "questions.jsonl")
+        )
+        
+        with patch("gum.clarification.question_engine.iter_flagged_propositions", fake_propositions):
+            summary = await engine.run()
+        
+        assert summary["successful"] == 1
+        assert summary["generation_errors"] == 1
+        assert summary["failures"][0]["factor"] == "not_a_factor"
+        assert "Invalid factor name" in summary["failures"][0]["error"]
+    
+    @pytest.mark.asyncio
+    async def test_prop_text_written_once_to_sidecar(
+        self, mock_openai_client, mock_config, sample_flagged_file, tmp_path
+    ):
+        """Test that results omit prop_text and the sidecar maps prop_id to it."""
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="file",
+            input_file_path=sample_flagged_file,
+            output_path=str(tmp_path / "questions.jsonl")
+        )
+        
+        summary = await engine.run()
+        
+        assert summary["propositions_file"] == str(tmp_path / "questions.propositions.jsonl")
+        results = [json.loads(line) for line in (tmp_path / "questions.jsonl").read_text().splitlines()]
+        assert results and all("prop_text" not in result for result in results)
+        with open(summary["propositions_file"]) as f:
+            texts = {record["prop_id"]: record["prop_text"] for record in map(json.loads, f)}
+        assert texts == {
+            1: "Arnav values communication with friends.",
+            2: "Arnav is focused on development."
+        }
+
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_batches_same_factor_pairs(self, mock_openai_client, mock_config, tmp_path):
+        """Test that batch_size packs same-factor pairs into one LLM call."""
+        input_file = tmp_path / "flagged.json"
+        input_file.write_text(json.dumps([
+            {"prop_id": i, "prop_text": f"Prop {i}", "triggered_factors": ["opacity"], "observations": []}
+            for i in range(1, 4)
+        ]))
+        
+        async def mock_create(*args, **kwargs):
+            system_prompt = kwargs["messages"][0]["content"]
+            count = system_prompt.count("Observations for proposition")
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            if count:
+                payload = {"questions": [
+                    {"index": i, "question": f"Could you clarify claim number {i}?", "reasoning": "It is vague."}
+                    for i in range(1, count + 1)
+                ]}
+            else:
+                payload = {"question": "Could you clarify that claim?", "reasoning": "It is vague."}
+            response.choices[0].message.content = json.dumps(payload)
+            return response
+        
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=mock_create)
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="file",
+            input_file_path=str(input_file),
+            output_path=str(tmp_path / "out.jsonl"),
+            batch_size=2
+        )
+        
+        summary = await engine.run()
+        
+        assert summary["successful"] == 3
+        # One call for the batch of two, one for the leftover pair
+        assert mock_openai_client.chat.completions.create.await_count == 2
+        lines = (tmp_path / "out.jsonl").read_text().splitlines()
+        assert sorted(json.loads(line)["prop_id"] for line in lines) == [1, 2, 3]
+
+    
+    @pytest.mark.asyncio
+    async def test_batched_chunk_errors_fail_only_its_pairs(self, mock_openai_client, mock_config, tmp_path):
+        """Test that an exception in a batched chunk is recorded per pair, not fatal."""
+        input_file = tmp_path / "flagged.json"
+        input_file.write_text(json.dumps([
+            {"prop_id": i, "prop_text": f"Prop {i}", "triggered_factors": ["opacity"], "observations": []}
+            for i in range(1, 4)
+        ]))
+        engine = ClarifyingQuestionEngine(
+            openai_client=mock_openai_client,
+            config=mock_config,
+            input_source="file",
+            input_file_path=str(input_file),
+            output_path=str(tmp_path / "out.jsonl"),
+            batch_size=2
+        )
+        engine.generator.generate_question_pairs_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        
+        summary = await engine.run()
+        
+        # The batch of two fails; the leftover single pair still succeeds
+        assert summary["generation_errors"] == 2
+        assert summary["successful"] == 1
+        assert {failure["prop_id"] for failure in summary["failures"]} == {1, 2}
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_skips_llm_on_rerun(
+        self, mock_openai_client, mock_config, sample_flagged_file, tmp_path
+    ):
+        """Test that a second run with the same cache makes no LLM calls."""
+        def make_engine():
+            return ClarifyingQuestionEngine(
+                openai_client=mock_openai_client,
+                config=mock_config,
+                input_source="file",
+                input_file_path=sample_flagged_file,
+                output_path=str(tmp_path / "out.jsonl"),
+                cache_path=str(tmp_path / "cache.sqlite")
+            )
+        
+        first = await make_engine().run()
+        calls = mock_openai_client.chat.completions.create.await_count
+        second = await make_engine().run()
+        
+        assert first["cache_hits"] == 0
+        assert second["cache_hits"] == 2
+        assert second["successful"] == first["successful"]
+        assert mock_openai_client.chat.completions.create.await_count == calls
+
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_skips_invalid_results(
+        self, mock_config, sample_flagged_file, tmp_path
+    ):
+        """Test that results failing validation are regenerated on the next run."""
+        client = AsyncMock()
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = json.dumps({"question": "Why?", "reasoning": "x"})
+        client.chat.completions.create = AsyncMock(return_value=response)
+        
+        def make_engine():
+            return ClarifyingQuestionEngine(
+                openai_client=client,
+                config=mock_config,
+                input_source="file",
+                input_file_path=sample_flagged_file,
+                output_path=str(tmp_path / "out.jsonl"),
+                cache_path=str(tmp_path / "cache.sqlite")
+            )
+        
+        await make_engine().run()
+        calls = client.chat.completions.create.await_count
+        second = await make_engine().run()
+        
+        assert second["cache_hits"] == 0
+        assert client.chat.completions.create.await_count > calls
+
 class TestGeneratorIntegration:
     """Integration tests for question generator."""
     
@@ -206,6 +562,390 @@ class TestGeneratorIntegration:
         assert "evidence" in result
         assert result["factor"] == "identity_mismatch"
     
+    @pytest.mark.asyncio
+    async def test_generate_batch_falls_back_for_missing_entries(self, mock_openai_client):
+        """Test that one call covers a batch and omitted entries are retried singly."""
+        batch_response = MagicMock()
+        batch_response.choices = [MagicMock()]
+        batch_response.choices[0].message.content = json.dumps({
+            "questions": [
+                {
+                    "index": 2,
+                    "question": "Could you clarify what 'development' means here?",
+                    "reasoning": "The term is broad; clarifying narrows it."
+                }
+            ]
+        })
+        single_response = mock_openai_client.chat.completions.create.return_value
+        mock_openai_client.chat.completions.create = AsyncMock(
+            side_effect=[batch_response, single_response]
+        )
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        
+        results = await generator.generate_question_pairs_batch([
+            {"prop_id": 1, "prop_text": "Arnav builds tools.", "factor_id": 11, "observations": []},
+            {"prop_id": 2, "prop_text": "Arnav does development.", "factor_id": 11, "observations": []}
+        ])
+        
+        assert mock_openai_client.chat.completions.create.await_count == 2
+        assert [r["prop_id"] for r in results] == [1, 2]
+        assert results[1]["question"] == "Could you clarify what 'development' means here?"
+        assert all(r["factor"] == "ambiguity" for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_generate_batch_fallbacks_run_one_at_a_time(self, mock_openai_client):
+        """Test that fallback calls after a failed batch call never overlap."""
+        single_response = mock_openai_client.chat.completions.create.return_value
+        in_flight = 0
+        peak = 0
+        
+        async def mock_create(*args, **kwargs):
+            nonlocal in_flight, peak
+            if "Observations for proposition" in kwargs["messages"][0]["content"]:
+                raise ValueError("bad batch")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return single_response
+        
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=mock_create)
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        
+        results = await generator.generate_question_pairs_batch([
+            {"prop_id": i, "prop_text": f"Arnav does thing {i}.", "factor_id": 11, "observations": []}
+            for i in range(1, 4)
+        ])
+        
+        assert [r["prop_id"] for r in results] == [1, 2, 3]
+        assert peak == 1
+    
+    @pytest.mark.asyncio
+    async def test_generate_batch_rejects_mixed_factors(self, mock_openai_client):
+        """Test that a batch must share one factor."""
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        
+        with pytest.raises(ValueError):
+            await generator.generate_question_pairs_batch([
+                {"prop_id": 1, "prop_text": "a", "factor_id": 3, "observations": []},
+                {"prop_id": 2, "prop_text": "b", "factor_id": 6, "observations": []}
+            ])
+    
+    def test_build_async_openai_sizes_pool(self):
+        """Test that the factory's pool follows max_connections."""
+        client = build_async_openai(api_key="test", max_connections=40)
+        pool = client._client._transport._pool
+        
+        assert pool._max_connections == 40
+        assert pool._max_keepalive_connections == 30
+    
+    def test_batch_generator_widens_small_pool(self):
+        """Test that a client pool below max_concurrent is replaced."""
+        small = build_async_openai(api_key="test", max_connections=4)
+        
+        batch = BatchQuestionGenerator(small, max_concurrent=8, max_connections=16)
+        
+        assert batch.generator.client is not small
+        assert batch.generator.client.api_key == "test"
+        assert batch.generator.client._client._transport._pool._max_connections == 16
+        
+        roomy = build_async_openai(api_key="test", max_connections=8)
+        assert BatchQuestionGenerator(roomy, max_concurrent=8).generator.client is roomy
+    
+    @pytest.mark.asyncio
+    async def test_default_clients_are_pooled_per_loop(self, monkeypatch):
+        """Test that generators without a client share one client and semaphore."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+        await BatchQuestionGenerator.aclose_all()
+        
+        first = BatchQuestionGenerator(model="gpt-4", max_concurrent=3)
+        second = BatchQuestionGenerator(model="gpt-4", max_concurrent=3)
+        other = BatchQuestionGenerator(model="gpt-4", max_concurrent=4)
+        
+        assert second.generator.client is first.generator.client
+        assert other.generator.client is first.generator.client
+        assert second.semaphore is first.semaphore
+        assert other.semaphore is not first.semaphore
+        assert QuestionGenerator(model="gpt-4").client is first.generator.client
+        assert QuestionGenerator(model="gpt-4o").client is not first.generator.client
+        
+        monkeypatch.setenv("OPENAI_API_KEY", "other")
+        assert BatchQuestionGenerator(model="gpt-4", max_concurrent=3).generator.client is not first.generator.client
+        
+        await BatchQuestionGenerator.aclose_all()
+        assert first.generator.client.is_closed()
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        assert BatchQuestionGenerator(model="gpt-4", max_concurrent=3).generator.client is not first.generator.client
+        await BatchQuestionGenerator.aclose_all()
+    
+    def test_pooled_clients_are_not_shared_across_loops(self, monkeypatch):
+        """Test that each event loop gets its own client and semaphore."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        
+        async def run_batch():
+            batch = BatchQuestionGenerator(model="gpt-4", max_concurrent=1)
+            
+            async def hold():
+                async with batch.semaphore:
+                    await asyncio.sleep(0)
+            
+            # Contending for the semaphore binds it to this loop
+            await asyncio.gather(hold(), hold())
+            await BatchQuestionGenerator.aclose_all()
+            return batch
+        
+        first = asyncio.run(run_batch())
+        second = asyncio.run(run_batch())
+        
+        assert second.generator.client is not first.generator.client
+        assert second.semaphore is not first.semaphore
+        assert BatchQuestionGenerator(model="gpt-4").generator.client is not first.generator.client
+    
+    @pytest.mark.asyncio
+    async def test_aiohttp_transport_posts_chat_completion(self):
+        """Test that use_aiohttp sends the request body straight to the API."""
+        content = json.dumps({"question": "Could you clarify?", "reasoning": "It is vague."})
+        sent = {}
+        
+        class FakeResponse:
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                return False
+            
+            def raise_for_status(self):
+                pass
+            
+            async def json(self):
+                return {"choices": [{"message": {"content": content}}]}
+        
+        class FakeSession:
+            closed = False
+            
+            def post(self, url, json, headers):
+                sent.update(url=url, body=json, headers=headers)
+                return FakeResponse()
+            
+            async def close(self):
+                FakeSession.closed = True
+        
+        client = MagicMock(api_key="sk-test", base_url="https://api.example.com/v1/")
+        generator = QuestionGenerator(client, model="gpt-4")
+        generator.use_aiohttp = True
+        generator._aiohttp_session = FakeSession()
+        
+        async with generator:
+            assert await generator._call_llm("system", "user") == content
+        
+        assert sent["url"] == "https://api.example.com/v1/chat/completions"
+        assert sent["headers"] == {"Authorization": "Bearer sk-test"}
+        assert sent["body"]["response_format"] == {"type": "json_object"}
+        assert sent["body"]["messages"][1] == {"role": "user", "content": "user"}
+        client.chat.completions.create.assert_not_called()
+        assert FakeSession.closed and generator._aiohttp_session is None
+    
+    @pytest.mark.asyncio
+    async def test_marshaled_batch_groups_by_factor(self, mock_openai_client):
+        """Test that rows are packed per factor and results keep input order."""
+        async def mock_create(*args, **kwargs):
+            count = kwargs["messages"][0]["content"].count("Observations for proposition")
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            if count:
+                payload = {"questions": [
+                    {"index": i, "question": f"Could you clarify claim number {i}?", "reasoning": "It is vague."}
+                    for i in range(1, count + 1)
+                ]}
+            else:
+                payload = {"question": "Could you clarify that claim?", "reasoning": "It is vague."}
+            response.choices[0].message.content = json.dumps(payload)
+            return response
+        
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=mock_create)
+        batch = BatchQuestionGenerator(mock_openai_client, model="gpt-4")
+        items = [
+            {"prop_id": prop_id, "prop_text": f"Prop {prop_id}", "factor_id": factor_id, "observations": []}
+            for prop_id, factor_id in [(1, 11), (2, 6), (3, 11), (4, 11)]
+        ]
+        
+        results = await batch.generate_batch_marshaled(items, rows_per_call=2)
+        
+        # Factor 11: one call for props 1+3, one for prop 4; factor 6: one call
+        assert mock_openai_client.chat.completions.create.await_count == 3
+        assert [result["prop_id"] for result in results] == [1, 2, 3, 4]
+        assert [result["factor"] for result in results] == ["ambiguity", "opacity", "ambiguity", "ambiguity"]
+    
+    def test_preprocess_observations_matches_separate_passes(self, mock_openai_client):
+        """Test that the one-pass helper equals summary + evidence built separately."""
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        observations = [
+            {"id": 1, "observation_text": "x" * 200},
+            {"id": 2, "content": "content only", "source": "preview"},
+            {"id": 3, "text": "placeholder", "source": "placeholder"},
+            {"id": 4, "text": "short"},
+        ] + [{"id": i, "observation_text": f"obs {i}"} for i in range(5, 9)]
+        
+        for obs in (observations, observations[:2], []):
+            assert generator._preprocess_observations(obs) == (
+                format_observation_summary(obs),
+                generator._extract_evidence(obs, 6)
+            )
+    
+    @pytest.mark.asyncio
+    async def test_streaming_batch_bounds_workers(self, mock_openai_client):
+        """Test that streaming generation caps in-flight items and keeps order."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_generate(prop_id, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if prop_id == 3:
+                raise RuntimeError("boom")
+            return {"prop_id": prop_id, "question": "Could you clarify?"}
+        
+        batch = BatchQuestionGenerator(mock_openai_client, max_concurrent=2)
+        batch.generator.generate_question_pair = fake_generate
+        items = [
+            {"prop_id": i, "prop_text": f"Prop {i}", "factor_id": 6, "observations": []}
+            for i in range(1, 6)
+        ]
+        progress = []
+        
+        results = await batch.generate_batch_streaming(
+            items, on_progress=lambda done, total: progress.append((done, total))
+        )
+        
+        assert peak == 2
+        assert [result["prop_id"] for result in results] == [1, 2, 3, 4, 5]
+        assert results[2]["error"] == "boom"
+        assert progress == [(i, 5) for i in range(1, 6)]
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_repeat_calls(self, mock_openai_client):
+        """Test that an identical request is answered from the cache."""
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4", cache=LRUResponseCache())
+        
+        first = await generator._call_llm("system", "user")
+        second = await generator._call_llm("system", "user")
+        await generator._call_llm("system", "other user")
+        fresh = await generator._call_llm("system", "user", use_cache=False)
+        
+        assert first == second == fresh
+        assert generator.cache_hits == 1
+        assert mock_openai_client.chat.completions.create.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_non_json(self, mock_openai_client):
+        """Test that unparseable responses are never cached."""
+        mock_openai_client.chat.completions.create.return_value.choices[0].message.content = "Sorry!"
+        cache = LRUResponseCache()
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4", cache=cache)
+        
+        await generator._call_llm("system", "user")
+        
+        assert len(cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_identical_inflight_requests_share_one_call(self, mock_openai_client):
+        """Test that concurrent identical requests are coalesced."""
+        response = mock_openai_client.chat.completions.create.return_value
+        
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.01)
+            return response
+        
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=slow_create)
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        
+        results = await asyncio.gather(
+            generator._call_llm("system", "user"),
+            generator._call_llm("system", "user"),
+            generator._call_llm("system", "other user")
+        )
+        
+        assert results[0] == results[1] == results[2]
+        assert mock_openai_client.chat.completions.create.await_count == 2
+        assert generator.coalesced_calls == 1
+        assert generator._inflight == {}
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parse_json_response_with_either_parser(self, use_orjson, mock_openai_client, monkeypatch):
+        """Test that both JSON parsers give the same fields and the same error."""
+        from gum.clarification import question_generator
+        
+        if use_orjson and not question_generator.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        loads = question_generator.orjson.loads if use_orjson else json.loads
+        monkeypatch.setattr(question_generator, "_json_loads", loads)
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        
+        parsed = generator._parse_json_response('{"question": " Café? ", "reasoning": "Why. ", "x": 1}')
+        assert parsed == {"question": "Café?", "reasoning": "Why."}
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            generator._parse_json_response("not json")
+    
+    @pytest.mark.asyncio
+    async def test_streamed_response_stops_at_closing_brace(self):
+        """Test that streaming returns once the JSON object is complete."""
+        pieces = ['{"question": "Could you', ' clarify {this}?", "reason', 'ing": "It is \\"vague\\"."}', ' trailing']
+        received = []
+        
+        class FakeStream:
+            closed = False
+            
+            def __aiter__(self):
+                return self._chunks()
+            
+            async def _chunks(self):
+                for piece in pieces:
+                    received.append(piece)
+                    yield MagicMock(choices=[MagicMock(delta=MagicMock(content=piece))])
+            
+            async def close(self):
+                FakeStream.closed = True
+        
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=FakeStream())
+        generator = QuestionGenerator(client, model="gpt-4", stream=True)
+        
+        response = await generator._call_llm("system", "user")
+        
+        assert response == "".join(pieces[:3])
+        assert generator._parse_json_response(response)["question"] == "Could you clarify {this}?"
+        assert received == pieces[:3]
+        assert FakeStream.closed
+        assert client.chat.completions.create.call_args.kwargs["stream"] is True
+    
+    @pytest.mark.asyncio
+    async def test_long_reasoning_is_validated_in_a_thread(self, mock_openai_client, monkeypatch):
+        """Test that only outputs with long reasoning are validated off the loop."""
+        from gum.clarification import question_generator
+        
+        offloaded = []
+        
+        async def fake_to_thread(func, *args):
+            offloaded.append(args[0]["prop_id"])
+            return func(*args)
+        
+        monkeypatch.setattr(question_generator.asyncio, "to_thread", fake_to_thread)
+        generator = QuestionGenerator(mock_openai_client, model="gpt-4")
+        output = {"question": "Could you clarify what you meant by that?", "factor": "opacity"}
+        
+        short = await generator._validate_output({
+            **output, "prop_id": 1, "reasoning": "The phrase is abstract; clarifying grounds the claim."
+        })
+        long = await generator._validate_output({**output, "prop_id": 2, "reasoning": "word " * 1000})
+        
+        assert offloaded == [2]
+        assert short[0] is True
+        assert long[0] is False
+    
     @pytest.mark.asyncio
     async def test_generator_with_validation_retry(self, mock_openai_client):
         """Test generator retries on validation failure."""
@@ -234,17 +974,26 @@ class TestGeneratorIntegration:
         
         generator = QuestionGenerator(mock_openai_client, model="gpt-4")
         
-        result = await generator.generate_question_pair(
-            prop_id=1,
-            prop_text="Test proposition",
-            factor_id=1,  # Controlled QG with retry
-            observations=[]
-        )
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+        
+        with patch("gum.clarification.question_generator.asyncio.sleep", fake_sleep):
+            result = await generator.generate_question_pair(
+                prop_id=1,
+                prop_text="Test proposition",
+                factor_id=1,  # Controlled QG with retry
+                observations=[]
+            )
         
         # Should succeed after retry
         assert "question" in result
         # Second (valid) response should be used
         assert len(result["question"]) > 10
+        # Validation retries are immediate
+        assert call_count[0] == 2
+        assert sleeps == []
 
 
 class TestErrorHandling:
@@ -268,6 +1017,42 @@ class TestErrorHandling:
                 observations=[]
             )
     
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_retried_after_retry_after(self):
+        """Test that a 429 is retried, waiting the server's Retry-After."""
+        from openai import RateLimitError
+        from gum.clarification.question_generator import _retry_delay, httpx
+        
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        rate_limited = RateLimitError(
+            "slow down",
+            response=httpx.Response(429, headers={"retry-after": "0"}, request=request),
+            body=None
+        )
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = '{"question": "Q?", "reasoning": "R."}'
+        client = AsyncMock()
+        client.chat.completions.create = AsyncMock(side_effect=[rate_limited, response])
+        
+        generator = QuestionGenerator(client, model="gpt-4")
+        
+        assert await generator._call_llm("system", "user") == '{"question": "Q?", "reasoning": "R."}'
+        assert client.chat.completions.create.await_count == 2
+        assert _retry_delay(rate_limited, 0) == 0.0
+        assert 0 <= _retry_delay(RuntimeError("no headers"), 3) <= 8
+    
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_fails_immediately(self):
+        """Test that errors like bad credentials are not retried."""
+        client = AsyncMock()
+        client.chat.completions.create = AsyncMock(side_effect=PermissionError("invalid api key"))
+        generator = QuestionGenerator(client, model="gpt-4")
+        
+        with pytest.raises(PermissionError):
+            await generator._call_llm("system", "user")
+        assert client.chat.completions.create.await_count == 1
+    
     @pytest.mark.asyncio
     async def test_generator_handles_invalid_json(self):
         """Test that generator handles invalid JSON responses."""
@@ -6,6 +6,7 @@ Tests:
 - Format normalization
 - Filtering by prop IDs and factors
 - Proposition-factor pair expansion
+- Streaming (async iterator) loading and pair expansion
 """
 
 import json
@@ -16,6 +17,8 @@ from gum.clarification.question_loader import (
     load_flagged_propositions,
     filter_propositions,
     get_proposition_factor_pairs,
+    iter_flagged_propositions,
+    iter_proposition_factor_pairs,
     _normalize_proposition_format,
     DEFAULT_FILE_PATH
 )
@@ -255,6 +258,17 @@ class TestFilterPropositions:
         assert len(filtered) == 1  # Only prop 2 has ambiguity and is in [1, 2]
         assert filtered[0]["prop_id"] == 2
     
+    def test_filter_accepts_frozensets(self, sample_propositions):
+        """Test filtering with frozensets (as passed by the CLI)."""
+        filtered = filter_propositions(
+            sample_propositions,
+            prop_ids=frozenset({1, 2}),
+            factor_names=frozenset({"ambiguity"})
+        )
+        
+        assert len(filtered) == 1
+        assert filtered[0]["prop_id"] == 2
+    
     def test_filter_no_filters(self, sample_propositions):
         """Test that no filters returns all propositions."""
         filtered = filter_propositions(sample_propositions)
@@ -327,6 +341,49 @@ class TestGetPropositionFactorPairs:
         assert len(pairs) == 0
 
 
+
+class TestStreamingPairs:
+    """Test the async iterator variants used by the engine."""
+    
+    @pytest.mark.asyncio
+    async def test_iter_pairs_matches_filter_then_expand(self):
+        """Test that streamed pairs equal filter_propositions + get_proposition_factor_pairs."""
+        propositions = [
+            {"prop_id": 1, "prop_text": "Prop 1", "triggered_factors": ["inferred_intent", "opacity"]},
+            {"prop_id": 2, "prop_text": "Prop 2", "triggered_factors": ["ambiguity"]},
+            {"prop_id": 3, "prop_text": "Prop 3", "triggered_factors": ["opacity"]}
+        ]
+        
+        async def stream():
+            for prop in propositions:
+                yield prop
+        
+        for prop_ids, factor_names in [(None, None), ([1, 2], None), (None, {"opacity"})]:
+            expected = get_proposition_factor_pairs(
+                filter_propositions(propositions, prop_ids=prop_ids, factor_names=factor_names)
+            )
+            streamed = [
+                pair async for pair in iter_proposition_factor_pairs(
+                    stream(), prop_ids=prop_ids, factor_names=factor_names
+                )
+            ]
+            assert streamed == expected
+    
+    @pytest.mark.asyncio
+    async def test_iter_flagged_propositions_matches_load(self, tmp_path):
+        """Test that streaming a file yields the same propositions as loading it."""
+        path = tmp_path / "flagged.json"
+        path.write_text(json.dumps([
+            {"prop_id": 1, "prop_text": "Prop 1", "triggered_factors": ["opacity"]},
+            {"prop_id": 2, "prop_text": "Prop 2", "triggered_factors": ["not_a_factor"]}
+        ]))
+        
+        loaded = await load_flagged_propositions(source="file", file_path=str(path))
+        streamed = [prop async for prop in iter_flagged_propositions(source="file", file_path=str(path))]
+        
+        assert streamed == loaded
+        assert [prop["prop_id"] for prop in streamed] == [1]
+
 class TestLoadFromFileInvariants:
     """Test invariants for file loading."""
     
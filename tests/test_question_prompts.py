@@ -15,8 +15,15 @@ from gum.clarification.question_prompts import (
     build_few_shot_prompt,
     build_controlled_qg_prompt,
     format_observation_summary,
-    FEW_SHOT_EXAMPLES
+    normalize_observations,
+    normalize_proposition_for_prompt,
+    set_user_names,
+    truncate_text,
+    DEFAULT_USER_NAMES,
+    FEW_SHOT_EXAMPLES,
+    FEW_SHOT_SYSTEM_PROMPT
 )
+from gum.clarification.question_config import get_factor_description
 
 
 class TestFewShotExamples:
@@ -81,6 +88,11 @@ class TestFormatFewShotExamples:
         example_count = formatted.count("Example ")
         assert example_count == len(examples)
     
+    def test_format_is_cached_per_factor(self):
+        """Test that each factor's examples are formatted only once."""
+        assert format_few_shot_examples(6) is format_few_shot_examples(6)
+        assert format_few_shot_examples(6) != format_few_shot_examples(8)
+    
     def test_format_includes_evidence_when_present(self):
         """Test that evidence is included when available."""
         formatted = format_few_shot_examples(3)  # Has evidence
@@ -129,6 +141,20 @@ class TestBuildFewShotPrompt:
         examples = get_few_shot_examples(factor_id)
         # Check that at least one example question appears
         assert any(ex["question"] in system_prompt for ex in examples)
+    
+    def test_cached_template_matches_direct_format(self):
+        """Test that the cached per-factor template renders the same prompt."""
+        prop_text = "You wrote {braces} in a note"
+        obs_summary = "  - obs_1: edited config {x: 1}"
+        
+        for _ in range(2):  # second call is served from the cache
+            system_prompt, _ = build_few_shot_prompt(prop_text, 11, obs_summary)
+            assert system_prompt == FEW_SHOT_SYSTEM_PROMPT.format(
+                examples=format_few_shot_examples(11),
+                factor_description=get_factor_description(11),
+                proposition_text=prop_text,
+                observation_summary=obs_summary
+            )
 
 
 class TestBuildControlledQGPrompt:
@@ -189,6 +215,31 @@ class TestBuildControlledQGPrompt:
             assert user_prompt is not None
 
 
+class TestNormalizeProposition:
+    """Test rewriting the user's name to "you"."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("Arnav Sharma codes daily", "you codes daily"),
+        ("Arnav's editor is VS Code", "your editor is VS Code"),
+        ("arnav is focused", "you are focused"),
+        ("Arnav has a dog and Arnav was tired", "you have a dog and you were tired"),
+        ("Arnav isn't here", "you isn't here"),
+        ("Arnavs stays", "Arnavs stays"),
+    ])
+    def test_default_names(self, text, expected):
+        """Test each name pattern."""
+        assert normalize_proposition_for_prompt(text) == expected
+    
+    def test_custom_names(self):
+        """Test that set_user_names swaps in another user's names."""
+        try:
+            set_user_names(["Dana Lee", "Dana"])
+            assert normalize_proposition_for_prompt("Dana Lee and Dana's cat") == "you and your cat"
+            assert normalize_proposition_for_prompt("Arnav is here") == "Arnav is here"
+        finally:
+            set_user_names(DEFAULT_USER_NAMES)
+
+
 class TestFormatObservationSummary:
     """Test observation summary formatting."""
     
@@ -202,8 +253,8 @@ class TestFormatObservationSummary:
         summary = format_observation_summary(observations)
         
         assert isinstance(summary, str)
-        assert "obs_451" in summary
-        assert "obs_452" in summary
+        assert "[451]" in summary
+        assert "[452]" in summary
         assert "chat windows" in summary
     
     def test_format_observation_summary_object_format(self):
@@ -220,8 +271,8 @@ class TestFormatObservationSummary:
         
         summary = format_observation_summary(observations)
         
-        assert "obs_451" in summary
-        assert "obs_452" in summary
+        assert "[451]" in summary
+        assert "[452]" in summary
     
     def test_format_observation_summary_empty(self):
         """Test formatting empty observation list."""
@@ -249,12 +300,61 @@ class TestFormatObservationSummary:
         summary = format_observation_summary(observations, max_obs=3)
         
         # Should only include first 3
-        assert "obs_0" in summary
-        assert "obs_1" in summary
-        assert "obs_2" in summary
+        assert "[0]" in summary
+        assert "[1]" in summary
+        assert "[2]" in summary
+        assert "[3]" not in summary
         
         # Should indicate more exist
         assert "more" in summary.lower() or "..." in summary
+    
+    def test_format_observation_summary_compact_format(self):
+        """Test the compact "[id]text | [id]text" summary format."""
+        observations = [
+            {"id": 451, "observation_text": "User opened chat"},
+            {"id": 452, "observation_text": "User messaged 3 contacts"},
+            {"id": 453, "observation_text": "User closed chat"}
+        ]
+        
+        summary = format_observation_summary(observations, max_obs=2)
+        
+        assert summary == "[451]User opened chat | [452]User messaged 3 contacts | (+1 more)"
+
+
+class TestNormalizeObservations:
+    """Test converting observations to parallel field lists."""
+    
+    def test_dicts_and_objects(self):
+        """Test that dicts and objects land in the same columns."""
+        class MockObservation:
+            id = 7
+            content = "from content"
+            source = "database"
+        
+        columns = normalize_observations([
+            {"id": 1, "observation_text": "typed", "source": "preview"},
+            {"id": 2, "content": "only content"},
+            MockObservation(),
+        ])
+        
+        assert columns.ids == [1, 2, 7]
+        assert columns.summary_texts == ["typed", "", ""]
+        assert columns.evidence_texts == ["typed", "only content", "from content"]
+        assert columns.sources == ["preview", "unknown", "database"]
+
+
+class TestTruncateText:
+    """Test observation text truncation."""
+    
+    def test_short_text_is_returned_as_is(self):
+        """Test that text within the limit is the same object, not a copy."""
+        text = "x" * 150
+        assert truncate_text(text, 150) is text
+    
+    def test_long_text_is_cut_and_marked(self):
+        """Test that longer text is cut to max_chars, suffix included."""
+        assert truncate_text("abcdefgh", 5) == "ab..."
+        assert len(truncate_text("x" * 500, 100)) == 100
 
 
 class TestPromptInvariants:
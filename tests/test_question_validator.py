@@ -255,6 +255,33 @@ class TestFullOutputValidation:
         assert any("Question:" in e for e in errors)
         assert any("Reasoning:" in e for e in errors)
 
+    
+    @pytest.mark.parametrize("question,reasoning,evidence", [
+        ("Could you clarify what you meant by that?", "This proposition infers motive; clarifying confirms intent.", ["obs_451: x"]),
+        ("Could you clarify what you meant by that?", "Too brief", []),
+        ("Since you always code, could you clarify why?", "This proposition infers motive; clarifying confirms intent.", []),
+        ("What do you mean?", "This proposition infers motive; clarifying confirms intent.", []),
+        ("What changed on that day", "This proposition infers motive; clarifying confirms intent.", []),
+        ("Could you clarify what you meant by that?", " ".join(["word"] * 35), []),
+        ("Could you clarify what you meant by that?", "This proposition infers motive; clarifying confirms intent.", ["bad evidence"]),
+    ])
+    def test_quick_check_never_accepts_what_full_rules_reject(self, question, reasoning, evidence):
+        """Test that quick_check only passes outputs with no errors from any rule."""
+        output = {
+            "prop_id": 77,
+            "factor": "inferred_intent",
+            "question": question,
+            "reasoning": reasoning,
+            "evidence": evidence
+        }
+        
+        rule_errors = (
+            self.validator.validate_question(question)[1]
+            + self.validator.validate_reasoning(reasoning)[1]
+            + self.validator.validate_evidence(evidence)[1]
+        )
+        assert self.validator.quick_check(output) == (not rule_errors)
+
 
 class TestReasoningTruncation:
     """Test reasoning truncation helper."""